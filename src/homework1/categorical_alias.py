@@ -0,0 +1,106 @@
+"""
+Alias-Method Sampling for Categorical Random Variables
+
+Walker's alias method (in Vose's numerically stable form) turns a categorical
+PMF over K outcomes into two length-K tables, built once in O(K). A draw then
+needs one uniform integer and one uniform float:
+
+    i ~ Uniform{0, ..., K-1},  u ~ Uniform(0, 1)
+    X = i if u < prob[i] else alias[i]
+
+so every sample costs O(1) regardless of the support size, and whole batches
+are drawn with a handful of vectorized numpy operations. The table holds only
+numpy arrays, so it pickles cheaply for use in worker processes.
+"""
+
+import numpy as np
+
+
+class AliasTable:
+    """Walker/Vose alias table for O(1) categorical sampling."""
+
+    def __init__(self, probabilities, values=None):
+        """
+        Build the alias table from a probability mass function.
+
+        Args:
+            probabilities (array_like): Non-negative weights of the K outcomes;
+                they are normalized to sum to one
+            values (array_like, optional): Outcome values; defaults to 0..K-1
+        """
+        probabilities = np.asarray(probabilities, dtype=float)
+        if probabilities.ndim != 1 or len(probabilities) == 0:
+            raise ValueError("probabilities must be a non-empty 1-D array")
+        if np.any(probabilities < 0) or probabilities.sum() <= 0:
+            raise ValueError("probabilities must be non-negative with a positive sum")
+
+        n = len(probabilities)
+        self.values = None if values is None else np.asarray(values)
+        if self.values is not None and len(self.values) != n:
+            raise ValueError("values must have the same length as probabilities")
+
+        scaled = probabilities * (n / probabilities.sum())
+        prob = [1.0] * n
+        alias = list(range(n))
+
+        small = np.flatnonzero(scaled < 1.0).tolist()
+        large = np.flatnonzero(scaled >= 1.0).tolist()
+        scaled = scaled.tolist()
+
+        # Each small column is topped up by one large column, which donates
+        # its excess and moves to the small list once it drops below one
+        while small and large:
+            s = small.pop()
+            big = large[-1]
+            prob[s] = scaled[s]
+            alias[s] = big
+            scaled[big] = (scaled[big] + scaled[s]) - 1.0
+            if scaled[big] < 1.0:
+                small.append(large.pop())
+
+        # Leftovers are exactly one up to rounding error
+        self.prob = np.array(prob)
+        self.alias = np.array(alias, dtype=np.intp)
+
+    @property
+    def n_categories(self):
+        """int: Number of outcomes K."""
+        return len(self.prob)
+
+    def sample(self, size, rng=None, chunk_size=10_000_000):
+        """
+        Draw samples from the categorical distribution.
+
+        Args:
+            size (int or tuple): Output shape
+            rng (numpy.random.Generator or int, optional): Generator or seed
+            chunk_size (int): Maximum draws per vectorized step, bounding the
+                temporary memory for very large batches
+
+        Returns:
+            numpy.ndarray: Samples (outcome values, or indices 0..K-1)
+        """
+        rng = np.random.default_rng(rng)
+        out = np.empty(size, dtype=self.alias.dtype)
+        flat = out.reshape(-1)
+
+        for start in range(0, flat.size, chunk_size):
+            stop = min(start + chunk_size, flat.size)
+            idx = rng.integers(0, self.n_categories, size=stop - start)
+            accept = rng.random(stop - start) < self.prob[idx]
+            flat[start:stop] = np.where(accept, idx, self.alias[idx])
+
+        if self.values is not None:
+            return self.values[out]
+        return out
+
+    def probabilities(self):
+        """
+        Recover the PMF encoded by the table.
+
+        Returns:
+            numpy.ndarray: Probability of each of the K outcomes
+        """
+        pmf = self.prob + np.bincount(self.alias, weights=1.0 - self.prob,
+                                      minlength=self.n_categories)
+        return pmf / self.n_categories
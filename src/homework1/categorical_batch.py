@@ -0,0 +1,183 @@
+"""
+Batched Categorical Random Variables
+
+Modelling one categorical variable per sensor or cohort with separate
+CategoricalRandomVariable (and hence rv_discrete) objects spends most of its
+time in Python overhead. This module stores N probability mass functions over
+a shared support of K values as one (N, K) matrix, so every statistic is a
+single vectorized operation over all rows:
+
+- expectations and variances are matrix-vector products,
+- entropies and KL divergences reduce along the category axis, with the
+  pairwise KL matrix obtained from one matrix product,
+- sampling uses inverse-CDF lookups on the row cumulative sums, or the
+  Gumbel-max trick.
+"""
+
+import numpy as np
+from scipy import special
+
+from problem2_discrete_random_variables import CategoricalRandomVariable
+
+
+class CategoricalBatch:
+    """N categorical distributions over a shared support of K values."""
+
+    def __init__(self, probabilities, values=None):
+        """
+        Initialize with a matrix of probability mass functions.
+
+        Args:
+            probabilities (array_like): (N, K) matrix whose rows sum to one
+            values (array_like, optional): Support values shared by every
+                row; defaults to 0..K-1
+        """
+        self.probabilities = np.atleast_2d(np.asarray(probabilities, dtype=float))
+        if np.any(self.probabilities < 0):
+            raise ValueError("probabilities must be non-negative")
+        if not np.allclose(self.probabilities.sum(axis=1), 1.0):
+            raise ValueError("every row of probabilities must sum to 1")
+
+        n_categories = self.probabilities.shape[1]
+        self.values = (np.arange(n_categories) if values is None
+                       else np.asarray(values))
+        if self.values.shape != (n_categories,):
+            raise ValueError("values must have one entry per column")
+
+        self._cdf = None
+
+    @property
+    def shape(self):
+        """tuple: (N distributions, K categories)."""
+        return self.probabilities.shape
+
+    def __len__(self):
+        """Return the number of distributions N."""
+        return self.probabilities.shape[0]
+
+    def __getitem__(self, i):
+        """
+        Get one row as a standalone CategoricalRandomVariable.
+
+        Args:
+            i (int): Row index
+
+        Returns:
+            CategoricalRandomVariable: Distribution of row i over the shared
+                support values
+        """
+        return CategoricalRandomVariable(self.probabilities[i], self.values)
+
+    @property
+    def cdf(self):
+        """numpy.ndarray: (N, K) row-wise cumulative sums, cached."""
+        if self._cdf is None:
+            self._cdf = np.cumsum(self.probabilities, axis=1)
+        return self._cdf
+
+    def calculate_expectation(self):
+        """
+        Calculate E[X] for every distribution.
+
+        Returns:
+            numpy.ndarray: (N,) expectations
+        """
+        return self.probabilities @ self.values
+
+    def calculate_variance(self):
+        """
+        Calculate V[X] for every distribution.
+
+        Returns:
+            numpy.ndarray: (N,) variances
+        """
+        mean = self.calculate_expectation()
+        deviation = self.values[None, :] - mean[:, None]
+        return np.einsum('nk,nk->n', self.probabilities, deviation * deviation)
+
+    def calculate_entropy(self):
+        """
+        Calculate the Shannon entropy (in nats) of every distribution.
+
+        Returns:
+            numpy.ndarray: (N,) entropies
+        """
+        return special.entr(self.probabilities).sum(axis=1)
+
+    def kl_divergence(self, other=None, pairwise=True):
+        """
+        Calculate KL divergences KL(P_i || Q_j) between rows.
+
+        Args:
+            other (CategoricalBatch or array_like, optional): Second family Q
+                over the same support; defaults to this batch
+            pairwise (bool): If True return the (N, M) matrix over every pair
+                of rows, otherwise compare row i with row i
+
+        Returns:
+            numpy.ndarray: (N, M) or (N,) divergences; inf where Q puts zero
+                mass on a category that P can produce
+        """
+        p = self.probabilities
+        q = self.probabilities if other is None else np.atleast_2d(
+            getattr(other, 'probabilities', other))
+        if q.shape[1] != p.shape[1]:
+            raise ValueError("both families must have the same number of categories")
+
+        with np.errstate(divide='ignore'):
+            log_q = np.log(q)
+        zero_q = np.isinf(log_q)
+        log_q[zero_q] = 0.0
+
+        # KL = sum p log p - sum p log q, where the cross term is a matmul
+        negative_entropy = -self.calculate_entropy()
+        if pairwise:
+            cross = p @ log_q.T
+            impossible = (p > 0).astype(float) @ zero_q.T.astype(float) > 0
+            divergence = negative_entropy[:, None] - cross
+        else:
+            if q.shape[0] != p.shape[0]:
+                raise ValueError("row-wise comparison needs the same number of rows")
+            cross = np.einsum('nk,nk->n', p, log_q)
+            impossible = np.any((p > 0) & zero_q, axis=1)
+            divergence = negative_entropy - cross
+
+        divergence[impossible] = np.inf
+        return np.maximum(divergence, 0.0)
+
+    def sample(self, size, rng=None, method='inverse_cdf'):
+        """
+        Draw samples from every distribution at once.
+
+        Args:
+            size (int): Number of samples per distribution
+            rng (numpy.random.Generator or int, optional): Generator or seed
+            method (str): 'inverse_cdf' searches the row cumulative sums;
+                'gumbel' takes argmax(log p + Gumbel noise), which needs
+                (N, size, K) temporary memory
+
+        Returns:
+            numpy.ndarray: (N, size) samples of the support values
+        """
+        rng = np.random.default_rng(rng)
+        n_rows, n_categories = self.shape
+
+        if method == 'inverse_cdf':
+            # Offsetting row i by i turns the row-wise CDFs into one sorted
+            # array, so a single searchsorted serves every row
+            offsets = np.arange(n_rows)[:, None]
+            cdf = self.cdf / self.cdf[:, -1:]
+            flat_cdf = (cdf + offsets).ravel()
+            u = rng.random((n_rows, size)) + offsets
+            flat_idx = np.searchsorted(flat_cdf, u.ravel(), side='right')
+            idx = flat_idx.reshape(n_rows, size) - offsets * n_categories
+            idx = np.minimum(idx, n_categories - 1)
+        elif method == 'gumbel':
+            with np.errstate(divide='ignore'):
+                log_p = np.log(self.probabilities)
+            noise = rng.gumbel(size=(n_rows, size, n_categories))
+            idx = np.argmax(log_p[:, None, :] + noise, axis=2)
+        else:
+            raise ValueError(f"Unknown sampling method: {method}")
+
+        return self.values[idx]
@@ -0,0 +1,253 @@
+"""
+Dirichlet-Categorical Conjugate Updates for Streamed Category Counts
+
+When the probabilities of a categorical variable are unknown, a Dirichlet
+prior over them is conjugate to categorical observations:
+
+    p ~ Dirichlet(alpha),  counts | p ~ Multinomial(n, p)
+    p | counts ~ Dirichlet(alpha + counts)
+
+so a stream of observations is summarized by one count per category. This
+module keeps S independent streams over a shared support of K values as an
+(S, K) count matrix. A chunk of (stream, category) observations from every
+stream is added with a single bincount over flattened indices, and posterior
+summaries are computed for all streams at once:
+
+- posterior-mean PMFs, which are also the posterior predictive of the next
+  observation,
+- credible intervals of every probability, exactly from the Beta marginals or
+  from vectorized Dirichlet draws (normalized Gamma variates),
+- the Dirichlet-multinomial predictive of a batch of future counts.
+"""
+
+import numpy as np
+from scipy import special, stats
+
+from categorical_batch import CategoricalBatch
+from problem2_discrete_random_variables import CategoricalRandomVariable
+
+
+class DirichletCategorical:
+    """Dirichlet posteriors over the PMFs of many categorical streams."""
+
+    def __init__(self, prior, values=None, n_streams=None):
+        """
+        Initialize with prior concentrations.
+
+        Args:
+            prior (array_like): (K,) concentrations shared by every stream,
+                or an (S, K) matrix with one row per stream
+            values (array_like, optional): Sorted support values shared by
+                every stream; defaults to 0..K-1
+            n_streams (int, optional): Number of streams when prior is 1-D;
+                defaults to one
+        """
+        prior = np.atleast_2d(np.asarray(prior, dtype=float))
+        if np.any(prior <= 0):
+            raise ValueError("prior concentrations must be positive")
+        if n_streams is not None:
+            if prior.shape[0] != 1:
+                raise ValueError("n_streams requires a 1-D prior")
+            prior = np.repeat(prior, n_streams, axis=0)
+
+        self.prior = prior
+        self.counts = np.zeros(prior.shape, dtype=np.int64)
+        n_categories = prior.shape[1]
+        self.values = (np.arange(n_categories) if values is None
+                       else np.asarray(values))
+        if self.values.shape != (n_categories,):
+            raise ValueError("values must have one entry per category")
+
+    @classmethod
+    def from_variable(cls, rv, concentration=1.0, n_streams=None):
+        """
+        Create a prior centred on a known categorical variable.
+
+        Args:
+            rv (CategoricalRandomVariable): Prior mean PMF and support
+            concentration (float): Total prior pseudo-count
+            n_streams (int, optional): Number of streams sharing the prior
+
+        Returns:
+            DirichletCategorical: Updater with prior concentration * PMF
+        """
+        return cls(concentration * rv.probabilities, rv.values, n_streams)
+
+    @property
+    def n_streams(self):
+        """int: Number of independent streams S."""
+        return self.prior.shape[0]
+
+    @property
+    def n_categories(self):
+        """int: Number of categories K."""
+        return self.prior.shape[1]
+
+    @property
+    def alpha(self):
+        """numpy.ndarray: (S, K) posterior concentrations."""
+        return self.prior + self.counts
+
+    def update_counts(self, counts, stream=None):
+        """
+        Add count vectors to the posterior.
+
+        Args:
+            counts (array_like): (K,) counts for a single stream, or (S, K)
+                counts for every stream
+            stream (int, optional): Stream receiving (K,) counts; may be
+                omitted only when there is one stream
+        """
+        counts = np.asarray(counts)
+        if counts.ndim == 1:
+            if stream is None:
+                if self.n_streams != 1:
+                    raise ValueError("(K,) counts need a stream index when there are "
+                                     "several streams")
+                stream = 0
+            shape = (self.n_categories,)
+        else:
+            if stream is not None:
+                raise ValueError("stream only applies to (K,) counts")
+            shape = self.counts.shape
+        if counts.shape != shape:
+            raise ValueError(f"counts must have shape {shape}")
+        if np.any(counts < 0):
+            raise ValueError("counts must be non-negative")
+
+        if stream is None:
+            self.counts += counts.astype(np.int64)
+        else:
+            self.counts[stream] += counts.astype(np.int64)
+
+    def update(self, samples, streams=None):
+        """
+        Add a chunk of observed values from any mix of streams.
+
+        Args:
+            samples (array_like): Observed support values
+            streams (array_like, optional): Stream index of every sample;
+                defaults to stream 0
+        """
+        samples = np.asarray(samples).ravel()
+        idx = np.minimum(np.searchsorted(self.values, samples), self.n_categories - 1)
+        if np.any(self.values[idx] != samples):
+            raise ValueError("samples contain values outside the support")
+
+        streams = (np.zeros(len(samples), dtype=np.intp) if streams is None
+                   else np.asarray(streams).ravel())
+        if len(streams) != len(samples):
+            raise ValueError("streams must have one entry per sample")
+
+        # One bincount over flattened (stream, category) cells
+        flat = streams * self.n_categories + idx
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+
+    def posterior_mean(self):
+        """
+        Calculate the posterior-mean PMF of every stream.
+
+        Returns:
+            numpy.ndarray: (S, K) posterior means alpha / sum(alpha)
+        """
+        alpha = self.alpha
+        return alpha / alpha.sum(axis=1, keepdims=True)
+
+    def posterior_predictive(self):
+        """
+        Get the predictive distribution of the next observation.
+
+        Returns:
+            CategoricalBatch: One PMF per stream, equal to the posterior mean
+        """
+        return CategoricalBatch(self.posterior_mean(), self.values)
+
+    def predictive_variable(self, stream=0):
+        """
+        Get the predictive distribution of one stream.
+
+        Args:
+            stream (int): Stream index
+
+        Returns:
+            CategoricalRandomVariable: Posterior predictive of that stream
+        """
+        return CategoricalRandomVariable(self.posterior_mean()[stream], self.values)
+
+    def predictive_log_pmf(self, counts):
+        """
+        Calculate the Dirichlet-multinomial log-probability of future counts.
+
+        Args:
+            counts (array_like): (K,) or (S, K) future category counts
+
+        Returns:
+            numpy.ndarray: (S,) log-probability of the counts in every stream
+        """
+        counts = np.asarray(counts, dtype=float)
+        alpha = self.alpha
+        total = counts.sum(axis=-1)
+        alpha_total = alpha.sum(axis=1)
+        return (special.gammaln(total + 1) - special.gammaln(counts + 1).sum(axis=-1)
+                + special.gammaln(alpha_total) - special.gammaln(alpha_total + total)
+                + (special.gammaln(alpha + counts) - special.gammaln(alpha)).sum(axis=-1))
+
+    def sample(self, n_draws, rng=None):
+        """
+        Draw probability vectors from every posterior.
+
+        Args:
+            n_draws (int): Number of draws per stream
+            rng (numpy.random.Generator or int, optional): Generator or seed
+
+        Returns:
+            numpy.ndarray: (n_draws, S, K) draws, each row summing to one
+        """
+        rng = np.random.default_rng(rng)
+        gamma = rng.standard_gamma(self.alpha, size=(n_draws,) + self.alpha.shape)
+        return gamma / gamma.sum(axis=2, keepdims=True)
+
+    def credible_intervals(self, credible_level=0.95, n_draws=None, rng=None):
+        """
+        Calculate equal-tailed credible intervals of every probability.
+
+        Args:
+            credible_level (float): Probability mass of the intervals
+            n_draws (int, optional): If given, use quantiles of this many
+                Dirichlet draws; otherwise use the exact Beta marginals
+                Beta(alpha_k, sum(alpha) - alpha_k)
+            rng (numpy.random.Generator or int, optional): Generator or seed
+
+        Returns:
+            tuple: (lower, upper) arrays of shape (S, K)
+        """
+        tail = (1 - credible_level) / 2
+        if n_draws is None:
+            alpha = self.alpha
+            rest = alpha.sum(axis=1, keepdims=True) - alpha
+            return (stats.beta.ppf(tail, alpha, rest),
+                    stats.beta.ppf(1 - tail, alpha, rest))
+
+        lower, upper = np.quantile(self.sample(n_draws, rng), [tail, 1 - tail], axis=0)
+        return lower, upper
+
+    def expectation_interval(self, credible_level=0.95, n_draws=4000, rng=None):
+        """
+        Calculate the posterior mean and credible interval of E[X].
+
+        Args:
+            credible_level (float): Probability mass of the intervals
+            n_draws (int): Number of Dirichlet draws per stream
+            rng (numpy.random.Generator or int, optional): Generator or seed
+
+        Returns:
+            dict: (S,) posterior mean of E[X] and (S,) interval bounds
+        """
+        tail = (1 - credible_level) / 2
+        expectations = self.sample(n_draws, rng) @ self.values
+        lower, upper = np.quantile(expectations, [tail, 1 - tail], axis=0)
+        return {
+            'mean': self.posterior_mean() @ self.values,
+            'lower': lower,
+            'upper': upper
+        }
@@ -0,0 +1,238 @@
+"""
+Markov Chains over Categorical States
+
+A Markov chain moves between K categorical states with transition matrix P,
+where row P[i] is the categorical PMF of the next state given state i. The
+matrix is stored in scipy.sparse CSR form, so chains with millions of states
+and a few transitions per state fit in memory and every step is a sparse
+matrix-vector product:
+
+- the stationary distribution pi = pi P is found by power iteration on the
+  lazy chain (P + I) / 2, which has the same stationary distribution but also
+  converges for periodic chains, or with the ARPACK eigensolver,
+- n-step distributions use P^n built by repeated squaring, or n sparse
+  vector products when squaring would fill in the matrix,
+- many trajectories are simulated at once: every row's probabilities are laid
+  end to end in one cumulative sum, so the next state of all chains is found
+  with a single searchsorted per step.
+"""
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg
+
+from categorical_alias import AliasTable
+from problem2_discrete_random_variables import CategoricalRandomVariable
+
+
+# n-step distributions use matrix squaring up to this many states
+SQUARING_MAX_STATES = 2048
+
+
+class MarkovChain:
+    """Discrete-time Markov chain with a sparse transition matrix."""
+
+    def __init__(self, transition, values=None):
+        """
+        Initialize with a row-stochastic transition matrix.
+
+        Args:
+            transition (array_like or scipy.sparse matrix): (K, K) matrix with
+                P[i, j] = P(next state j | current state i)
+            values (array_like, optional): Label of every state; defaults to
+                0..K-1
+        """
+        transition = sparse.csr_matrix(transition, dtype=float)
+        transition.sum_duplicates()
+        transition.eliminate_zeros()
+        n_states = transition.shape[0]
+        if transition.shape != (n_states, n_states):
+            raise ValueError("transition matrix must be square")
+        if np.any(transition.data < 0):
+            raise ValueError("transition probabilities must be non-negative")
+        if not np.allclose(np.asarray(transition.sum(axis=1)).ravel(), 1.0):
+            raise ValueError("every row of the transition matrix must sum to 1")
+
+        self.transition = transition
+        self.values = np.arange(n_states) if values is None else np.asarray(values)
+        if self.values.shape != (n_states,):
+            raise ValueError("values must have one entry per state")
+
+        self._transpose = None
+        self._row_cdf = None
+
+    @property
+    def n_states(self):
+        """int: Number of states K."""
+        return self.transition.shape[0]
+
+    @property
+    def transpose(self):
+        """scipy.sparse.csr_matrix: Cached P^T, so pi P is a CSR product."""
+        if self._transpose is None:
+            self._transpose = self.transition.T.tocsr()
+        return self._transpose
+
+    def step(self, distribution):
+        """
+        Advance one or more state distributions by one step.
+
+        Args:
+            distribution (array_like): (K,) distribution or (B, K) batch
+
+        Returns:
+            numpy.ndarray: distribution @ P with the same shape
+        """
+        distribution = np.asarray(distribution, dtype=float)
+        return (self.transpose @ distribution.T).T
+
+    def stationary_distribution(self, method='power', tol=1e-12, max_iter=100_000,
+                                initial=None):
+        """
+        Find the stationary distribution pi = pi P.
+
+        Args:
+            method, tol, max_iter, initial: See stationary_probabilities
+
+        Returns:
+            CategoricalRandomVariable: Stationary distribution over the state
+                labels
+        """
+        pi = self.stationary_probabilities(method, tol, max_iter, initial)
+        return CategoricalRandomVariable(pi, self.values)
+
+    def stationary_probabilities(self, method='power', tol=1e-12, max_iter=100_000,
+                                 initial=None):
+        """
+        Find the stationary probabilities in state-index order.
+
+        Args:
+            method (str): 'power' for power iteration on the lazy chain, or
+                'eigs' for the sparse eigensolver
+            tol (float): L1 change between iterations at which power
+                iteration stops
+            max_iter (int): Maximum number of power iterations
+            initial (array_like, optional): Starting distribution for power
+                iteration; defaults to uniform
+
+        Returns:
+            numpy.ndarray: (K,) probabilities, entry i for row i of P
+        """
+        if method == 'power':
+            pi = (np.full(self.n_states, 1.0 / self.n_states) if initial is None
+                  else np.asarray(initial, dtype=float) / np.sum(initial))
+            for _ in range(max_iter):
+                updated = 0.5 * (pi + self.transpose @ pi)
+                change = np.abs(updated - pi).sum()
+                pi = updated
+                if change < tol:
+                    break
+            else:
+                raise RuntimeError("power iteration did not converge")
+        elif method == 'eigs':
+            if self.n_states < 3:
+                # ARPACK needs k < K - 1; tiny chains are solved densely
+                eigenvalues, vectors = np.linalg.eig(self.transition.T.toarray())
+            else:
+                eigenvalues, vectors = linalg.eigs(self.transpose, k=1, which='LR')
+            pi = np.real(vectors[:, np.argmax(np.real(eigenvalues))])
+        else:
+            raise ValueError(f"Unknown method: {method}")
+
+        pi = np.abs(pi)
+        return pi / pi.sum()
+
+    def n_step_matrix(self, n):
+        """
+        Calculate P^n by repeated squaring.
+
+        Squaring fills in the sparsity pattern, so this suits chains whose
+        powers stay manageable; see distribution_after for large chains.
+
+        Args:
+            n (int): Number of steps
+
+        Returns:
+            scipy.sparse.csr_matrix: n-step transition matrix
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        result = sparse.identity(self.n_states, format='csr')
+        base = self.transition
+        while n:
+            if n & 1:
+                result = result @ base
+            n >>= 1
+            if n:
+                base = base @ base
+        return result.tocsr()
+
+    def distribution_after(self, n, initial, method='auto'):
+        """
+        Calculate the state distribution after n steps.
+
+        Args:
+            n (int): Number of steps
+            initial (array_like): (K,) initial distribution or (B, K) batch
+            method (str): 'squaring' to multiply by P^n, 'steps' for n sparse
+                vector products, or 'auto' to square only up to
+                SQUARING_MAX_STATES states
+
+        Returns:
+            numpy.ndarray: Distribution(s) after n steps
+        """
+        if method == 'auto':
+            method = 'squaring' if self.n_states <= SQUARING_MAX_STATES else 'steps'
+
+        distribution = np.asarray(initial, dtype=float)
+        if method == 'squaring':
+            return (self.n_step_matrix(n).T @ distribution.T).T
+        if method == 'steps':
+            for _ in range(n):
+                distribution = self.step(distribution)
+            return distribution
+        raise ValueError(f"Unknown method: {method}")
+
+    def _cumulative_rows(self):
+        """Cumulative transition probabilities of all rows laid end to end."""
+        if self._row_cdf is None:
+            cumulative = np.cumsum(self.transition.data)
+            starts = self.transition.indptr[:-1]
+            before = np.concatenate(([0.0], cumulative))[starts]
+            self._row_cdf = (cumulative, before)
+        return self._row_cdf
+
+    def simulate(self, n_chains, n_steps, initial=None, rng=None):
+        """
+        Simulate independent trajectories of the chain.
+
+        Args:
+            n_chains (int): Number of chains
+            n_steps (int): Number of transitions per chain
+            initial (int or array_like, optional): Starting state index of
+                every chain; defaults to draws from the stationary distribution
+            rng (numpy.random.Generator or int, optional): Generator or seed
+
+        Returns:
+            numpy.ndarray: (n_chains, n_steps + 1) state labels
+        """
+        rng = np.random.default_rng(rng)
+        if initial is None:
+            # Draw state indices; the labelled PMF is re-sorted by label
+            initial = AliasTable(self.stationary_probabilities()).sample(n_chains, rng)
+        states = np.empty((n_chains, n_steps + 1), dtype=np.intp)
+        states[:, 0] = initial
+
+        cumulative, before = self._cumulative_rows()
+        indptr, indices = self.transition.indptr, self.transition.indices
+
+        for t in range(n_steps):
+            current = states[:, t]
+            row_mass = cumulative[indptr[current + 1] - 1] - before[current]
+            targets = before[current] + rng.random(n_chains) * row_mass
+            position = np.searchsorted(cumulative, targets, side='right')
+            # Guard against rounding at the row boundaries
+            position = np.clip(position, indptr[current], indptr[current + 1] - 1)
+            states[:, t + 1] = indices[position]
+
+        return self.values[states]
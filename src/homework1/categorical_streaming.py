@@ -0,0 +1,129 @@
+"""
+Streaming Comparison of Empirical and Theoretical Categorical Statistics
+
+Problem 2 asks to compare theoretical and empirical statistics. For sample
+streams far too large to hold in memory, this module consumes samples chunk by
+chunk and keeps only a length-K histogram plus running Welford moments, so
+memory is O(K) no matter how many samples have been seen. At any moment it can
+report goodness-of-fit statistics against the CategoricalRandomVariable:
+
+- Pearson chi-square and the G-test (likelihood-ratio) statistics with their
+  p-values,
+- the total-variation distance and the KL divergence KL(empirical || model),
+- the empirical mean and variance next to their theoretical values.
+"""
+
+import numpy as np
+from scipy import special, stats
+
+
+class StreamingComparator:
+    """Online histogram and moments compared against a categorical model."""
+
+    def __init__(self, rv):
+        """
+        Initialize empty counts for a model variable.
+
+        Args:
+            rv (CategoricalRandomVariable): Theoretical distribution
+        """
+        self.rv = rv
+        self.counts = np.zeros(len(rv.values), dtype=np.int64)
+        self.n_outside = 0
+
+        # Welford accumulators
+        self.n_samples = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, samples):
+        """
+        Add a chunk of samples to the histogram and running moments.
+
+        Args:
+            samples (array_like): Observed values of X
+        """
+        samples = np.asarray(samples).ravel()
+        if samples.size == 0:
+            return
+
+        values = self.rv.values
+        idx = np.minimum(np.searchsorted(values, samples), len(values) - 1)
+        on_support = values[idx] == samples
+        self.counts += np.bincount(idx[on_support], minlength=len(values))
+        self.n_outside += int(samples.size - np.count_nonzero(on_support))
+
+        # Chan et al. merge of the chunk's moments into the running ones
+        n_chunk = samples.size
+        chunk_mean = np.mean(samples)
+        chunk_m2 = np.sum((samples - chunk_mean) ** 2)
+        n_total = self.n_samples + n_chunk
+        delta = chunk_mean - self.mean
+        self.mean += delta * n_chunk / n_total
+        self.m2 += chunk_m2 + delta * delta * self.n_samples * n_chunk / n_total
+        self.n_samples = n_total
+
+    def consume(self, chunks):
+        """
+        Add every chunk of a sample stream.
+
+        Args:
+            chunks (iterable): Iterator of sample arrays
+
+        Returns:
+            dict: Report after the last chunk, see report
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self.report()
+
+    @property
+    def variance(self):
+        """float: Population variance of the samples seen so far."""
+        return self.m2 / self.n_samples if self.n_samples else np.nan
+
+    def report(self):
+        """
+        Compare the samples seen so far with the theoretical distribution.
+
+        Returns:
+            dict: Sample size, empirical and theoretical moments, chi-square
+                and G-test statistics with p-values, total-variation distance
+                and KL divergence
+        """
+        n = self.n_samples
+        p = self.rv.probabilities
+        observed = self.counts.astype(float)
+        expected = n * p
+        empirical = observed / n if n else np.full_like(p, np.nan)
+
+        support = p > 0
+        dof = max(int(np.count_nonzero(support)) - 1, 1)
+        impossible = self.n_outside > 0 or np.any(observed[~support] > 0)
+
+        if impossible:
+            chi_square = g_statistic = kl = np.inf
+        else:
+            chi_square = np.sum((observed[support] - expected[support]) ** 2 /
+                                expected[support])
+            # rel_entr handles empty cells as 0 * log 0 = 0
+            g_statistic = 2 * np.sum(special.rel_entr(observed[support], expected[support]))
+            kl = np.sum(special.rel_entr(empirical[support], p[support]))
+
+        total_variation = 0.5 * (np.sum(np.abs(empirical - p)) + self.n_outside / max(n, 1))
+
+        return {
+            'n_samples': n,
+            'empirical_mean': self.mean if n else np.nan,
+            'empirical_variance': self.variance,
+            'theoretical_mean': self.rv.calculate_expectation(),
+            'theoretical_variance': self.rv.calculate_variance(),
+            'empirical_probabilities': empirical,
+            'chi_square': chi_square,
+            'chi_square_p_value': stats.chi2.sf(chi_square, dof),
+            'g_statistic': g_statistic,
+            'g_test_p_value': stats.chi2.sf(g_statistic, dof),
+            'degrees_of_freedom': dof,
+            'total_variation': total_variation,
+            'kl_divergence': kl
+        }
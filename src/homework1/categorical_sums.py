@@ -0,0 +1,177 @@
+"""
+Distribution of Sums of i.i.d. Categorical Random Variables
+
+The PMF of S = X1 + ... + Xn is the n-fold convolution power of the PMF of X.
+Repeated np.convolve costs O(n^2 K^2) overall; here the power is built by
+exponentiation by squaring, with every convolution done by FFT, so only
+O(log n) FFTs of growing length are needed.
+
+FFT products carry an absolute rounding error near machine epsilon times the
+largest probability. After every product the entries below that noise floor
+(including the tiny negative ones) are clipped to zero and the negligible
+mass at both tails is trimmed, which keeps the arrays short and the result
+stable. When a caller needs exact tail probabilities below that noise floor,
+the same squaring scheme can run in the log domain with logaddexp-based
+convolutions instead.
+"""
+
+import warnings
+
+import numpy as np
+from scipy import fft
+
+
+# Relative size of FFT rounding noise; smaller entries are clipped to zero
+FFT_NOISE_FLOOR = 1e-14
+
+# Largest number of grid points a support may be laid out on densely
+MAX_DENSE_SUPPORT = 10_000_000
+
+
+def _fft_convolve(a, b):
+    """Linear convolution of two non-negative arrays via real FFTs."""
+    n = len(a) + len(b) - 1
+    size = fft.next_fast_len(n, real=True)
+    result = fft.irfft(fft.rfft(a, size) * fft.rfft(b, size), size)[:n]
+    result[result < FFT_NOISE_FLOOR * result.max()] = 0.0
+    return result
+
+
+def _log_convolve(log_a, log_b):
+    """Linear convolution of two arrays of log-probabilities."""
+    if len(log_a) < len(log_b):
+        log_a, log_b = log_b, log_a
+    result = np.full(len(log_a) + len(log_b) - 1, -np.inf)
+    # Loop over the shorter array; each step is one vectorized logaddexp
+    for j, log_bj in enumerate(log_b):
+        if np.isfinite(log_bj):
+            segment = result[j:j + len(log_a)]
+            np.logaddexp(segment, log_a + log_bj, out=segment)
+    return result
+
+
+def _trim(pmf, offset, tolerance, log=False):
+    """Drop leading and trailing entries holding at most tolerance mass."""
+    if log:
+        head = np.logaddexp.accumulate(pmf)
+        tail = np.logaddexp.accumulate(pmf[::-1])
+        with np.errstate(divide='ignore'):
+            threshold = np.log(tolerance) + head[-1]
+    else:
+        head = np.cumsum(pmf)
+        tail = np.cumsum(pmf[::-1])
+        threshold = tolerance * head[-1]
+
+    # Cumulative sums from each end tell how many entries are negligible
+    start = np.searchsorted(head, threshold, side='right')
+    stop = len(pmf) - np.searchsorted(tail, threshold, side='right')
+    if stop <= start:
+        start = int(np.argmax(pmf))
+        stop = start + 1
+    return pmf[start:stop], offset + start
+
+
+def convolution_power(probabilities, n, tail_tolerance=1e-16, method='fft'):
+    """
+    Calculate the n-fold convolution power of a PMF on 0..K-1.
+
+    Args:
+        probabilities (array_like): PMF of X on the support 0..K-1
+        n (int): Number of i.i.d. terms in the sum
+        tail_tolerance (float): Mass that may be dropped from each tail per
+            convolution step; 0 keeps the full support
+        method (str): 'fft' for FFT products, 'log' for exact log-domain
+            products, or 'auto' to use FFT unless tail_tolerance asks for
+            probabilities below the FFT noise floor
+
+    Returns:
+        tuple: (offset, pmf) where pmf[i] = P(S = offset + i)
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if method == 'auto':
+        method = 'fft' if tail_tolerance >= FFT_NOISE_FLOOR else 'log'
+    if method not in ('fft', 'log'):
+        raise ValueError(f"Unknown method: {method}")
+
+    log = method == 'log'
+    convolve = _log_convolve if log else _fft_convolve
+    base = np.asarray(probabilities, dtype=float)
+    base = base / base.sum()
+    if log:
+        with np.errstate(divide='ignore'):
+            base = np.log(base)
+
+    base, base_offset = _trim(base, 0, 0.0, log)
+    result, result_offset = (np.zeros(1) if log else np.ones(1)), 0
+
+    # Exponentiation by squaring: result *= base for every set bit of n
+    while n:
+        if n & 1:
+            result = convolve(result, base)
+            result, result_offset = _trim(result, result_offset + base_offset,
+                                          tail_tolerance, log)
+        n >>= 1
+        if n:
+            base = convolve(base, base)
+            base, base_offset = _trim(base, 2 * base_offset, tail_tolerance, log)
+
+    if log:
+        result = np.exp(result)
+    return result_offset, result / result.sum()
+
+
+def sum_distribution(rv, n, tail_tolerance=1e-16, method='fft', rtol=1e-8):
+    """
+    Calculate the distribution of the sum of n i.i.d. copies of a variable.
+
+    Args:
+        rv (CategoricalRandomVariable): Distribution of each term; sparse
+            integer supports are expanded over their span, in steps of the
+            gcd of the gaps between values
+        n (int): Number of terms
+        tail_tolerance (float): Negligible tail mass trimmed per step
+        method (str): 'fft', 'log' or 'auto', see convolution_power
+        rtol (float): Relative tolerance of the closed-form moment check
+
+    Returns:
+        dict: Support values and PMF of S, its expectation and variance, and
+            the closed-form values n E[X] and n V[X] they were checked against
+    """
+    if not np.issubdtype(rv.values.dtype, np.integer):
+        raise ValueError("sums require an integer support")
+
+    # Lay the support out densely from its smallest value, on the coarsest
+    # lattice containing every value
+    low = rv.values[0]
+    shifted = rv.values - low
+    step = max(int(np.gcd.reduce(shifted)), 1)
+    span = int(shifted[-1]) // step + 1
+    if span > MAX_DENSE_SUPPORT:
+        raise ValueError(f"support spans {span} lattice points, more than "
+                         f"MAX_DENSE_SUPPORT = {MAX_DENSE_SUPPORT}")
+    dense = np.zeros(span)
+    dense[shifted // step] = rv.probabilities
+
+    offset, pmf = convolution_power(dense, n, tail_tolerance, method)
+    values = n * low + step * (offset + np.arange(len(pmf)))
+
+    mean = pmf @ values
+    deviation = values - mean
+    variance = pmf @ (deviation * deviation)
+
+    expected_mean = n * rv.calculate_expectation()
+    expected_variance = n * rv.calculate_variance()
+    if not (np.isclose(mean, expected_mean, rtol=rtol, atol=rtol) and
+            np.isclose(variance, expected_variance, rtol=rtol, atol=rtol)):
+        warnings.warn("moments of the convolution power deviate from the closed "
+                      "form; consider a smaller tail_tolerance or method='log'")
+
+    return {
+        'values': values,
+        'probabilities': pmf,
+        'expectation': mean,
+        'variance': variance,
+        'closed_form_expectation': expected_mean,
+        'closed_form_variance': expected_variance
+    }
@@ -0,0 +1,175 @@
+"""
+Multi-Condition Differential Diagnosis with Batched Bayes
+
+Problem 1 weighs one disease against its absence using one test. This module
+generalizes the same Bayes machinery to K candidate conditions and M tests.
+The probability that test m is positive under condition k is stored in a
+(K, M) matrix, so the log-likelihoods of a whole batch of N patients are two
+matrix products:
+
+    log L = [R == 1] @ log(P).T + [R == 0] @ log(1 - P).T      (N, K)
+
+Adding the log prior and normalizing each row with log-sum-exp yields the
+N x K posterior table in one BLAS-backed pass. Tests are assumed
+conditionally independent given the condition, and results use the encoding
+of tuberculosis_sequential (1 positive, 0 negative, -1 not performed).
+"""
+
+import numpy as np
+from scipy.special import logsumexp
+
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer
+from tuberculosis_sequential import NEGATIVE, POSITIVE
+
+
+class DifferentialDiagnosis:
+    """Batched posterior over K conditions from M binary test results."""
+
+    def __init__(self, prior, positive_rates, condition_names=None,
+                 test_names=None):
+        """
+        Initialize with condition priors and test response rates.
+
+        Args:
+            prior (array_like): Prior probability of each of the K conditions
+            positive_rates (array_like): (K, M) matrix of P(test m positive |
+                condition k)
+            condition_names (list, optional): Labels for the K conditions
+            test_names (list, optional): Labels for the M tests
+        """
+        self.prior = np.asarray(prior, dtype=float)
+        self.positive_rates = np.atleast_2d(np.asarray(positive_rates, dtype=float))
+
+        n_conditions, n_tests = self.positive_rates.shape
+        if self.prior.shape != (n_conditions,):
+            raise ValueError("prior must have one entry per row of positive_rates")
+        if not np.isclose(self.prior.sum(), 1.0):
+            raise ValueError("prior probabilities must sum to 1")
+
+        self.condition_names = (list(condition_names) if condition_names is not None
+                                else [f"condition_{k}" for k in range(n_conditions)])
+        self.test_names = (list(test_names) if test_names is not None
+                           else [f"test_{m}" for m in range(n_tests)])
+
+        with np.errstate(divide='ignore'):
+            self.log_prior = np.log(self.prior)
+            # Transposed once so that each batch is a plain (N, M) @ (M, K)
+            log_positive = np.log(self.positive_rates).T
+            log_negative = np.log1p(-self.positive_rates).T
+
+        # Rates of exactly 0 or 1 give -inf, and 0 * -inf would turn results
+        # that were not observed into NaN. The finite parts go through the
+        # matrix product and the impossible cells are flagged separately.
+        self._impossible_positive = np.isinf(log_positive).astype(float)
+        self._impossible_negative = np.isinf(log_negative).astype(float)
+        self.log_positive = np.where(np.isinf(log_positive), 0.0, log_positive)
+        self.log_negative = np.where(np.isinf(log_negative), 0.0, log_negative)
+
+    @classmethod
+    def from_analyzer(cls, analyzer=None):
+        """
+        Build the two-condition, one-test model of Problem 1.
+
+        Args:
+            analyzer (TuberculosisTestAnalyzer, optional): Source analyzer
+
+        Returns:
+            DifferentialDiagnosis: Model with conditions (tuberculosis, healthy)
+        """
+        if analyzer is None:
+            analyzer = TuberculosisTestAnalyzer()
+        return cls(
+            prior=[analyzer.p_disease, analyzer.p_no_disease],
+            positive_rates=[[analyzer.p_positive_given_disease],
+                            [analyzer.p_positive_given_no_disease]],
+            condition_names=['tuberculosis', 'no tuberculosis'],
+            test_names=['tuberculosis test']
+        )
+
+    @property
+    def n_conditions(self):
+        """int: Number of candidate conditions K."""
+        return self.positive_rates.shape[0]
+
+    @property
+    def n_tests(self):
+        """int: Number of tests M."""
+        return self.positive_rates.shape[1]
+
+    def log_likelihood(self, results):
+        """
+        Calculate the log-likelihood of every patient under every condition.
+
+        Args:
+            results (array_like): (N, M) array of test results
+
+        Returns:
+            numpy.ndarray: (N, K) log-likelihood matrix
+        """
+        results = np.atleast_2d(np.asarray(results))
+        if results.shape[1] != self.n_tests:
+            raise ValueError(f"results must have {self.n_tests} columns")
+
+        positive = (results == POSITIVE).astype(float)
+        negative = (results == NEGATIVE).astype(float)
+
+        log_like = positive @ self.log_positive + negative @ self.log_negative
+
+        impossible = (positive @ self._impossible_positive +
+                      negative @ self._impossible_negative) > 0
+        log_like[impossible] = -np.inf
+        return log_like
+
+    def log_posterior(self, results):
+        """
+        Calculate normalized log-posterior probabilities.
+
+        Args:
+            results (array_like): (N, M) array of test results
+
+        Returns:
+            numpy.ndarray: (N, K) log-posterior matrix
+        """
+        log_joint = self.log_likelihood(results) + self.log_prior
+        return log_joint - logsumexp(log_joint, axis=1, keepdims=True)
+
+    def posterior(self, results):
+        """
+        Calculate posterior probabilities of every condition.
+
+        Args:
+            results (array_like): (N, M) array of test results
+
+        Returns:
+            numpy.ndarray: (N, K) matrix whose rows sum to one
+        """
+        return np.exp(self.log_posterior(results))
+
+    def triage(self, results, chunk_size=1_000_000):
+        """
+        Rank the most probable condition for a large intake batch.
+
+        Args:
+            results (array_like): (N, M) array of test results
+            chunk_size (int): Patients processed per matrix product
+
+        Returns:
+            dict: Index and name of the most probable condition per patient
+                and its posterior probability
+        """
+        results = np.atleast_2d(np.asarray(results))
+        best = np.empty(len(results), dtype=np.intp)
+        best_probability = np.empty(len(results))
+
+        for start in range(0, len(results), chunk_size):
+            log_post = self.log_posterior(results[start:start + chunk_size])
+            idx = np.argmax(log_post, axis=1)
+            best[start:start + chunk_size] = idx
+            best_probability[start:start + chunk_size] = np.exp(
+                log_post[np.arange(len(idx)), idx])
+
+        return {
+            'condition_index': best,
+            'condition': np.asarray(self.condition_names)[best],
+            'posterior_probability': best_probability
+        }
@@ -0,0 +1,177 @@
+"""
+Uncertainty of the Earthquake Rate and Exceedance Probabilities
+
+predict_next_decade_probability plugs the estimated rate into the Poisson
+tail, ignoring that lambda itself is estimated from a dozen decades. This
+module quantifies that uncertainty in two ways:
+
+- a bootstrap, which redraws (B, n_decades) count matrices, either
+  parametrically from Poisson(lambda_hat) or by resampling the observed
+  counts, and re-estimates lambda from every row. Replicates are drawn in
+  vectorized blocks; each block has its own generator spawned from one numpy
+  SeedSequence, so large B can be spread over a process pool and the result
+  depends only on the seed, not on the number of workers.
+- the conjugate Gamma posterior. With prior Gamma(shape a, rate b) and counts
+  y_1..y_n,
+
+      lambda | y ~ Gamma(a + sum y, b + n)
+
+  and the posterior predictive count in the next window is negative binomial.
+
+P(N >= k) increases monotonically with lambda, so the interval bounds of every
+exceedance probability are the exceedance probabilities at the bounds of
+lambda; all thresholds are evaluated at once from the two lambda quantiles.
+"""
+
+import numpy as np
+from scipy import special, stats
+
+from parallel_blocks import run_seeded_blocks
+
+
+def bootstrap_block(seed_sequence, n_replicates, counts, method='parametric',
+                    chunk_size=10_000_000):
+    """
+    Draw one block of bootstrap replicates of the mean count.
+
+    Args:
+        seed_sequence (numpy.random.SeedSequence): Seed for this block
+        n_replicates (int): Number of replicates in the block
+        counts (numpy.ndarray): Observed counts per window
+        method (str): 'parametric' draws Poisson(mean(counts)) counts,
+            'nonparametric' resamples the observed counts
+        chunk_size (int): Maximum number of counts drawn per vectorized step
+
+    Returns:
+        numpy.ndarray: (n_replicates,) replicate rate estimates
+    """
+    rng = np.random.default_rng(seed_sequence)
+    n = len(counts)
+    lambda_estimate = np.mean(counts)
+    rows_per_chunk = max(1, chunk_size // n)
+    replicates = np.empty(n_replicates)
+
+    for start in range(0, n_replicates, rows_per_chunk):
+        rows = min(rows_per_chunk, n_replicates - start)
+        if method == 'parametric':
+            sample = rng.poisson(lambda_estimate, size=(rows, n))
+        elif method == 'nonparametric':
+            sample = counts[rng.integers(0, n, size=(rows, n))]
+        else:
+            raise ValueError(f"Unknown bootstrap method: {method}")
+        replicates[start:start + rows] = sample.mean(axis=1)
+
+    return replicates
+
+
+class RateUncertaintyAnalyzer:
+    """Bootstrap and Gamma-posterior intervals for the earthquake rate."""
+
+    def __init__(self, analyzer, prior_shape=0.5, prior_rate=0.0,
+                 block_size=1_000_000, chunk_size=10_000_000):
+        """
+        Initialize with an analyzer holding the observed counts.
+
+        Args:
+            analyzer (EarthquakeAnalyzer): Counts per window and window width
+            prior_shape (float): Shape of the Gamma prior on lambda; the
+                default with prior_rate 0 is the Jeffreys prior
+            prior_rate (float): Rate of the Gamma prior, in windows
+            block_size (int): Bootstrap replicates per block, the unit of
+                work sent to a worker process
+            chunk_size (int): Maximum counts drawn per vectorized step
+        """
+        self.analyzer = analyzer
+        self.prior_shape = prior_shape
+        self.prior_rate = prior_rate
+        self.block_size = block_size
+        self.chunk_size = chunk_size
+
+    def bootstrap(self, n_bootstrap, seed=None, n_workers=1, method='parametric'):
+        """
+        Draw bootstrap replicates of lambda.
+
+        Args:
+            n_bootstrap (int): Number of replicates B
+            seed (int or numpy.random.SeedSequence, optional): Root seed
+            n_workers (int, optional): Number of worker processes; 1 runs
+                in the current process and None uses every CPU
+            method (str): 'parametric' or 'nonparametric', see bootstrap_block
+
+        Returns:
+            numpy.ndarray: (B,) replicate estimates of lambda per window
+        """
+        counts = np.asarray(self.analyzer.earthquake_data)
+        blocks = run_seeded_blocks(bootstrap_block, n_bootstrap, self.block_size, seed,
+                                   n_workers, args=(counts, method, self.chunk_size))
+
+        return np.concatenate(blocks) if blocks else np.empty(0)
+
+    def posterior_parameters(self):
+        """
+        Get the Gamma posterior of lambda.
+
+        Returns:
+            tuple: (shape, rate) of the posterior
+        """
+        counts = np.asarray(self.analyzer.earthquake_data)
+        return self.prior_shape + np.sum(counts), self.prior_rate + len(counts)
+
+    def _exceedance(self, thresholds, lambdas, horizon):
+        """P(N >= k) over the horizon for every threshold and lambda."""
+        mu = np.asarray(lambdas) * (horizon / self.analyzer.window_years)
+        tail = special.pdtrc(np.maximum(thresholds - 1, 0)[:, None], mu[None, :])
+        return np.where(thresholds[:, None] <= 0, 1.0, tail)
+
+    def intervals(self, thresholds=(1, 2, 3), horizon=10.0, level=0.95,
+                  n_bootstrap=100_000, seed=None, n_workers=1, method='parametric'):
+        """
+        Calculate intervals for lambda and exceedance probabilities.
+
+        Args:
+            thresholds (array_like): Minimum numbers of earthquakes k
+            horizon (float): Forecast horizon in years
+            level (float): Coverage of the confidence and credible intervals
+            n_bootstrap (int): Number of bootstrap replicates
+            seed (int or numpy.random.SeedSequence, optional): Root seed
+            n_workers (int, optional): Number of worker processes
+            method (str): Bootstrap method, see bootstrap_block
+
+        Returns:
+            dict: Point estimates, bootstrap confidence intervals and Gamma
+                posterior credible intervals for lambda and for P(N >= k) at
+                every threshold, plus the posterior predictive P(N >= k)
+        """
+        thresholds = np.atleast_1d(np.asarray(thresholds))
+        tail = (1 - level) / 2
+        lambda_estimate = self.analyzer.model.lambda_estimate
+
+        replicates = self.bootstrap(n_bootstrap, seed, n_workers, method)
+        bootstrap_lambda = np.quantile(replicates, [tail, 1 - tail])
+
+        shape, rate = self.posterior_parameters()
+        posterior_lambda = stats.gamma.ppf([tail, 1 - tail], shape, scale=1 / rate)
+
+        # Predictive count over the horizon: Poisson-Gamma mixture
+        scale = horizon / self.analyzer.window_years
+        predictive = stats.nbinom.sf(thresholds - 1, shape, rate / (rate + scale))
+
+        return {
+            'thresholds': thresholds,
+            'lambda_estimate': lambda_estimate,
+            'exceedance': self._exceedance(thresholds, [lambda_estimate], horizon)[:, 0],
+            'bootstrap': {
+                'n_bootstrap': len(replicates),
+                'lambda_std_error': np.std(replicates, ddof=1),
+                'lambda_interval': tuple(bootstrap_lambda),
+                'exceedance_interval': self._exceedance(thresholds, bootstrap_lambda, horizon)
+            },
+            'posterior': {
+                'shape': shape,
+                'rate': rate,
+                'lambda_mean': shape / rate,
+                'lambda_interval': tuple(posterior_lambda),
+                'exceedance_interval': self._exceedance(thresholds, posterior_lambda, horizon),
+                'predictive_exceedance': np.where(thresholds <= 0, 1.0, predictive)
+            }
+        }
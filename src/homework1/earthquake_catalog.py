@@ -0,0 +1,311 @@
+"""
+Columnar Earthquake Catalog Ingestion and Window Binning
+
+EarthquakeAnalyzer works on event counts per time window. Real catalogs list
+individual events, often millions of them, with a timestamp, location, depth
+and magnitude. This module keeps such a catalog as compact typed columns:
+
+    time       float64 decimal years (e.g. 1994.046 for 17 January 1994)
+    latitude   float32 degrees
+    longitude  float32 degrees
+    depth      float32 kilometres
+    magnitude  float32
+
+Catalogs are read from memory-mapped .npy files, .npz archives, or CSV files
+in chunks. Events are binned into years, decades, any fixed width or custom
+window edges with a single bincount or histogram call, after vectorized
+magnitude and time cutoffs, and the counts feed EarthquakeAnalyzer directly.
+"""
+
+from itertools import islice
+
+import numpy as np
+
+from problem3_earthquake_prediction import EarthquakeAnalyzer
+
+
+# Column names and storage types of a catalog
+COLUMNS = {
+    'time': np.float64,
+    'latitude': np.float32,
+    'longitude': np.float32,
+    'depth': np.float32,
+    'magnitude': np.float32
+}
+
+# Named window widths in years
+WINDOW_WIDTHS = {
+    'year': 1.0,
+    'decade': 10.0,
+    'century': 100.0
+}
+
+
+def to_decimal_year(timestamps):
+    """
+    Convert datetime64 timestamps to decimal years.
+
+    Args:
+        timestamps (array_like): numpy datetime64 values or ISO 8601 strings
+
+    Returns:
+        numpy.ndarray: float64 years, with the fraction of the year elapsed
+    """
+    timestamps = np.asarray(timestamps, dtype='datetime64[ms]')
+    years = timestamps.astype('datetime64[Y]')
+    start = years.astype('datetime64[ms]')
+    length = (years + 1).astype('datetime64[ms]') - start
+    fraction = (timestamps - start) / length
+    return years.astype(np.int64) + 1970 + fraction
+
+
+def _parse_time(column):
+    """Parse a text column of decimal years or ISO 8601 timestamps."""
+    try:
+        return column.astype(np.float64)
+    except ValueError:
+        return to_decimal_year(column)
+
+
+class EarthquakeCatalog:
+    """Earthquake events stored as typed columns."""
+
+    def __init__(self, time, magnitude, latitude=None, longitude=None, depth=None):
+        """
+        Initialize from column arrays of equal length.
+
+        Arrays that already have the storage type (such as memory-mapped
+        columns) are used without copying.
+
+        Args:
+            time (array_like): Decimal years, or datetime64 timestamps
+            magnitude (array_like): Event magnitudes
+            latitude (array_like, optional): Epicentre latitudes
+            longitude (array_like, optional): Epicentre longitudes
+            depth (array_like, optional): Hypocentre depths
+        """
+        time = np.asarray(time)
+        if np.issubdtype(time.dtype, np.datetime64):
+            time = to_decimal_year(time)
+
+        columns = {'time': time, 'magnitude': magnitude, 'latitude': latitude,
+                   'longitude': longitude, 'depth': depth}
+        n_events = len(time)
+        for name, values in columns.items():
+            if values is not None:
+                values = np.asarray(values, dtype=COLUMNS[name])
+                if values.shape != (n_events,):
+                    raise ValueError(f"column '{name}' must have one entry per event")
+            setattr(self, name, values)
+
+    def __len__(self):
+        """Return the number of events."""
+        return len(self.time)
+
+    @classmethod
+    def from_arrays(cls, data):
+        """
+        Create a catalog from a mapping or structured array of columns.
+
+        Args:
+            data (dict, numpy.lib.npyio.NpzFile or structured array): Columns
+                addressable by name; time and magnitude are required
+
+        Returns:
+            EarthquakeCatalog: Catalog over the given columns
+        """
+        names = data.dtype.names if hasattr(data, 'dtype') else data.keys()
+        return cls(**{name: data[name] for name in COLUMNS if name in names})
+
+    @classmethod
+    def from_npy(cls, path):
+        """
+        Memory-map a catalog stored as a structured .npy array.
+
+        An unstructured (n, 5) array is read with the columns in the order
+        time, latitude, longitude, depth, magnitude.
+
+        Args:
+            path (str): Path to the .npy file
+
+        Returns:
+            EarthquakeCatalog: Catalog whose columns view the mapped file
+        """
+        data = np.load(path, mmap_mode='r')
+        if data.dtype.names is not None:
+            return cls.from_arrays(data)
+        if data.ndim != 2 or data.shape[1] != len(COLUMNS):
+            raise ValueError("expected a structured array or an (n, 5) array")
+        return cls(**{name: data[:, i] for i, name in enumerate(COLUMNS)})
+
+    @classmethod
+    def from_npz(cls, path):
+        """
+        Load a catalog stored as one array per column in an .npz archive.
+
+        Args:
+            path (str): Path to the .npz file
+
+        Returns:
+            EarthquakeCatalog: Catalog over the archived columns
+        """
+        with np.load(path) as archive:
+            return cls.from_arrays(archive)
+
+    @classmethod
+    def from_csv(cls, path, chunk_size=1_000_000, delimiter=',', column_names=None):
+        """
+        Read a catalog from a CSV file in chunks.
+
+        Args:
+            path (str): Path to a CSV file with a header row
+            chunk_size (int): Number of rows parsed per chunk
+            delimiter (str): Field delimiter
+            column_names (dict, optional): Maps catalog column names to CSV
+                headers that differ from them, e.g. {'magnitude': 'mag'}
+
+        Returns:
+            EarthquakeCatalog: Catalog of every row in the file
+        """
+        column_names = dict(column_names or {})
+        with open(path, 'r') as f:
+            header = [name.strip() for name in f.readline().split(delimiter)]
+            names = [name for name in COLUMNS
+                     if column_names.get(name, name) in header]
+            usecols = [header.index(column_names.get(name, name)) for name in names]
+            if 'time' not in names or 'magnitude' not in names:
+                raise ValueError("the CSV file needs time and magnitude columns")
+
+            chunks = {name: [] for name in names}
+            while True:
+                lines = list(islice(f, chunk_size))
+                if not lines:
+                    break
+                table = np.loadtxt(lines, delimiter=delimiter, usecols=usecols,
+                                   dtype=str, ndmin=2)
+                for i, name in enumerate(names):
+                    column = table[:, i]
+                    if name == 'time':
+                        chunks[name].append(_parse_time(column))
+                    else:
+                        chunks[name].append(column.astype(COLUMNS[name]))
+
+        return cls(**{name: np.concatenate(parts) if parts else np.empty(0, COLUMNS[name])
+                      for name, parts in chunks.items()})
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """
+        Load a catalog, choosing the reader from the file extension.
+
+        Args:
+            path (str): Path to a .npy, .npz or .csv file
+            **kwargs: Extra arguments for from_csv
+
+        Returns:
+            EarthquakeCatalog: Loaded catalog
+        """
+        if path.endswith('.npy'):
+            return cls.from_npy(path)
+        if path.endswith('.npz'):
+            return cls.from_npz(path)
+        return cls.from_csv(path, **kwargs)
+
+    def select(self, min_magnitude=None, max_magnitude=None, start=None, end=None):
+        """
+        Select events by magnitude and time.
+
+        Args:
+            min_magnitude (float, optional): Keep magnitudes >= this value
+            max_magnitude (float, optional): Keep magnitudes < this value
+            start (float, optional): Keep events at or after this year
+            end (float, optional): Keep events before this year
+
+        Returns:
+            EarthquakeCatalog: New catalog holding the selected events
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if min_magnitude is not None:
+            mask &= self.magnitude >= min_magnitude
+        if max_magnitude is not None:
+            mask &= self.magnitude < max_magnitude
+        if start is not None:
+            mask &= self.time >= start
+        if end is not None:
+            mask &= self.time < end
+
+        return EarthquakeCatalog(**{name: None if getattr(self, name) is None
+                                    else getattr(self, name)[mask]
+                                    for name in COLUMNS})
+
+    def bin_counts(self, window='decade', start=None, end=None, min_magnitude=None):
+        """
+        Count events per time window.
+
+        Args:
+            window (str, float or array_like): 'year', 'decade', 'century', a
+                window width in years, or explicit increasing window edges
+            start (float, optional): Start of the first window; defaults to
+                the first event rounded down to a whole window
+            end (float, optional): End of the last window, a whole number of
+                windows after start; defaults to the last event rounded up
+                to a whole window. The catalog usually stops inside that
+                window, so its count is low and biases a rate fitted to the
+                counts downward; pass an end at or before the catalog's last
+                complete window for rate estimates.
+            min_magnitude (float, optional): Only count events at or above
+                this magnitude
+
+        Returns:
+            tuple: (edges, counts) with len(counts) + 1 window edges
+        """
+        time = self.time
+        if min_magnitude is not None:
+            time = time[self.magnitude >= min_magnitude]
+
+        if np.ndim(window) == 1:
+            edges = np.asarray(window, dtype=float)
+            counts, edges = np.histogram(time, bins=edges)
+            return edges, counts
+
+        width = float(WINDOW_WIDTHS.get(window, window))
+        if width <= 0:
+            raise ValueError("window width must be positive")
+        if start is None:
+            start = np.floor(self.time.min() / width) * width if len(self) else 0.0
+        if end is None:
+            end = np.nextafter(self.time.max(), np.inf) if len(self) else start
+            n_windows = max(int(np.ceil((end - start) / width - 1e-9)), 1)
+        else:
+            n_windows = int(round((end - start) / width))
+            if n_windows < 1 or not np.isclose(start + n_windows * width, end):
+                raise ValueError("end must lie a whole number of windows after start")
+        edges = start + width * np.arange(n_windows + 1)
+
+        # Fixed-width windows only need an integer division and a bincount
+        time = time[(time >= start) & (time < edges[-1])]
+        index = np.minimum(((time - start) // width).astype(np.intp), n_windows - 1)
+        counts = np.bincount(index, minlength=n_windows)
+        return edges, counts
+
+    def to_analyzer(self, window='decade', start=None, end=None, min_magnitude=None):
+        """
+        Build an EarthquakeAnalyzer from the binned event counts.
+
+        The Poisson model treats every window as an equally long draw with
+        one rate, so custom edges must be evenly spaced.
+
+        Args:
+            window (str, float or array_like): Windows, see bin_counts
+            start (float, optional): Start of the first window
+            end (float, optional): End of the last window, see bin_counts
+            min_magnitude (float, optional): Magnitude cutoff for counted events
+
+        Returns:
+            EarthquakeAnalyzer: Analyzer over the counts per window
+        """
+        edges, counts = self.bin_counts(window, start, end, min_magnitude)
+        widths = np.diff(edges)
+        if not np.allclose(widths, widths[0]):
+            raise ValueError("windows must have equal widths for the Poisson analysis")
+        return EarthquakeAnalyzer(counts, periods=edges[:-1])
@@ -0,0 +1,243 @@
+"""
+Change-Point Detection for Time-Varying Earthquake Rates
+
+fit_poisson_model assumes one constant rate over the whole record. Here the
+rate is piecewise constant instead: the count series is split into segments,
+each with its own Poisson rate, by minimizing
+
+    sum over segments of C(segment) + penalty * (number of change points)
+
+where C is the negative Poisson log-likelihood at the segment's maximum
+likelihood rate. Up to terms that do not depend on the segmentation,
+
+    C(a, b) = S - S log(S / L),   S = y[a] + ... + y[b-1],  L = b - a
+
+so with a cumulative sum of the counts every segment cost is O(1). Two
+searches are available:
+
+- binary segmentation, which splits the segment with the best gain while the
+  gain exceeds the penalty; every split scores all candidate positions with
+  one vectorized expression, so 10^5 bins take milliseconds,
+- PELT (pruned exact linear time), which finds the exact optimum by dynamic
+  programming over the last change point, discarding candidates that can no
+  longer be optimal. Pruning only removes a candidate once a later boundary
+  beats it by more than the penalty, which needs a real rate change, so the
+  candidate set grows with the length of the current regime. With frequent
+  changes PELT is close to linear; on a homogeneous series it is O(n^2).
+  Beyond PELT_MAX_BINS bins it warns, and long series should use binary
+  segmentation.
+
+The latest regime's rate gives the forecast, through the same PoissonRateModel
+used by EarthquakeAnalyzer.
+"""
+
+import warnings
+
+import numpy as np
+from scipy import special
+
+from earthquake_poisson import PoissonRateModel
+
+
+# PELT warns above this many bins, where its O(n^2) worst case takes seconds
+PELT_MAX_BINS = 20_000
+
+
+def _segment_cost(cumulative, start, stop):
+    """Negative Poisson log-likelihood of segments [start, stop), vectorized."""
+    total = cumulative[stop] - cumulative[start]
+    length = stop - start
+    return total - special.xlogy(total, total / length)
+
+
+def binary_segmentation(counts, penalty, min_size=1):
+    """
+    Find change points by recursive binary segmentation.
+
+    Args:
+        counts (array_like): Event counts per bin
+        penalty (float): Minimum cost reduction for accepting a split
+        min_size (int): Minimum number of bins per segment
+
+    Returns:
+        numpy.ndarray: Sorted indices of the first bin of every new segment
+    """
+    counts = np.asarray(counts, dtype=float)
+    cumulative = np.concatenate(([0.0], np.cumsum(counts)))
+    change_points = []
+    pending = [(0, len(counts))]
+
+    while pending:
+        start, stop = pending.pop()
+        splits = np.arange(start + min_size, stop - min_size + 1)
+        if len(splits) == 0:
+            continue
+        # Gain of every split position in one expression
+        gain = (_segment_cost(cumulative, start, stop) -
+                _segment_cost(cumulative, start, splits) -
+                _segment_cost(cumulative, splits, stop))
+        best = int(np.argmax(gain))
+        if gain[best] > penalty:
+            split = int(splits[best])
+            change_points.append(split)
+            pending.extend([(start, split), (split, stop)])
+
+    return np.array(sorted(change_points), dtype=np.intp)
+
+
+def pelt(counts, penalty, min_size=1):
+    """
+    Find the optimal change points with the PELT algorithm.
+
+    Every bin is compared with all candidates still alive, which is the whole
+    current regime, so the worst case on a series without changes is O(n^2).
+    Prefer binary_segmentation above PELT_MAX_BINS bins.
+
+    Args:
+        counts (array_like): Event counts per bin
+        penalty (float): Cost of every additional change point
+        min_size (int): Minimum number of bins per segment
+
+    Returns:
+        numpy.ndarray: Sorted indices of the first bin of every new segment
+    """
+    counts = np.asarray(counts, dtype=float)
+    n = len(counts)
+    if n > PELT_MAX_BINS:
+        warnings.warn(f"PELT is O(n^2) on series without changes and {n} bins may take "
+                      "minutes; consider method='binseg'")
+    cumulative = np.concatenate(([0.0], np.cumsum(counts)))
+
+    best_cost = np.full(n + 1, np.inf)
+    best_cost[0] = -penalty
+    last_change = np.zeros(n + 1, dtype=np.intp)
+    # Live candidates occupy the front of one preallocated buffer
+    candidates = np.empty(n + 1, dtype=np.intp)
+    n_candidates = 0
+
+    for t in range(min_size, n + 1):
+        # A segment ending at t may start at any admissible earlier boundary
+        new = t - min_size
+        if np.isfinite(best_cost[new]):
+            candidates[n_candidates] = new
+            n_candidates += 1
+
+        live = candidates[:n_candidates]
+        cost = best_cost[live] + _segment_cost(cumulative, live, t)
+        best = int(np.argmin(cost))
+        best_cost[t] = cost[best] + penalty
+        last_change[t] = live[best]
+
+        # Candidates that cannot beat the optimum now never will
+        kept = live[cost <= best_cost[t]]
+        n_candidates = len(kept)
+        candidates[:n_candidates] = kept
+
+    change_points = []
+    t = last_change[n]
+    while t > 0:
+        change_points.append(t)
+        t = last_change[t]
+    return np.array(change_points[::-1], dtype=np.intp)
+
+
+class PiecewisePoissonModel:
+    """Poisson counts with a piecewise-constant rate."""
+
+    def __init__(self, counts, periods=None, window_years=10.0, penalty=None,
+                 method='binseg', min_size=1):
+        """
+        Segment a count series into constant-rate regimes.
+
+        Args:
+            counts (array_like): Event counts per bin
+            periods (array_like, optional): Start year of every bin; defaults
+                to consecutive windows from 1900
+            window_years (float): Width of every bin in years
+            penalty (float, optional): Cost of every change point; defaults to
+                log(n), the BIC penalty for a rate and a location
+            method (str): 'binseg' for binary segmentation or 'pelt' for the
+                exact optimum, which is O(n^2) on long homogeneous series
+            min_size (int): Minimum number of bins per segment
+        """
+        self.counts = np.asarray(counts)
+        self.window_years = float(window_years)
+        self.periods = (1900 + self.window_years * np.arange(len(self.counts))
+                        if periods is None else np.asarray(periods))
+        self.penalty = np.log(max(len(self.counts), 2)) if penalty is None else penalty
+
+        if method == 'binseg':
+            self.change_points = binary_segmentation(self.counts, self.penalty, min_size)
+        elif method == 'pelt':
+            self.change_points = pelt(self.counts, self.penalty, min_size)
+        else:
+            raise ValueError(f"Unknown method: {method}")
+
+        self.boundaries = np.concatenate(([0], self.change_points, [len(self.counts)]))
+        totals = np.add.reduceat(self.counts, self.boundaries[:-1]) if len(self.counts) else []
+        self.segment_rates = np.asarray(totals, dtype=float) / np.diff(self.boundaries)
+        self._latest_model = None
+
+    @classmethod
+    def from_analyzer(cls, analyzer, **kwargs):
+        """
+        Segment the counts of an EarthquakeAnalyzer.
+
+        Args:
+            analyzer (EarthquakeAnalyzer): Source of counts and windows
+            **kwargs: penalty, method and min_size
+
+        Returns:
+            PiecewisePoissonModel: Model over the analyzer's windows
+        """
+        return cls(analyzer.earthquake_data, analyzer.decades, analyzer.window_years,
+                   **kwargs)
+
+    def segments(self):
+        """
+        Describe every constant-rate regime.
+
+        Returns:
+            list: One dict per segment with its first and last period, number
+                of bins, total count, rate per bin and rate per year
+        """
+        return [{
+            'start': self.periods[start],
+            'end': self.periods[stop - 1],
+            'n_bins': stop - start,
+            'total': int(np.sum(self.counts[start:stop])),
+            'rate': rate,
+            'rate_per_year': rate / self.window_years
+        } for start, stop, rate in zip(self.boundaries[:-1], self.boundaries[1:],
+                                       self.segment_rates)]
+
+    def rates(self):
+        """
+        Get the fitted rate of every bin.
+
+        Returns:
+            numpy.ndarray: Segment rate repeated over the segment's bins
+        """
+        return np.repeat(self.segment_rates, np.diff(self.boundaries))
+
+    @property
+    def latest_model(self):
+        """PoissonRateModel: Poisson fit to the latest regime only."""
+        if self._latest_model is None:
+            self._latest_model = PoissonRateModel(self.counts[self.boundaries[-2]:],
+                                                  self.window_years)
+        return self._latest_model
+
+    def forecast(self, thresholds, horizons=None):
+        """
+        Forecast exceedance probabilities from the latest regime.
+
+        Args:
+            thresholds (array_like): Minimum numbers of events k
+            horizons (array_like, optional): Horizons in years; defaults to
+                one bin
+
+        Returns:
+            numpy.ndarray: P(N_t >= k) at the latest regime's rate
+        """
+        return self.latest_model.exceedance(thresholds, horizons)
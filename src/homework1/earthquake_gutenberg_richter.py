@@ -0,0 +1,290 @@
+"""
+Gutenberg-Richter Magnitude-Frequency Fitting
+
+Above the completeness magnitude Mc, earthquake magnitudes follow the
+Gutenberg-Richter law
+
+    log10 N(M >= m) = a - b m
+
+For magnitudes reported in bins of width dM, the Aki-Utsu maximum likelihood
+estimate of the b-value uses only the mean magnitude of the events at or
+above Mc:
+
+    b = log10(e) / (mean(M | M >= Mc) - (Mc - dM / 2))
+
+with the Shi and Bolt (1982) standard error
+
+    sigma_b = 2.3 b^2 sqrt(sum (M - mean)^2 / (n (n - 1)))
+
+After one sort, the number, sum and sum of squares of the magnitudes above
+every candidate Mc come from cumulative sums and searchsorted positions, so
+the b-value for every candidate is one vectorized expression. Independent
+groups, whether regional sub-catalogs or bootstrap resamples, are handled in
+the same call: each group is shifted by its own offset so all groups form one
+sorted array, and a single searchsorted serves them all.
+
+Mc itself is chosen per group by maximum curvature (the most frequent
+magnitude bin plus a correction) or by the goodness-of-fit test of Wiemer and
+Wyss (2000), which picks the lowest Mc whose fitted law explains at least a
+given percentage of the observed cumulative counts.
+"""
+
+import numpy as np
+
+
+LOG10_E = np.log10(np.e)
+
+
+def _candidate_statistics(values, bounds, thresholds):
+    """
+    Count and sum the values above every threshold in every group.
+
+    Args:
+        values (numpy.ndarray): Values sorted within each group, groups
+            stored contiguously
+        bounds (numpy.ndarray): (G + 1,) group boundaries into values
+        thresholds (numpy.ndarray): (C,) increasing thresholds
+
+    Returns:
+        tuple: (count, total, total_squares) arrays of shape (G, C)
+    """
+    n_groups = len(bounds) - 1
+    group = np.repeat(np.arange(n_groups), np.diff(bounds))
+    low = min(values.min(), thresholds[0])
+    scale = max(values.max(), thresholds[-1]) - low + 1.0
+
+    # Shifting group g by g * scale makes the whole array sorted
+    offsets = np.arange(n_groups) * scale
+    shifted = (values - low) + offsets[group]
+    queries = (thresholds - low)[None, :] + offsets[:, None]
+    position = np.searchsorted(shifted, queries.ravel()).reshape(n_groups, -1)
+
+    end = bounds[1:, None]
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    cumulative_squares = np.concatenate(([0.0], np.cumsum(values * values)))
+    return (end - position,
+            cumulative[end] - cumulative[position],
+            cumulative_squares[end] - cumulative_squares[position])
+
+
+def _goodness_of_fit(count, b_value, candidates):
+    """Percentage of cumulative counts explained by the fit at every Mc."""
+    n_candidates = len(candidates)
+    residual = np.full(count.shape, np.nan)
+    for j in range(n_candidates):
+        # Synthetic cumulative counts above Mc_j from the fit at Mc_j
+        above = slice(j, n_candidates)
+        synthetic = count[:, j:j + 1] * 10.0 ** (
+            -b_value[:, j:j + 1] * (candidates[above] - candidates[j]))
+        observed = count[:, above]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            residual[:, j] = 100 - 100 * (np.abs(observed - synthetic).sum(axis=1) /
+                                          observed.sum(axis=1))
+    return residual
+
+
+class GutenbergRichterAnalyzer:
+    """Gutenberg-Richter b-value estimation for a magnitude catalog."""
+
+    def __init__(self, magnitudes, bin_width=0.1, min_events=50):
+        """
+        Initialize with the magnitudes of a catalog.
+
+        Args:
+            magnitudes (array_like): Event magnitudes
+            bin_width (float): Magnitude binning dM of the catalog
+            min_events (int): Minimum number of events above Mc for a fit
+        """
+        self._unsorted_magnitudes = np.asarray(magnitudes, dtype=float)
+        self.magnitudes = np.sort(self._unsorted_magnitudes)
+        if len(self.magnitudes) == 0:
+            raise ValueError("magnitudes must not be empty")
+        self.bin_width = bin_width
+        self.min_events = min_events
+
+        # Candidate Mc values on the magnitude bin grid
+        low = np.round(self.magnitudes[0] / bin_width)
+        high = np.round(self.magnitudes[-1] / bin_width)
+        self.candidates = np.arange(low, high + 1) * bin_width
+
+    @classmethod
+    def from_catalog(cls, catalog, **kwargs):
+        """
+        Create an analyzer for the magnitude column of a catalog.
+
+        Args:
+            catalog (EarthquakeCatalog): Event catalog
+            **kwargs: bin_width and min_events
+
+        Returns:
+            GutenbergRichterAnalyzer: Analyzer over the catalog magnitudes
+        """
+        return cls(catalog.magnitude, **kwargs)
+
+    def _candidate_b_values(self, values, bounds):
+        """Event counts, b-values and standard errors of every group and candidate."""
+        # Binned magnitudes at or above Mc are those above Mc - dM / 2
+        lower = self.candidates - self.bin_width / 2
+        count, total, total_squares = _candidate_statistics(values, bounds, lower)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = total / count
+            b_value = LOG10_E / (mean - lower)
+            spread = np.maximum(total_squares - count * mean * mean, 0.0)
+            b_std = 2.3 * b_value ** 2 * np.sqrt(spread / (count * (count - 1)))
+        return count, b_value, b_std
+
+    def _fit_groups(self, values, bounds, mc=None, method='maxc',
+                    maxc_correction=0.2, gft_level=90.0):
+        """Fit every group of group-sorted values; returns a dict of (G,) arrays."""
+        count, b_value, b_std = self._candidate_b_values(values, bounds)
+
+        n_groups = len(bounds) - 1
+        rows = np.arange(n_groups)
+        if mc is not None:
+            index = np.full(n_groups, int(np.argmin(np.abs(self.candidates - mc))))
+        else:
+            # Maximum curvature: the most populated magnitude bin
+            per_bin = count - np.concatenate((count[:, 1:], np.zeros((n_groups, 1))), axis=1)
+            index = np.argmax(per_bin, axis=1)
+            if method == 'maxc':
+                index = index + int(round(maxc_correction / self.bin_width))
+            elif method == 'gft':
+                fit = _goodness_of_fit(count, b_value, self.candidates)
+                fit[count < self.min_events] = np.nan
+                passed = fit >= gft_level
+                index = np.where(passed.any(axis=1), np.argmax(passed, axis=1), index)
+            else:
+                raise ValueError(f"Unknown completeness method: {method}")
+            index = np.minimum(index, len(self.candidates) - 1)
+
+        n_events = count[rows, index]
+        valid = n_events >= self.min_events
+        b = np.where(valid, b_value[rows, index], np.nan)
+        mc_value = self.candidates[index]
+        with np.errstate(divide='ignore'):
+            a = np.log10(n_events) + b * mc_value
+
+        return {
+            'mc': mc_value,
+            'n_events': n_events,
+            'b_value': b,
+            'b_std_error': np.where(valid, b_std[rows, index], np.nan),
+            'a_value': a
+        }
+
+    def candidate_fits(self):
+        """
+        Fit the b-value at every candidate completeness magnitude.
+
+        Returns:
+            dict: Candidate Mc values with the number of events, b-value and
+                its standard error above each
+        """
+        count, b_value, b_std = self._candidate_b_values(
+            self.magnitudes, np.array([0, len(self.magnitudes)]))
+
+        return {
+            'mc': self.candidates,
+            'n_events': count[0],
+            'b_value': b_value[0],
+            'b_std_error': b_std[0]
+        }
+
+    def fit(self, mc=None, method='maxc', maxc_correction=0.2, gft_level=90.0):
+        """
+        Estimate Mc and the Gutenberg-Richter a- and b-values.
+
+        Args:
+            mc (float, optional): Fixed completeness magnitude; estimated if
+                omitted
+            method (str): 'maxc' for maximum curvature plus maxc_correction,
+                or 'gft' for the goodness-of-fit test
+            maxc_correction (float): Magnitude added to the maximum curvature
+            gft_level (float): Required goodness of fit in percent
+
+        Returns:
+            dict: mc, n_events, b_value, b_std_error and a_value
+        """
+        result = self._fit_groups(self.magnitudes, np.array([0, len(self.magnitudes)]),
+                                  mc, method, maxc_correction, gft_level)
+        return {key: value[0] for key, value in result.items()}
+
+    def fit_regions(self, labels, mc=None, method='maxc', maxc_correction=0.2,
+                    gft_level=90.0):
+        """
+        Fit every regional sub-catalog in one pass.
+
+        Args:
+            labels (array_like): Region label of every event, in the order
+                the magnitudes were given
+            mc (float, optional): Fixed completeness magnitude for all regions
+            method (str): Completeness method, see fit
+            maxc_correction (float): Magnitude added to the maximum curvature
+            gft_level (float): Required goodness of fit in percent
+
+        Returns:
+            dict: Region labels and (G,) arrays of every fitted quantity
+        """
+        labels = np.asarray(labels)
+        if labels.shape != self.magnitudes.shape:
+            raise ValueError("labels must have one entry per event")
+
+        # One sort by (region, magnitude) makes every region contiguous
+        order = np.lexsort((self._unsorted_magnitudes, labels))
+        regions, starts = np.unique(labels[order], return_index=True)
+        bounds = np.append(starts, len(labels))
+
+        result = self._fit_groups(self._unsorted_magnitudes[order], bounds, mc, method,
+                                  maxc_correction, gft_level)
+        result['region'] = regions
+        return result
+
+    def bootstrap(self, n_bootstrap=1000, confidence_level=0.95, mc=None,
+                  method='maxc', chunk_size=2_000_000, rng=None, **kwargs):
+        """
+        Bootstrap confidence intervals of Mc and the b-value.
+
+        Resamples are drawn as (rows, n) index matrices with rows * n at most
+        chunk_size, sorted row by row and fitted together, so memory stays
+        O(chunk_size) however large the catalog is.
+
+        Args:
+            n_bootstrap (int): Number of resamples B
+            confidence_level (float): Coverage of the percentile intervals
+            mc (float, optional): Fixed completeness magnitude; otherwise Mc
+                is re-estimated in every resample
+            method (str): Completeness method, see fit
+            chunk_size (int): Maximum number of resampled magnitudes
+                fitted per block; at least one resample is always fitted
+            rng (numpy.random.Generator or int, optional): Generator or seed
+            **kwargs: maxc_correction and gft_level
+
+        Returns:
+            dict: Point fit, (B,) replicates of mc and b_value, and percentile
+                confidence intervals of both
+        """
+        rng = np.random.default_rng(rng)
+        n = len(self.magnitudes)
+        mc_replicates = np.empty(n_bootstrap)
+        b_replicates = np.empty(n_bootstrap)
+        rows_per_chunk = max(1, chunk_size // n)
+
+        for start in range(0, n_bootstrap, rows_per_chunk):
+            stop = min(start + rows_per_chunk, n_bootstrap)
+            # Resampling from sorted magnitudes: sorting the indices sorts rows
+            index = np.sort(rng.integers(0, n, size=(stop - start, n)), axis=1)
+            bounds = np.arange(stop - start + 1) * n
+            result = self._fit_groups(self.magnitudes[index].ravel(), bounds,
+                                      mc, method, **kwargs)
+            mc_replicates[start:stop] = result['mc']
+            b_replicates[start:stop] = result['b_value']
+
+        tail = 100 * (1 - confidence_level) / 2
+        return {
+            'fit': self.fit(mc, method, **kwargs),
+            'mc_replicates': mc_replicates,
+            'b_replicates': b_replicates,
+            'mc_interval': tuple(np.nanpercentile(mc_replicates, [tail, 100 - tail])),
+            'b_interval': tuple(np.nanpercentile(b_replicates, [tail, 100 - tail]))
+        }
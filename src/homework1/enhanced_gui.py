@@ -295,15 +295,24 @@ class ProblemTabWidget(QWidget):
         elif "problem4_mechanical_failure" in problem_file:
             self.generate_mechanical_failure_figures()
     
-    def generate_tuberculosis_figures(self) -> None:
+    def generate_tuberculosis_figures(self, prevalence: float = 0.004,
+                                      sensitivity: float = 0.80,
+                                      specificity: float = 0.90) -> None:
         """Generate figures for tuberculosis test problem."""
+        from problem1_tuberculosis_test import analyze_scenario_grid
+        
+        # The closed form is cheaper than any table lookup, even for arrays
+        results = analyze_scenario_grid(prevalence, sensitivity, specificity)
+        ppv = float(results["ppv"])
+        npv = float(results["npv"])
+        
         # Prior vs Posterior Probability
         fig1 = Figure(figsize=(8, 6))
         ax1 = fig1.add_subplot(111)
         
         categories = ["Disease Present", "Disease Absent"]
-        prior_probs = [0.004, 0.996]
-        posterior_probs = [0.0311, 0.9689]
+        prior_probs = [prevalence, 1 - prevalence]
+        posterior_probs = [ppv, 1 - ppv]
         
         x = np.arange(len(categories))
         width = 0.35
@@ -326,7 +335,7 @@ class ProblemTabWidget(QWidget):
         ax2 = fig2.add_subplot(111)
         
         metrics = ["Sensitivity", "Specificity", "PPV", "NPV"]
-        values = [0.80, 0.90, 0.0311, 0.9996]
+        values = [sensitivity, specificity, ppv, npv]
         colors = ["green", "blue", "orange", "red"]
         
         bars = ax2.bar(metrics, values, color=colors, alpha=0.7)
@@ -343,28 +352,36 @@ class ProblemTabWidget(QWidget):
         ax2.grid(True, alpha=0.3)
         
         self.figure_tabs.add_figure("Test Performance", fig2)
+        
+        # Posterior across prevalences for the current test accuracy
+        fig3 = Figure(figsize=(8, 6))
+        ax3 = fig3.add_subplot(111)
+        
+        prevalence_sweep = np.geomspace(1e-4, 0.5, 200)
+        sweep = surface.query(prevalence_sweep, sensitivity, specificity)
+        
+        ax3.semilogx(prevalence_sweep, sweep["ppv"], label="PPV", linewidth=2)
+        ax3.semilogx(prevalence_sweep, 1 - sweep["npv"],
+                     label="P(disease | negative)", linewidth=2)
+        ax3.axvline(prevalence, color="gray", linestyle="--", alpha=0.7)
+        ax3.set_xlabel("Prevalence")
+        ax3.set_ylabel("Posterior Probability")
+        ax3.set_title("Posterior Probability vs Prevalence")
+        ax3.legend()
+        ax3.grid(True, alpha=0.3)
+        
+        self.figure_tabs.add_figure("Posterior vs Prevalence", fig3)
     
     def generate_discrete_variables_figures(self) -> None:
         """Generate figures for discrete random variables problem."""
-        # Probability Mass Function
-        fig1 = Figure(figsize=(10, 6))
-        ax1 = fig1.add_subplot(111)
+        from problem2_discrete_random_variables import CategoricalRandomVariable
         
         x_values = [0, 1, 2, 3]
         probabilities = [0.3, 0.1, 0.2, 0.4]
         
-        bars = ax1.bar(x_values, probabilities, alpha=0.7, color="skyblue", edgecolor="navy")
-        ax1.set_xlabel("X Values")
-        ax1.set_ylabel("Probability P(X = x)")
-        ax1.set_title("Probability Mass Function")
-        ax1.set_xticks(x_values)
-        ax1.grid(True, alpha=0.3)
-        
-        # Add value labels on bars
-        for bar, prob in zip(bars, probabilities):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                    f"{prob:.2f}", ha="center", va="bottom")
+        # Probability Mass Function, built without pyplot so nothing blocks
+        rv = CategoricalRandomVariable(probabilities)
+        fig1 = rv.plot_pmf(show=False)
         
         self.figure_tabs.add_figure("Probability Mass Function", fig1)
         
@@ -23,24 +23,112 @@ Learning Objectives:
 - Evaluate the clinical usefulness of diagnostic tests
 """
 
+import numpy as np
+
+
+def analyze_scenario_grid(prevalence, sensitivity, specificity):
+    """
+    Evaluate Bayes' theorem over whole grids of test scenarios at once.
+    
+    The three inputs are broadcast against each other, so passing e.g. a
+    column of prevalences and a row of sensitivities yields every
+    combination in a single vectorized pass.
+    
+    Args:
+        prevalence (array_like): Prior probability of disease P(B|I)
+        sensitivity (array_like): True positive rate P(A|B,I)
+        specificity (array_like): True negative rate P(not A|not B,I)
+        
+    Returns:
+        dict: Arrays of the broadcast shape with the prior, posterior,
+            likelihood ratio, odds ratio, PPV, NPV and P(positive)
+    """
+    prevalence, sensitivity, specificity = np.broadcast_arrays(
+        np.asarray(prevalence, dtype=float),
+        np.asarray(sensitivity, dtype=float),
+        np.asarray(specificity, dtype=float)
+    )
+    for name, values in (('prevalence', prevalence),
+                         ('sensitivity', sensitivity),
+                         ('specificity', specificity)):
+        if np.any((values < 0) | (values > 1)):
+            raise ValueError(f"{name} values must lie in [0, 1]")
+    
+    # Joint probabilities of the four (disease, result) cells
+    true_positive = sensitivity * prevalence
+    false_positive = (1 - specificity) * (1 - prevalence)
+    true_negative = specificity * (1 - prevalence)
+    false_negative = (1 - sensitivity) * prevalence
+    
+    p_positive = true_positive + false_positive
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ppv = true_positive / p_positive
+        npv = true_negative / (true_negative + false_negative)
+        likelihood_ratio = sensitivity / (1 - specificity)
+        
+        # Posterior odds over prior odds, formed from the joint cells so
+        # that tiny prevalences do not lose precision in 1 - posterior
+        odds_ratio = ((true_positive / false_positive) /
+                      (prevalence / (1 - prevalence)))
+    
+    return {
+        'prior_probability': prevalence,
+        'posterior_probability': ppv,
+        'likelihood_ratio': likelihood_ratio,
+        'odds_ratio': odds_ratio,
+        'ppv': ppv,
+        'npv': npv,
+        'p_positive': p_positive
+    }
+
 
 class TuberculosisTestAnalyzer:
     """Analyzer for tuberculosis test assessment problem."""
     
-    def __init__(self):
-        """Initialize the analyzer with given probabilities."""
+    def __init__(self, p_disease=0.004, sensitivity=0.80, specificity=0.90):
+        """
+        Initialize the analyzer with given probabilities.
+        
+        Args:
+            p_disease (float): Prevalence of tuberculosis (default 0.4%)
+            sensitivity (float): True positive rate of the test (default 80%)
+            specificity (float): True negative rate of the test (default 90%)
+        """
         # Prior information
-        self.p_disease = 0.004  # 0.4% of population has tuberculosis
+        self.p_disease = p_disease
         
         # Test accuracy
-        self.p_positive_given_disease = 0.80  # 80% true positive rate
-        self.p_negative_given_no_disease = 0.90  # 90% true negative rate
+        self.p_positive_given_disease = sensitivity
+        self.p_negative_given_no_disease = specificity
         
-        # Calculate derived probabilities
+        self._update_derived_probabilities()
+    
+    def _update_derived_probabilities(self):
+        """Calculate the complementary probabilities from the base ones."""
         self.p_no_disease = 1 - self.p_disease
         self.p_positive_given_no_disease = 1 - self.p_negative_given_no_disease
         self.p_negative_given_disease = 1 - self.p_positive_given_disease
     
+    def update_parameters(self, p_disease=None, sensitivity=None,
+                          specificity=None):
+        """
+        Replace some or all of the analyzer's probabilities in place.
+        
+        Args:
+            p_disease (float, optional): New prevalence of tuberculosis
+            sensitivity (float, optional): New true positive rate
+            specificity (float, optional): New true negative rate
+        """
+        if p_disease is not None:
+            self.p_disease = p_disease
+        if sensitivity is not None:
+            self.p_positive_given_disease = sensitivity
+        if specificity is not None:
+            self.p_negative_given_no_disease = specificity
+        
+        self._update_derived_probabilities()
+    
     def calculate_prior_probability(self):
         """
         Calculate the prior probability that a patient has tuberculosis.
@@ -103,6 +191,31 @@ class TuberculosisTestAnalyzer:
                 'specificity': self.p_negative_given_no_disease
             }
         }
+    
+    def analyze_scenario_grid(self, prevalence=None, sensitivity=None,
+                              specificity=None):
+        """
+        Vectorized counterpart of analyze_test_usefulness.
+        
+        Any argument left as None falls back to the analyzer's own scalar
+        value, so a single axis can be swept while the others stay fixed.
+        
+        Args:
+            prevalence (array_like, optional): Prior probabilities of disease
+            sensitivity (array_like, optional): True positive rates
+            specificity (array_like, optional): True negative rates
+            
+        Returns:
+            dict: Dictionary of arrays, see analyze_scenario_grid
+        """
+        if prevalence is None:
+            prevalence = self.p_disease
+        if sensitivity is None:
+            sensitivity = self.p_positive_given_disease
+        if specificity is None:
+            specificity = self.p_negative_given_no_disease
+        
+        return analyze_scenario_grid(prevalence, sensitivity, specificity)
 
 
 def main():
@@ -29,26 +29,282 @@ Learning Objectives:
 
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy import stats
+from matplotlib.figure import Figure
+from scipy import special, stats
+
+from categorical_alias import AliasTable
+from categorical_streaming import StreamingComparator
+
+
+# Supports up to this size are drawn as individual labelled bars
+DETAILED_PLOT_CATEGORIES = 50
+
+
+def pmf_envelope(values, probabilities, n_bins):
+    """
+    Aggregate a PMF on a sorted support into equal-width bins.
+    
+    Each bin keeps the largest probability that falls into it, so the drawn
+    outline touches the top of every bar a full-resolution plot would show.
+    
+    Args:
+        values (array_like): Sorted numeric support values
+        probabilities (array_like): Probability of each value
+        n_bins (int): Number of bins, typically the plot width in pixels
+        
+    Returns:
+        tuple: (edges, heights) with n_bins + 1 edges and n_bins heights
+    """
+    values = np.asarray(values, dtype=float)
+    probabilities = np.asarray(probabilities, dtype=float)
+    low, high = values[0], values[-1]
+    if high == low:
+        high = low + 1.0
+    
+    edges = np.linspace(low, high, n_bins + 1)
+    bins = np.minimum(np.searchsorted(edges, values, side='right') - 1, n_bins - 1)
+    
+    # The support is sorted, so each bin is a contiguous run of categories
+    starts = np.flatnonzero(np.diff(bins, prepend=-1))
+    heights = np.zeros(n_bins)
+    heights[bins[starts]] = np.maximum.reduceat(probabilities, starts)
+    return edges, heights
+
+
+def multinomial_log_likelihood(counts, probabilities, chunk_size=4096):
+    """
+    Score many count vectors against many categorical models at once.
+    
+    For counts c with total n and a model p over the same K categories,
+    
+        log L = log n! - sum_k log c_k! + sum_k c_k log p_k
+    
+    The last term for every (count vector, model) pair is one entry of the
+    matrix product counts @ log(P).T. Categories with zero probability add
+    nothing when unobserved and make the likelihood zero when observed.
+    
+    Args:
+        counts (array_like): (M, K) observed counts, or a single (K,) vector
+        probabilities (array_like): (N, K) model PMFs, or a single (K,) PMF
+        chunk_size (int): Count rows processed per block, bounding the
+            temporary memory to O(chunk_size * N)
+        
+    Returns:
+        numpy.ndarray: (M, N) log-likelihoods, -inf for impossible pairs
+    """
+    counts = np.atleast_2d(np.asarray(counts, dtype=float))
+    probabilities = np.atleast_2d(np.asarray(probabilities, dtype=float))
+    if counts.shape[1] != probabilities.shape[1]:
+        raise ValueError("counts and probabilities must have the same number of categories")
+    if np.any(counts < 0) or np.any(probabilities < 0):
+        raise ValueError("counts and probabilities must be non-negative")
+    
+    zero = probabilities == 0
+    with np.errstate(divide='ignore'):
+        log_p = np.where(zero, 0.0, np.log(probabilities))
+    has_zero = np.any(zero)
+    
+    # Multinomial coefficient depends only on the counts
+    coefficient = (special.gammaln(counts.sum(axis=1) + 1) -
+                   special.gammaln(counts + 1).sum(axis=1))
+    
+    result = np.empty((counts.shape[0], probabilities.shape[0]))
+    for start in range(0, counts.shape[0], chunk_size):
+        block = counts[start:start + chunk_size]
+        out = result[start:start + chunk_size]
+        np.matmul(block, log_p.T, out=out)
+        out += coefficient[start:start + chunk_size, None]
+        if has_zero:
+            impossible = (block > 0).astype(float) @ zero.T.astype(float) > 0
+            out[impossible] = -np.inf
+    return result
 
 
 class CategoricalRandomVariable:
     """Analyzer for categorical random variable problems."""
     
-    def __init__(self, probabilities):
+    def __init__(self, probabilities, values=None):
         """
         Initialize with probability mass function.
         
         Args:
             probabilities (list): List of probabilities for values [0, 1, 2, 3]
+            values (list, optional): Support values matching the
+                probabilities, for sparse or arbitrary supports; defaults to
+                0, 1, ..., K-1
+        """
+        self.set_pmf(probabilities, values)
+    
+    @classmethod
+    def from_dict(cls, pmf):
+        """
+        Create a variable from a {value: probability} mapping.
+        
+        Args:
+            pmf (dict): Probability of every value with non-zero mass
+            
+        Returns:
+            CategoricalRandomVariable: Variable on the given sparse support
+        """
+        return cls(list(pmf.values()), list(pmf.keys()))
+    
+    @property
+    def probabilities(self):
+        """numpy.ndarray: Probability of each value of X."""
+        return self._probabilities
+    
+    @probabilities.setter
+    def probabilities(self, probabilities):
+        """Replace the PMF on the default support 0, 1, ..., K-1."""
+        self.set_pmf(probabilities)
+    
+    def set_pmf(self, probabilities, values=None):
+        """
+        Replace the PMF and invalidate everything derived from it.
+        
+        Only the (value, probability) pairs are stored, sorted by value, so
+        a few thousand outcomes spread over a huge range cost O(nnz) memory.
+        
+        Args:
+            probabilities (array_like): Probability of each value
+            values (array_like, optional): Support values; defaults to
+                0, 1, ..., K-1
+        """
+        probabilities = np.array(probabilities, dtype=float)
+        if np.any(probabilities < 0):
+            raise ValueError("probabilities must be non-negative")
+        if not np.isclose(np.sum(probabilities), 1.0):
+            raise ValueError("probabilities must sum to 1")
+        if values is None:
+            values = np.arange(len(probabilities))
+        else:
+            values = np.array(values)
+            if values.shape != probabilities.shape:
+                raise ValueError("values and probabilities must have the same length")
+            order = np.argsort(values, kind='stable')
+            values = values[order]
+            probabilities = probabilities[order]
+            if np.any(values[1:] == values[:-1]):
+                raise ValueError("values must be unique")
+        
+        self._probabilities = probabilities
+        self.values = values
+        
+        # Derived objects are built lazily on first use
+        self._rv = None
+        self._moments = None
+        self._alias_table = None
+    
+    def pmf(self, x):
         """
-        self.probabilities = np.array(probabilities)
-        self.values = np.arange(len(probabilities))
+        Look up P(X = x) for arbitrary points.
         
-        # Create scipy discrete random variable
-        self.rv = stats.rv_discrete(
-            values=(self.values, self.probabilities)
-        )
+        Args:
+            x (array_like): Points at which to evaluate the PMF
+            
+        Returns:
+            numpy.ndarray: Probabilities, zero off the support
+        """
+        x = np.asarray(x)
+        idx = np.minimum(np.searchsorted(self.values, x), len(self.values) - 1)
+        return np.where(self.values[idx] == x, self.probabilities[idx], 0.0)
+    
+    @property
+    def rv(self):
+        """scipy.stats.rv_discrete: Equivalent scipy random variable."""
+        if self._rv is None:
+            self._rv = stats.rv_discrete(
+                values=(self.values, self.probabilities)
+            )
+        return self._rv
+    
+    @property
+    def alias_table(self):
+        """AliasTable: Reusable O(1)-per-draw sampler for this PMF."""
+        if self._alias_table is None:
+            self._alias_table = AliasTable(self.probabilities, self.values)
+        return self._alias_table
+    
+    @property
+    def moments(self):
+        """dict: Cached moment bundle, see calculate_moments."""
+        if self._moments is None:
+            self._moments = self.calculate_moments()
+        return self._moments
+    
+    def calculate_moments(self):
+        """
+        Calculate all summary statistics in one pass over the PMF.
+        
+        Returns:
+            dict: Mean, variance, standard deviation, skewness, excess
+                kurtosis, entropy (nats) and the CDF table
+        """
+        p = self.probabilities
+        x = self.values.astype(float)
+        
+        mean = p @ x
+        deviation = x - mean
+        weighted = p * deviation * deviation
+        variance = np.sum(weighted)
+        third = weighted @ deviation
+        fourth = (weighted * deviation) @ deviation
+        std = np.sqrt(variance)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            skewness = third / std ** 3
+            kurtosis = fourth / variance ** 2 - 3
+        
+        return {
+            'mean': mean,
+            'variance': variance,
+            'std': std,
+            'skewness': skewness,
+            'kurtosis': kurtosis,
+            'entropy': np.sum(special.entr(p)),
+            'cdf': np.cumsum(p)
+        }
+    
+    def cdf(self, x):
+        """
+        Evaluate the cumulative distribution function F(x) = P(X <= x).
+        
+        Args:
+            x (array_like): Points at which to evaluate the CDF
+            
+        Returns:
+            numpy.ndarray: CDF values
+        """
+        idx = np.searchsorted(self.values, x, side='right')
+        table = np.concatenate(([0.0], self.moments['cdf']))
+        return table[idx]
+    
+    def quantile(self, q):
+        """
+        Evaluate the quantile function, the smallest x with F(x) >= q.
+        
+        Args:
+            q (array_like): Probability levels in [0, 1]
+            
+        Returns:
+            numpy.ndarray: Quantiles of X
+        """
+        idx = np.searchsorted(self.moments['cdf'], q, side='left')
+        # A final CDF value a few ulps below one must not run off the end
+        return self.values[np.minimum(idx, len(self.values) - 1)]
+    
+    def sample(self, size, rng=None):
+        """
+        Draw random values of X using the alias method.
+        
+        Args:
+            size (int or tuple): Number or shape of samples
+            rng (numpy.random.Generator or int, optional): Generator or seed
+            
+        Returns:
+            numpy.ndarray: Samples from the distribution
+        """
+        return self.alias_table.sample(size, rng=rng)
     
     def calculate_expectation(self):
         """
@@ -57,7 +313,7 @@ class CategoricalRandomVariable:
         Returns:
             float: Expected value of the random variable
         """
-        return self.rv.expect()
+        return self.moments['mean']
     
     def calculate_variance(self):
         """
@@ -66,38 +322,71 @@ class CategoricalRandomVariable:
         Returns:
             float: Variance of the random variable
         """
-        return self.rv.var()
+        return self.moments['variance']
     
-    def plot_pmf(self, save_path=None):
+    def plot_pmf(self, save_path=None, show=True, top_k=10, figsize=(10, 6), dpi=100):
         """
         Plot the probability mass function of X.
         
+        Small supports are drawn as labelled bars. Larger supports are
+        aggregated into one bin per horizontal pixel and drawn as a single
+        filled stairs artist, with only the top_k most likely values labelled,
+        so the cost no longer grows with the number of categories.
+        
         Args:
             save_path (str, optional): Path to save the plot
+            show (bool): If True draw with pyplot and show the figure; if
+                False build a standalone Figure without touching pyplot, e.g.
+                for embedding in the GUI's figure tabs
+            top_k (int): Number of values labelled on large supports; zero
+                or less labels none
+            figsize (tuple): Figure size in inches
+            dpi (int): Figure resolution, which sets the number of bins
+            
+        Returns:
+            matplotlib.figure.Figure: The PMF figure
         """
-        plt.figure(figsize=(10, 6))
+        fig = plt.figure(figsize=figsize, dpi=dpi) if show else Figure(figsize=figsize, dpi=dpi)
+        ax = fig.add_subplot(111)
+        values, probabilities = self.values, self.probabilities
         
-        # Create bar plot
-        bars = plt.bar(self.values, self.probabilities, 
-                      alpha=0.7, color='skyblue', edgecolor='navy')
+        if len(values) <= DETAILED_PLOT_CATEGORIES:
+            bars = ax.bar(values, probabilities,
+                          alpha=0.7, color='skyblue', edgecolor='navy')
+            
+            # Add value labels on bars
+            for bar, prob in zip(bars, probabilities):
+                height = bar.get_height()
+                ax.text(bar.get_x() + bar.get_width()/2., height + 0.01,
+                        f'{prob:.2f}', ha='center', va='bottom')
+            ax.set_xticks(values)
+        else:
+            n_bins = min(len(values), int(figsize[0] * dpi))
+            edges, heights = pmf_envelope(values, probabilities, n_bins)
+            ax.stairs(heights, edges, fill=True, alpha=0.7,
+                      facecolor='skyblue', edgecolor='navy')
+            
+            # Label only the most likely values
+            top_k = min(max(top_k, 0), len(values))
+            top = (np.argpartition(probabilities, len(values) - top_k)[len(values) - top_k:]
+                   if top_k else [])
+            for i in top:
+                ax.annotate(f'{probabilities[i]:.2g}', (values[i], probabilities[i]),
+                            xytext=(0, 3), textcoords='offset points',
+                            ha='center', va='bottom', fontsize=8)
         
-        # Add value labels on bars
-        for bar, prob in zip(bars, self.probabilities):
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                    f'{prob:.2f}', ha='center', va='bottom')
-        
-        plt.xlabel('Values')
-        plt.ylabel('Probability')
-        plt.title('Probability Mass Function of Categorical Random Variable')
-        plt.xticks(self.values)
-        plt.grid(True, alpha=0.3)
-        plt.ylim(0, max(self.probabilities) * 1.1)
+        ax.set_xlabel('Values')
+        ax.set_ylabel('Probability')
+        ax.set_title('Probability Mass Function of Categorical Random Variable')
+        ax.grid(True, alpha=0.3)
+        ax.set_ylim(0, max(probabilities) * 1.1)
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
         
-        plt.show()
+        if show:
+            plt.show()
+        return fig
     
     def get_statistics(self):
         """
@@ -106,10 +395,14 @@ class CategoricalRandomVariable:
         Returns:
             dict: Dictionary containing various statistics
         """
+        moments = self.moments
         return {
-            'expectation': self.calculate_expectation(),
-            'variance': self.calculate_variance(),
-            'standard_deviation': np.sqrt(self.calculate_variance()),
+            'expectation': moments['mean'],
+            'variance': moments['variance'],
+            'standard_deviation': moments['std'],
+            'skewness': moments['skewness'],
+            'kurtosis': moments['kurtosis'],
+            'entropy': moments['entropy'],
             'probabilities': dict(zip(self.values, self.probabilities))
         }
 
@@ -141,6 +434,17 @@ def main():
     for value, prob in stats_dict['probabilities'].items():
         print(f"  P(X = {value}) = {prob:.2f}")
     
+    # Compare with a sample of 1000 values
+    comparator = StreamingComparator(rv)
+    report = comparator.consume([rv.sample(1000, rng=0)])
+    print(f"\nTheoretical vs Empirical Statistics (1000 samples):")
+    print(f"Mean: {report['theoretical_mean']:.2f} vs {report['empirical_mean']:.2f}")
+    print(f"Variance: {report['theoretical_variance']:.2f} vs "
+          f"{report['empirical_variance']:.2f}")
+    print(f"Chi-square = {report['chi_square']:.2f} "
+          f"(p = {report['chi_square_p_value']:.3f})")
+    print(f"Total variation distance = {report['total_variation']:.3f}")
+    
     # Plot PMF
     print(f"\nC. Plotting Probability Mass Function...")
     rv.plot_pmf()
@@ -7,22 +7,80 @@ earthquakes in Southern California.
 
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy import stats
+
+from earthquake_poisson import PoissonRateModel
 
 
 class EarthquakeAnalyzer:
     """Analyzer for earthquake prediction problems."""
     
-    def __init__(self, earthquake_data):
+    def __init__(self, earthquake_data, periods=None):
         """
         Initialize with earthquake data.
         
         Args:
             earthquake_data (array): Array of earthquake counts per decade
+            periods (array, optional): Start year of every count's window;
+                defaults to consecutive decades from 1900
+        """
+        self.data_version = 0
+        self.set_data(earthquake_data, periods)
+    
+    @property
+    def earthquake_data(self):
+        """numpy.ndarray: Earthquake counts per window."""
+        return self._earthquake_data
+    
+    @earthquake_data.setter
+    def earthquake_data(self, earthquake_data):
+        """Replace the counts, keeping the current windows."""
+        self.set_data(earthquake_data)
+    
+    def set_data(self, earthquake_data, periods=None):
         """
-        self.earthquake_data = np.array(earthquake_data)
-        self.decades = np.arange(1900, 2020, 10)
+        Replace the counts and invalidate the fitted model.
+        
+        Counts edited in place must also be passed back through set_data so
+        the cached model is refitted.
         
+        Args:
+            earthquake_data (array): Earthquake counts per window
+            periods (array, optional): Start year of every count's window;
+                defaults to the current windows, or to consecutive decades
+                from 1900 when the analyzer is first created
+        """
+        earthquake_data = np.array(earthquake_data)
+        if periods is None:
+            current = getattr(self, 'decades', None)
+            if current is None:
+                periods = 1900 + 10 * np.arange(len(earthquake_data))
+            elif len(current) == len(earthquake_data):
+                periods = current
+            else:
+                raise ValueError("counts of a different length need explicit periods")
+        periods = np.asarray(periods)
+        if periods.shape != earthquake_data.shape:
+            raise ValueError("periods must have one entry per count")
+        
+        self._earthquake_data = earthquake_data
+        self.decades = periods
+        self.data_version += 1
+        self._model = None
+    
+    @property
+    def window_years(self):
+        """float: Width of the count windows in years."""
+        if len(self.decades) < 2:
+            return 10.0
+        return float(np.mean(np.diff(self.decades)))
+    
+    @property
+    def model(self):
+        """PoissonRateModel: Poisson fit, computed once per data version."""
+        if self._model is None:
+            self._model = PoissonRateModel(self.earthquake_data, self.window_years)
+        return self._model
+    
     def calculate_statistics(self):
         """
         Calculate basic statistics of earthquake occurrences.
@@ -48,22 +106,15 @@ class EarthquakeAnalyzer:
         Returns:
             dict: Fitted model parameters and statistics
         """
-        # Estimate lambda (rate parameter) from data
-        lambda_estimate = np.mean(self.earthquake_data)
-        
-        # Create Poisson distribution
-        poisson_rv = stats.poisson(lambda_estimate)
-        
-        # Calculate goodness of fit
-        observed = self.earthquake_data
-        expected = poisson_rv.pmf(np.arange(max(observed) + 1))
+        # The fit itself is cached until the data changes
+        model = self.model
         
         return {
-            'lambda_estimate': lambda_estimate,
-            'poisson_distribution': poisson_rv,
+            'lambda_estimate': model.lambda_estimate,
+            'poisson_distribution': model.distribution,
             'model_fit': {
-                'observed': observed,
-                'expected': expected
+                'observed': model.observed,
+                'expected': model.expected
             }
         }
     
@@ -72,18 +123,15 @@ class EarthquakeAnalyzer:
         Predict probability of major earthquakes in the next decade.
         
         Args:
-            threshold (int): Minimum number of earthquakes to consider "major"
+            threshold (int or array): Minimum number of earthquakes to
+                consider "major"; arrays give one probability per threshold
             
         Returns:
             float: Probability of threshold or more earthquakes
         """
-        poisson_model = self.fit_poisson_model()
-        lambda_est = poisson_model['lambda_estimate']
-        
-        # P(X >= threshold) = 1 - P(X < threshold)
-        probability = 1 - stats.poisson.cdf(threshold - 1, lambda_est)
+        probability = self.model.exceedance(threshold, horizons=10.0)
         
-        return probability
+        return probability if np.ndim(probability) else float(probability)
     
     def plot_earthquake_data(self, save_path=None):
         """
@@ -135,8 +183,7 @@ class EarthquakeAnalyzer:
         Args:
             save_path (str, optional): Path to save the plot
         """
-        poisson_model = self.fit_poisson_model()
-        lambda_est = poisson_model['lambda_estimate']
+        lambda_est = self.model.lambda_estimate
         
         plt.figure(figsize=(10, 6))
         
@@ -150,7 +197,7 @@ class EarthquakeAnalyzer:
         
         # Plot Poisson model
         x_range = np.arange(0, max(unique_counts) + 3)
-        poisson_prob = stats.poisson.pmf(x_range, lambda_est)
+        poisson_prob = self.model.pmf(x_range)
         
         plt.plot(x_range, poisson_prob, 'bo-', linewidth=2, 
                 markersize=8, label=f'Poisson(λ={lambda_est:.2f})')
@@ -0,0 +1,250 @@
+"""
+Pooled (Dorfman) Group Testing for Tuberculosis Screening
+
+At the 0.4% prevalence of Problem 1 almost every sample is negative, so
+testing pooled samples first and retesting only the members of positive pools
+saves most of the assays. This module uses the sensitivity and specificity of
+a TuberculosisTestAnalyzer to evaluate pooling schemes with an imperfect test.
+
+A hierarchical scheme is described by its stage sizes, e.g. (16, 4, 1): pools
+of 16 are tested, positive pools are split into pools of 4, and positive
+pools of 4 are resolved individually. Dorfman testing is the two-stage scheme
+(k, 1). Test errors are assumed independent across stages and pool size is
+assumed not to dilute the sensitivity.
+
+Every calculation broadcasts over arrays of prevalences and pool sizes.
+"""
+
+import numpy as np
+
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer, analyze_scenario_grid
+from tuberculosis_screening_sim import ConfusionMatrix
+
+
+def hierarchical_scheme(prevalence, stage_sizes, sensitivity, specificity):
+    """
+    Evaluate a hierarchical pooling scheme with an imperfect test.
+
+    Args:
+        prevalence (array_like): Probability that an individual is diseased
+        stage_sizes (sequence): Pool size at every stage, largest first and
+            ending with 1; entries may be arrays that broadcast against the
+            prevalence
+        sensitivity (float): Probability a pool containing disease tests positive
+        specificity (float): Probability a disease-free pool tests negative
+
+    Returns:
+        dict: Arrays of expected tests per person, the sensitivity and
+            specificity of the overall classification, and PPV/NPV
+    """
+    q = 1 - np.asarray(prevalence, dtype=float)
+    sizes = [np.asarray(size, dtype=float) for size in stage_sizes]
+    if len(sizes) < 2 or np.any(sizes[-1] != 1):
+        raise ValueError("stage_sizes must have at least two stages and end with 1")
+
+    se = sensitivity
+    fp = 1 - specificity
+    n_stages = len(sizes)
+
+    def chain_positive_given_clean(j):
+        # P(pools at stages 1..j all test positive | the stage-j pool is clean).
+        # The largest ancestors may still hold disease; l is the deepest stage
+        # whose pool does, so stages 1..l test with Se and l+1..j with 1 - Sp.
+        total = 0.0
+        for l in range(j):
+            clean_below = q ** (sizes[l] - sizes[j - 1])
+            clean_at = q ** (sizes[l - 1] - sizes[j - 1]) if l > 0 else 0.0
+            total = total + (clean_below - clean_at) * se ** l * fp ** (j - l)
+        return total
+
+    expected_tests = 1 / sizes[0]
+    for j in range(1, n_stages):
+        clean = q ** sizes[j - 1]
+        p_chain = (1 - clean) * se ** j + clean * chain_positive_given_clean(j)
+        expected_tests = expected_tests + p_chain / sizes[j]
+
+    pooled_sensitivity = se ** n_stages
+    pooled_specificity = 1 - chain_positive_given_clean(n_stages)
+
+    expected_tests, pooled_specificity = np.broadcast_arrays(
+        expected_tests, pooled_specificity
+    )
+    predictive = analyze_scenario_grid(1 - q, pooled_sensitivity, pooled_specificity)
+
+    return {
+        'expected_tests_per_person': expected_tests,
+        'sensitivity': np.broadcast_to(pooled_sensitivity, expected_tests.shape),
+        'specificity': pooled_specificity,
+        'ppv': predictive['ppv'],
+        'npv': predictive['npv']
+    }
+
+
+class GroupTestingPlanner:
+    """Planner for pooled testing built on the tuberculosis analyzer."""
+
+    def __init__(self, analyzer=None):
+        """
+        Initialize with the test characteristics of an analyzer.
+
+        Args:
+            analyzer (TuberculosisTestAnalyzer, optional): Source of the
+                prevalence, sensitivity and specificity
+        """
+        self.analyzer = analyzer if analyzer is not None else TuberculosisTestAnalyzer()
+
+    @property
+    def sensitivity(self):
+        """float: Sensitivity of a single assay."""
+        return self.analyzer.p_positive_given_disease
+
+    @property
+    def specificity(self):
+        """float: Specificity of a single assay."""
+        return self.analyzer.p_negative_given_no_disease
+
+    def dorfman(self, pool_size, prevalence=None):
+        """
+        Evaluate two-stage Dorfman pooling.
+
+        Args:
+            pool_size (array_like): Pool size(s); size 1 means individual testing
+            prevalence (array_like, optional): Prevalence(s); defaults to the
+                analyzer's p_disease
+
+        Returns:
+            dict: Arrays of expected tests per person, sensitivity,
+                specificity, PPV and NPV
+        """
+        if prevalence is None:
+            prevalence = self.analyzer.p_disease
+        pool_size = np.asarray(pool_size)
+
+        results = hierarchical_scheme(prevalence, (pool_size, 1),
+                                      self.sensitivity, self.specificity)
+
+        # A "pool" of one is simply individual testing
+        individual = analyze_scenario_grid(prevalence, self.sensitivity, self.specificity)
+        single = np.broadcast_to(pool_size == 1, results['ppv'].shape)
+        results['expected_tests_per_person'] = np.where(
+            single, 1.0, results['expected_tests_per_person'])
+        results['sensitivity'] = np.where(single, self.sensitivity, results['sensitivity'])
+        results['specificity'] = np.where(single, self.specificity, results['specificity'])
+        results['ppv'] = np.where(single, individual['ppv'], results['ppv'])
+        results['npv'] = np.where(single, individual['npv'], results['npv'])
+        return results
+
+    def hierarchical(self, stage_sizes, prevalence=None):
+        """
+        Evaluate a multi-stage hierarchical pooling scheme.
+
+        Args:
+            stage_sizes (sequence): Pool sizes per stage, ending with 1
+            prevalence (array_like, optional): Prevalence(s) to evaluate
+
+        Returns:
+            dict: Arrays of expected tests per person, sensitivity,
+                specificity, PPV and NPV
+        """
+        if prevalence is None:
+            prevalence = self.analyzer.p_disease
+        return hierarchical_scheme(prevalence, stage_sizes,
+                                   self.sensitivity, self.specificity)
+
+    def optimal_pool_size(self, prevalence=None, max_pool_size=100):
+        """
+        Find the Dorfman pool size minimizing the expected number of tests.
+
+        Args:
+            prevalence (array_like, optional): Prevalence(s) to optimize for
+            max_pool_size (int): Largest pool size considered
+
+        Returns:
+            dict: Optimal pool size and expected tests per person for each
+                prevalence, plus the savings relative to individual testing
+        """
+        if prevalence is None:
+            prevalence = self.analyzer.p_disease
+        prevalence = np.asarray(prevalence, dtype=float)
+
+        pool_sizes = np.arange(1, max_pool_size + 1)
+        grid = self.dorfman(pool_sizes[:, None], prevalence.reshape(1, -1))
+        expected = grid['expected_tests_per_person']
+
+        best = np.argmin(expected, axis=0)
+        best_expected = expected[best, np.arange(expected.shape[1])]
+
+        return {
+            'pool_size': pool_sizes[best].reshape(prevalence.shape),
+            'expected_tests_per_person': best_expected.reshape(prevalence.shape),
+            'assays_saved_fraction': (1 - best_expected).reshape(prevalence.shape)
+        }
+
+    def plan_throughput(self, samples_per_day, stage_sizes):
+        """
+        Estimate the daily assay load for a pooling scheme.
+
+        Args:
+            samples_per_day (int): Number of samples arriving per day
+            stage_sizes (sequence): Pool sizes per stage, ending with 1
+
+        Returns:
+            dict: Expected assays per day and assays saved per day
+        """
+        expected = self.hierarchical(stage_sizes)['expected_tests_per_person']
+        return {
+            'assays_per_day': samples_per_day * expected,
+            'assays_saved_per_day': samples_per_day * (1 - expected)
+        }
+
+    def simulate_dorfman(self, pool_size, n_people, seed=None,
+                         chunk_size=1_000_000):
+        """
+        Check the Dorfman formulas by Monte Carlo simulation.
+
+        Args:
+            pool_size (int): Pool size
+            n_people (int): Number of people to simulate (rounded down to
+                whole pools)
+            seed (int, optional): Seed for the random generator
+            chunk_size (int): People simulated per vectorized step
+
+        Returns:
+            dict: Empirical tests per person, sensitivity and specificity
+                together with the simulated confusion matrix
+        """
+        rng = np.random.default_rng(seed)
+        pools_per_chunk = max(chunk_size // pool_size, 1)
+        remaining_pools = n_people // pool_size
+
+        counts = ConfusionMatrix()
+        n_tests = 0
+        while remaining_pools > 0:
+            n_pools = min(pools_per_chunk, remaining_pools)
+            disease = rng.random((n_pools, pool_size)) < self.analyzer.p_disease
+
+            pool_diseased = disease.any(axis=1)
+            pool_positive = np.where(pool_diseased,
+                                     rng.random(n_pools) < self.sensitivity,
+                                     rng.random(n_pools) >= self.specificity)
+            n_tests += n_pools
+
+            if pool_size == 1:
+                positive = pool_positive[:, None]
+            else:
+                retest = np.where(disease,
+                                  rng.random(disease.shape) < self.sensitivity,
+                                  rng.random(disease.shape) >= self.specificity)
+                positive = pool_positive[:, None] & retest
+                n_tests += pool_size * np.count_nonzero(pool_positive)
+
+            counts.update(disease.ravel(), positive.ravel())
+            remaining_pools -= n_pools
+
+        statistics = counts.get_statistics()
+        return {
+            'expected_tests_per_person': n_tests / counts.total,
+            'sensitivity': statistics['sensitivity'],
+            'specificity': statistics['specificity'],
+            'confusion_matrix': counts
+        }
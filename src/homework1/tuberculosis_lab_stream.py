@@ -0,0 +1,223 @@
+"""
+Streaming Lab-Result Ingestion with Conjugate Beta Updates
+
+Confirmed lab outcomes pair a test result with a gold-standard diagnosis.
+Every such record is a Bernoulli observation of either the sensitivity
+(gold standard positive) or the specificity (gold standard negative), and of
+the prevalence. With Beta priors the posteriors stay Beta, so the whole
+stream is summarized by four confusion counts:
+
+    sensitivity ~ Beta(a + TP, b + FN)
+    specificity ~ Beta(a + TN, b + FP)
+    prevalence  ~ Beta(a + TP + FN, b + TN + FP)
+
+Records are read in chunks from CSV or .npy files, memory stays O(1) in the
+stream length, and a live TuberculosisTestAnalyzer is refreshed with the
+posterior means so downstream calculations always use current accuracy.
+"""
+
+from itertools import islice
+
+import numpy as np
+from scipy import stats
+
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer
+
+
+def iter_csv_chunks(path, chunk_size=100_000, result_column='test_result',
+                    truth_column='gold_standard', delimiter=','):
+    """
+    Read (test result, gold standard) pairs from a CSV file in chunks.
+
+    Args:
+        path (str): Path to a CSV file with a header row
+        chunk_size (int): Number of rows per chunk
+        result_column (str): Header of the 0/1 test result column
+        truth_column (str): Header of the 0/1 gold-standard column
+        delimiter (str): Field delimiter
+
+    Yields:
+        numpy.ndarray: int8 array of shape (n_rows, 2) holding
+            (test result, gold standard)
+    """
+    with open(path, 'r') as f:
+        header = [name.strip() for name in f.readline().split(delimiter)]
+        columns = (header.index(result_column), header.index(truth_column))
+
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+            yield np.loadtxt(lines, delimiter=delimiter, usecols=columns,
+                             dtype=np.int8, ndmin=2)
+
+
+def iter_npy_chunks(path, chunk_size=1_000_000):
+    """
+    Read (test result, gold standard) pairs from a memory-mapped .npy file.
+
+    Args:
+        path (str): Path to a .npy file holding an (n, 2) array
+        chunk_size (int): Number of rows per chunk
+
+    Yields:
+        numpy.ndarray: View of shape (n_rows, 2) into the mapped file
+    """
+    data = np.load(path, mmap_mode='r')
+    if data.ndim != 2 or data.shape[1] != 2:
+        raise ValueError("expected an (n, 2) array of (test result, gold standard)")
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+
+class LabResultStream:
+    """Running Beta posteriors for test accuracy and prevalence."""
+
+    def __init__(self, analyzer=None, prior_alpha=1.0, prior_beta=1.0,
+                 update_prevalence=False):
+        """
+        Initialize empty counts and the analyzer to keep up to date.
+
+        Args:
+            analyzer (TuberculosisTestAnalyzer, optional): Live analyzer that
+                is refreshed after every update
+            prior_alpha (float): First Beta prior parameter
+            prior_beta (float): Second Beta prior parameter
+            update_prevalence (bool): Whether the stream's case mix should
+                also update the analyzer's prevalence; off by default because
+                patients referred for confirmation are rarely a population
+                sample
+        """
+        self.analyzer = analyzer if analyzer is not None else TuberculosisTestAnalyzer()
+        self.prior_alpha = prior_alpha
+        self.prior_beta = prior_beta
+        self.update_prevalence = update_prevalence
+
+        self.true_positive = 0
+        self.false_negative = 0
+        self.true_negative = 0
+        self.false_positive = 0
+
+    @property
+    def n_records(self):
+        """int: Number of records ingested so far."""
+        return (self.true_positive + self.false_negative +
+                self.true_negative + self.false_positive)
+
+    def posterior_parameters(self):
+        """
+        Get the Beta posterior parameters of every quantity.
+
+        Returns:
+            dict: (alpha, beta) tuples for sensitivity, specificity and
+                prevalence
+        """
+        a, b = self.prior_alpha, self.prior_beta
+        n_disease = self.true_positive + self.false_negative
+        n_healthy = self.true_negative + self.false_positive
+        return {
+            'sensitivity': (a + self.true_positive, b + self.false_negative),
+            'specificity': (a + self.true_negative, b + self.false_positive),
+            'prevalence': (a + n_disease, b + n_healthy)
+        }
+
+    def update(self, chunk):
+        """
+        Ingest a chunk of confirmed lab outcomes.
+
+        The analyzer is only refreshed when the chunk holds records, so an
+        empty chunk never replaces its parameters with prior means.
+
+        Args:
+            chunk (array_like): (n, 2) array of (test result, gold standard),
+                both coded 1 for positive and 0 for negative
+        """
+        chunk = np.asarray(chunk)
+        result = chunk[:, 0] != 0
+        truth = chunk[:, 1] != 0
+
+        n_disease = int(np.count_nonzero(truth))
+        true_positive = int(np.count_nonzero(result & truth))
+        false_positive = int(np.count_nonzero(result)) - true_positive
+
+        self.true_positive += true_positive
+        self.false_negative += n_disease - true_positive
+        self.false_positive += false_positive
+        self.true_negative += len(chunk) - n_disease - false_positive
+
+        if len(chunk):
+            self.refresh_analyzer()
+
+    def refresh_analyzer(self):
+        """Set the live analyzer's parameters to the posterior means."""
+        params = self.posterior_parameters()
+        means = {key: a / (a + b) for key, (a, b) in params.items()}
+        self.analyzer.update_parameters(
+            p_disease=means['prevalence'] if self.update_prevalence else None,
+            sensitivity=means['sensitivity'],
+            specificity=means['specificity']
+        )
+
+    def snapshot(self, credible_level=0.95):
+        """
+        Summarize the current state of the stream in O(1) time.
+
+        Args:
+            credible_level (float): Probability mass of the credible intervals
+
+        Returns:
+            dict: Record count, confusion counts, posterior mean and credible
+                interval of each quantity, and the analyzer's current
+                posterior probability of disease after a positive test
+        """
+        tail = (1 - credible_level) / 2
+        summary = {
+            'n_records': self.n_records,
+            'counts': {
+                'true_positive': self.true_positive,
+                'false_negative': self.false_negative,
+                'true_negative': self.true_negative,
+                'false_positive': self.false_positive
+            }
+        }
+        for key, (a, b) in self.posterior_parameters().items():
+            lower, upper = stats.beta.ppf([tail, 1 - tail], a, b)
+            summary[key] = {
+                'mean': a / (a + b),
+                'credible_interval': (lower, upper)
+            }
+        summary['posterior_probability'] = self.analyzer.calculate_posterior_probability()
+        return summary
+
+    def consume(self, chunks, snapshot_every=5000, credible_level=0.95):
+        """
+        Ingest a stream of chunks, yielding periodic snapshots.
+
+        Args:
+            chunks (iterable): Iterator of (n, 2) outcome arrays, e.g. from
+                iter_csv_chunks or iter_npy_chunks
+            snapshot_every (int): Number of records between snapshots, at
+                least one
+            credible_level (float): Probability mass of the credible intervals
+
+        Yields:
+            dict: Snapshot after every snapshot_every records and a final one
+                at the end of the stream
+        """
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be at least 1")
+
+        since_snapshot = 0
+        for chunk in chunks:
+            # Split chunks at snapshot boundaries so snapshots are evenly spaced
+            start = 0
+            while start < len(chunk):
+                stop = min(len(chunk), start + snapshot_every - since_snapshot)
+                self.update(chunk[start:stop])
+                since_snapshot += stop - start
+                start = stop
+                if since_snapshot >= snapshot_every:
+                    yield self.snapshot(credible_level)
+                    since_snapshot = 0
+        if since_snapshot:
+            yield self.snapshot(credible_level)
@@ -0,0 +1,191 @@
+"""
+Precomputed PPV/NPV Lookup Surface for Tuberculosis Scenarios
+
+This module tabulates PPV and NPV once on a 3-D grid of prevalence,
+sensitivity and specificity and answers queries by multilinear (trilinear)
+interpolation. It is opt-in: the closed form in analyze_scenario_grid is only
+a few array operations and is faster than the eight-corner gather, for
+scalars and for large arrays alike, so the GUI calls it directly. The
+surface is for callers that want a fixed, serialized table.
+
+PPV rises steeply as specificity approaches one, so interpolating raw
+probabilities on a linear grid is badly wrong exactly where real assays
+operate. The table is therefore built in log-odds space instead:
+
+    logit(PPV) =  logit(prevalence) + log(sensitivity) - log(1 - specificity)
+    logit(NPV) = -logit(prevalence) + log(specificity) - log(1 - sensitivity)
+
+With logit-spaced axes the prevalence term is exactly linear and the other
+terms are smooth one-dimensional functions, so interpolation errors stay
+below 1e-3 in PPV everywhere on the grid. Points outside the grid are
+evaluated exactly with analyze_scenario_grid rather than clamped.
+
+The table is built lazily on the first query and saved as a .npy file whose
+name encodes a hash of the grid, so later sessions load it straight from
+disk.
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+
+import numpy as np
+from scipy.special import expit, log_expit, logit
+
+from problem1_tuberculosis_test import analyze_scenario_grid
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "homework-ai")
+
+# Spacing of the default grids in log-odds
+DEFAULT_LOGIT_STEP = 0.2
+
+
+def _logit_grid(low, high, step=DEFAULT_LOGIT_STEP):
+    """Probabilities evenly spaced in log-odds between low and high."""
+    n_points = int(np.ceil((logit(high) - logit(low)) / step)) + 1
+    return expit(np.linspace(logit(low), logit(high), n_points))
+
+
+class PosteriorLookupSurface:
+    """Lazily built, disk-cached log-odds PPV/NPV table with trilinear interpolation."""
+
+    def __init__(self, prevalence_grid=None, sensitivity_grid=None,
+                 specificity_grid=None, cache_dir=DEFAULT_CACHE_DIR):
+        """
+        Initialize the grid axes without computing the table.
+
+        Grid values are probabilities; interpolation happens between their
+        log-odds, so grids evenly spaced in log-odds work best.
+
+        Args:
+            prevalence_grid (array_like, optional): Increasing prevalence values
+            sensitivity_grid (array_like, optional): Increasing sensitivities
+            specificity_grid (array_like, optional): Increasing specificities
+            cache_dir (str, optional): Directory for the .npy cache; None
+                disables disk caching
+        """
+        if prevalence_grid is None:
+            prevalence_grid = _logit_grid(1e-6, 0.99)
+        if sensitivity_grid is None:
+            sensitivity_grid = _logit_grid(0.5, 1 - 1e-6)
+        if specificity_grid is None:
+            specificity_grid = _logit_grid(0.5, 1 - 1e-6)
+
+        self.grids = tuple(np.asarray(g, dtype=float) for g in
+                           (prevalence_grid, sensitivity_grid, specificity_grid))
+        for grid in self.grids:
+            if grid.ndim != 1 or len(grid) < 2 or np.any(np.diff(grid) <= 0):
+                raise ValueError("grids must be strictly increasing with at least 2 points")
+            if grid[0] <= 0 or grid[-1] >= 1:
+                raise ValueError("grid values must lie strictly between 0 and 1")
+        self.logit_grids = tuple(logit(g) for g in self.grids)
+
+        self.cache_dir = cache_dir
+        self._table = None
+
+    @property
+    def cache_path(self):
+        """str: Path of the .npy cache file for this grid, or None."""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha1(b"".join(g.tobytes() for g in self.grids)).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"tb_logit_surface_{digest}.npy")
+
+    @property
+    def table(self):
+        """numpy.ndarray: (2, P, S, T) array of logit(PPV) and logit(NPV)."""
+        if self._table is None:
+            self._table = self._load_or_build()
+        return self._table
+
+    def _load_or_build(self):
+        """Load the table from the disk cache, or compute and save it."""
+        path = self.cache_path
+        if path is not None and os.path.exists(path):
+            return np.load(path)
+
+        prevalence, sensitivity, specificity = self.logit_grids
+        prevalence = prevalence[:, None, None]
+        sensitivity = sensitivity[None, :, None]
+        specificity = specificity[None, None, :]
+
+        # log(p) = log_expit(logit p) and log(1 - p) = log_expit(-logit p)
+        logit_ppv = prevalence + log_expit(sensitivity) - log_expit(-specificity)
+        logit_npv = -prevalence + log_expit(specificity) - log_expit(-sensitivity)
+        table = np.stack([logit_ppv, logit_npv])
+
+        if path is not None:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                np.save(path, table)
+            except OSError:
+                # A read-only cache location only costs a rebuild next time
+                pass
+        return table
+
+    @staticmethod
+    def _locate(grid, values):
+        """Find interval indices, interpolation weights and in-grid flags along one axis."""
+        idx = np.clip(np.searchsorted(grid, values, side='right') - 1, 0, len(grid) - 2)
+        weight = (values - grid[idx]) / (grid[idx + 1] - grid[idx])
+        inside = (values >= grid[0]) & (values <= grid[-1])
+        return idx, np.clip(weight, 0.0, 1.0), inside
+
+    def query(self, prevalence, sensitivity, specificity):
+        """
+        Interpolate the posterior, PPV and NPV at arbitrary points.
+
+        Inputs broadcast against each other. Points outside the grid,
+        including probabilities of exactly 0 or 1, are computed exactly with
+        analyze_scenario_grid instead of being clamped.
+
+        Args:
+            prevalence (array_like): Prior probability of disease
+            sensitivity (array_like): True positive rate
+            specificity (array_like): True negative rate
+
+        Returns:
+            dict: Arrays of posterior probability, PPV and NPV
+        """
+        points = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in
+                                       (prevalence, sensitivity, specificity)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            logits = [logit(p) for p in points]
+        located = [self._locate(g, x) for g, x in zip(self.logit_grids, logits)]
+        (i, wi, inside_i), (j, wj, inside_j), (k, wk, inside_k) = located
+        table = self.table
+
+        result = 0.0
+        for di, fi in ((0, 1 - wi), (1, wi)):
+            for dj, fj in ((0, 1 - wj), (1, wj)):
+                for dk, fk in ((0, 1 - wk), (1, wk)):
+                    result = result + (fi * fj * fk) * table[:, i + di, j + dj, k + dk]
+        ppv, npv = expit(result)
+
+        outside = ~(inside_i & inside_j & inside_k)
+        if np.any(outside):
+            exact = analyze_scenario_grid(*(p[outside] for p in points))
+            ppv = np.array(ppv, dtype=float)
+            npv = np.array(npv, dtype=float)
+            ppv[outside] = exact['ppv']
+            npv[outside] = exact['npv']
+
+        return {
+            'posterior_probability': ppv,
+            'ppv': ppv,
+            'npv': npv
+        }
+
+
+@lru_cache(maxsize=None)
+def get_default_surface(cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Get the shared lookup surface on the default grid.
+
+    Args:
+        cache_dir (str, optional): Directory for the .npy cache
+
+    Returns:
+        PosteriorLookupSurface: Memoized surface instance
+    """
+    return PosteriorLookupSurface(cache_dir=cache_dir)
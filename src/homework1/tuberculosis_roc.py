@@ -0,0 +1,210 @@
+"""
+ROC and Precision-Recall Analysis for Continuous Diagnostic Scores
+
+Problem 1 treats the tuberculosis test as a fixed binary test. Real assays
+report a continuous score that is turned into a positive result by choosing a
+threshold, and every threshold gives a different sensitivity/specificity pair.
+
+This module sorts the scores once and obtains the true and false positive
+counts at every distinct threshold from cumulative sums, so the whole curve
+costs O(n log n) regardless of how many thresholds there are. A result is
+called positive when its score is greater than or equal to the threshold.
+"""
+
+import numpy as np
+
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer, analyze_scenario_grid
+
+
+def roc_curve(scores, labels):
+    """
+    Calculate confusion counts at every distinct score threshold.
+
+    Args:
+        scores (array_like): Continuous test scores, higher means more
+            likely diseased
+        labels (array_like): True disease status (1/True for diseased)
+
+    Returns:
+        dict: Thresholds in decreasing order with the matching true/false
+            positive counts, TPR, FPR and precision (PPV at the sample
+            prevalence)
+    """
+    scores = np.asarray(scores)
+    labels = np.asarray(labels, dtype=bool)
+    if scores.shape != labels.shape or scores.ndim != 1:
+        raise ValueError("scores and labels must be 1-D arrays of equal length")
+
+    n_disease = np.count_nonzero(labels)
+    n_healthy = len(labels) - n_disease
+    if n_disease == 0 or n_healthy == 0:
+        raise ValueError("labels must contain both diseased and healthy cases")
+
+    order = np.argsort(scores)[::-1]
+    sorted_scores = scores[order]
+    sorted_labels = labels[order]
+
+    # Last index of each run of tied scores marks a distinct threshold
+    distinct = np.flatnonzero(np.diff(sorted_scores))
+    threshold_idx = np.append(distinct, len(sorted_scores) - 1)
+
+    true_positives = np.cumsum(sorted_labels, dtype=np.int64)[threshold_idx]
+    false_positives = (threshold_idx + 1) - true_positives
+
+    return {
+        'thresholds': sorted_scores[threshold_idx],
+        'true_positives': true_positives,
+        'false_positives': false_positives,
+        'tpr': true_positives / n_disease,
+        'fpr': false_positives / n_healthy,
+        'precision': true_positives / (true_positives + false_positives),
+        'n_disease': n_disease,
+        'n_healthy': n_healthy
+    }
+
+
+class ROCAnalyzer:
+    """Threshold-sweep analyzer for continuous diagnostic scores."""
+
+    def __init__(self, scores, labels, prevalence=None):
+        """
+        Initialize by computing the full ROC curve once.
+
+        Args:
+            scores (array_like): Continuous test scores
+            labels (array_like): True disease status of each sample
+            prevalence (float, optional): Population prevalence used for the
+                posterior; defaults to the Problem 1 prevalence
+        """
+        self.curve = roc_curve(scores, labels)
+        self._specificity = 1 - self.curve['fpr']
+        if prevalence is None:
+            prevalence = TuberculosisTestAnalyzer().calculate_prior_probability()
+        self.prevalence = prevalence
+
+    @property
+    def thresholds(self):
+        """numpy.ndarray: Distinct thresholds in decreasing order."""
+        return self.curve['thresholds']
+
+    @property
+    def sensitivity(self):
+        """numpy.ndarray: Sensitivity (TPR) at every threshold."""
+        return self.curve['tpr']
+
+    @property
+    def specificity(self):
+        """numpy.ndarray: Specificity (1 - FPR) at every threshold."""
+        return self._specificity
+
+    def calculate_auc(self):
+        """
+        Calculate the area under the ROC curve.
+
+        Returns:
+            float: Trapezoidal AUC, ties counted as one half
+        """
+        fpr = np.concatenate(([0.0], self.curve['fpr']))
+        tpr = np.concatenate(([0.0], self.curve['tpr']))
+        return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1])) / 2)
+
+    def calculate_average_precision(self):
+        """
+        Calculate the area under the precision-recall curve.
+
+        Returns:
+            float: Average precision as a step-wise sum over recall
+        """
+        recall_steps = np.diff(np.concatenate(([0.0], self.curve['tpr'])))
+        return float(np.sum(recall_steps * self.curve['precision']))
+
+    def calculate_posterior(self, prevalence=None):
+        """
+        Calculate the posterior probability of disease at every threshold.
+
+        Args:
+            prevalence (array_like, optional): Prevalence(s) to evaluate at;
+                an array of shape (P, 1) gives a (P, n_thresholds) table
+
+        Returns:
+            dict: Vectorized Bayes results, see analyze_scenario_grid
+        """
+        if prevalence is None:
+            prevalence = self.prevalence
+        return analyze_scenario_grid(prevalence, self.sensitivity, self.specificity)
+
+    def find_optimal_threshold(self, criterion='youden', cost_false_negative=1.0,
+                               cost_false_positive=1.0):
+        """
+        Find the threshold that optimizes a decision criterion.
+
+        Args:
+            criterion (str): 'youden' maximizes sensitivity + specificity - 1;
+                'cost' minimizes the expected misclassification cost at the
+                analyzer's prevalence
+            cost_false_negative (float): Cost of missing a diseased patient
+            cost_false_positive (float): Cost of a false alarm
+
+        Returns:
+            dict: Optimal threshold with its index, sensitivity, specificity
+                and criterion value
+        """
+        if criterion == 'youden':
+            values = self.sensitivity - (1 - self.specificity)
+            idx = int(np.argmax(values))
+        elif criterion == 'cost':
+            values = (cost_false_negative * self.prevalence * (1 - self.sensitivity) +
+                      cost_false_positive * (1 - self.prevalence) * (1 - self.specificity))
+            idx = int(np.argmin(values))
+        else:
+            raise ValueError(f"Unknown criterion: {criterion}")
+
+        return {
+            'threshold': self.thresholds[idx],
+            'index': idx,
+            'sensitivity': float(self.sensitivity[idx]),
+            'specificity': float(self.specificity[idx]),
+            'criterion_value': float(values[idx])
+        }
+
+    def analyze_threshold(self, threshold):
+        """
+        Run the Problem 1 analysis for the test dichotomized at a threshold.
+
+        Args:
+            threshold (float): Scores at or above this value are positive
+
+        Returns:
+            dict: Output of TuberculosisTestAnalyzer.analyze_test_usefulness
+                plus the requested threshold
+        """
+        # Thresholds are decreasing, so the operating point for an arbitrary
+        # cutoff is the last distinct threshold still at or above it
+        idx = np.searchsorted(-self.thresholds, -threshold, side='right') - 1
+        if idx < 0:
+            raise ValueError("threshold is above every observed score")
+
+        sensitivity = float(self.sensitivity[idx])
+        specificity = float(self.specificity[idx])
+        analyzer = TuberculosisTestAnalyzer(
+            p_disease=self.prevalence,
+            sensitivity=sensitivity,
+            specificity=specificity
+        )
+        if specificity < 1:
+            results = analyzer.analyze_test_usefulness()
+        else:
+            # Every threshold has a positive sample, so sensitivity > 0 here
+            # and a positive result without false positives proves disease
+            results = {
+                'prior_probability': analyzer.calculate_prior_probability(),
+                'posterior_probability': 1.0,
+                'likelihood_ratio': np.inf,
+                'odds_ratio': np.inf,
+                'test_accuracy': {
+                    'sensitivity': sensitivity,
+                    'specificity': specificity
+                }
+            }
+        results['threshold'] = threshold
+        return results
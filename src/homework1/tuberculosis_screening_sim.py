@@ -0,0 +1,215 @@
+"""
+Monte Carlo Population Screening for the Tuberculosis Test
+
+This module validates the analytic results of Problem 1 by simulation. It
+draws synthetic populations with a true disease status and a noisy test
+outcome for every person, and accumulates the confusion matrix on-line so
+that no per-person arrays outlive a single chunk.
+
+Large simulations are split into fixed-size blocks. Every block receives its
+own generator spawned from one numpy SeedSequence, so the final counts depend
+only on the seed and the block size, never on how many worker processes ran
+the blocks.
+"""
+
+import numpy as np
+
+from parallel_blocks import run_seeded_blocks
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer
+
+
+class ConfusionMatrix:
+    """On-line accumulator of screening outcomes."""
+
+    def __init__(self, true_positive=0, false_positive=0,
+                 false_negative=0, true_negative=0):
+        """
+        Initialize with optional starting counts.
+
+        Args:
+            true_positive (int): Diseased people who tested positive
+            false_positive (int): Healthy people who tested positive
+            false_negative (int): Diseased people who tested negative
+            true_negative (int): Healthy people who tested negative
+        """
+        self.true_positive = int(true_positive)
+        self.false_positive = int(false_positive)
+        self.false_negative = int(false_negative)
+        self.true_negative = int(true_negative)
+
+    def update(self, disease, positive):
+        """
+        Add a chunk of simulated people to the counts.
+
+        Args:
+            disease (numpy.ndarray): Boolean true disease status
+            positive (numpy.ndarray): Boolean test outcome
+        """
+        n_disease = np.count_nonzero(disease)
+        n_positive = np.count_nonzero(positive)
+        true_positive = np.count_nonzero(disease & positive)
+
+        self.true_positive += true_positive
+        self.false_negative += n_disease - true_positive
+        self.false_positive += n_positive - true_positive
+        self.true_negative += len(disease) - n_disease - n_positive + true_positive
+
+    def merge(self, other):
+        """
+        Add the counts of another confusion matrix in place.
+
+        Args:
+            other (ConfusionMatrix): Counts to add
+
+        Returns:
+            ConfusionMatrix: self, to allow chaining
+        """
+        self.true_positive += other.true_positive
+        self.false_positive += other.false_positive
+        self.false_negative += other.false_negative
+        self.true_negative += other.true_negative
+        return self
+
+    @property
+    def total(self):
+        """int: Number of people simulated."""
+        return (self.true_positive + self.false_positive +
+                self.false_negative + self.true_negative)
+
+    def get_statistics(self):
+        """
+        Calculate empirical screening statistics from the counts.
+
+        Returns:
+            dict: Counts plus empirical prevalence, sensitivity, specificity,
+                PPV and NPV with binomial standard errors for PPV and NPV
+        """
+        n_positive = self.true_positive + self.false_positive
+        n_negative = self.true_negative + self.false_negative
+        n_disease = self.true_positive + self.false_negative
+        n_healthy = self.true_negative + self.false_positive
+
+        def ratio(numerator, denominator):
+            return numerator / denominator if denominator else np.nan
+
+        ppv = ratio(self.true_positive, n_positive)
+        npv = ratio(self.true_negative, n_negative)
+
+        return {
+            'counts': {
+                'true_positive': self.true_positive,
+                'false_positive': self.false_positive,
+                'false_negative': self.false_negative,
+                'true_negative': self.true_negative
+            },
+            'n_people': self.total,
+            'prevalence': ratio(n_disease, self.total),
+            'sensitivity': ratio(self.true_positive, n_disease),
+            'specificity': ratio(self.true_negative, n_healthy),
+            'ppv': ppv,
+            'npv': npv,
+            'ppv_std_error': np.sqrt(ratio(ppv * (1 - ppv), n_positive)),
+            'npv_std_error': np.sqrt(ratio(npv * (1 - npv), n_negative))
+        }
+
+
+def simulate_block(seed_sequence, n_people, prevalence, sensitivity,
+                   specificity, chunk_size):
+    """
+    Simulate one block of the population with its own generator.
+
+    Args:
+        seed_sequence (numpy.random.SeedSequence): Seed for this block
+        n_people (int): Number of people in the block
+        prevalence (float): Probability of disease
+        sensitivity (float): Probability of a positive test given disease
+        specificity (float): Probability of a negative test given no disease
+        chunk_size (int): Number of people drawn per vectorized step
+
+    Returns:
+        ConfusionMatrix: Outcome counts for the block
+    """
+    rng = np.random.default_rng(seed_sequence)
+    counts = ConfusionMatrix()
+
+    remaining = n_people
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        disease = rng.random(size, dtype=np.float32) < prevalence
+
+        # One uniform per person decides the test outcome for either status
+        u = rng.random(size, dtype=np.float32)
+        positive = np.where(disease, u < sensitivity, u >= specificity)
+
+        counts.update(disease, positive)
+        remaining -= size
+
+    return counts
+
+
+class ScreeningSimulator:
+    """Parallel Monte Carlo simulator for population screening."""
+
+    def __init__(self, analyzer=None, block_size=10_000_000,
+                 chunk_size=1_000_000):
+        """
+        Initialize the simulator from a tuberculosis analyzer.
+
+        Args:
+            analyzer (TuberculosisTestAnalyzer, optional): Source of the
+                prevalence, sensitivity and specificity
+            block_size (int): People per independently seeded block
+            chunk_size (int): People drawn per vectorized step in a block
+        """
+        self.analyzer = analyzer if analyzer is not None else TuberculosisTestAnalyzer()
+        self.block_size = int(block_size)
+        self.chunk_size = int(chunk_size)
+
+    def run(self, n_people, seed=None, n_workers=1):
+        """
+        Simulate screening of a population.
+
+        Args:
+            n_people (int): Total number of people to simulate
+            seed (int or numpy.random.SeedSequence, optional): Root seed
+            n_workers (int, optional): Number of worker processes; 1 runs
+                in the current process and None uses every CPU
+
+        Returns:
+            ConfusionMatrix: Accumulated outcome counts
+        """
+        blocks = run_seeded_blocks(
+            simulate_block, n_people, self.block_size, seed, n_workers,
+            args=(self.analyzer.p_disease, self.analyzer.p_positive_given_disease,
+                  self.analyzer.p_negative_given_no_disease, self.chunk_size))
+
+        total = ConfusionMatrix()
+        for counts in blocks:
+            total.merge(counts)
+        return total
+
+    def compare_with_analytic(self, n_people, seed=None, n_workers=1):
+        """
+        Run a simulation and compare it with the analytic posterior.
+
+        Args:
+            n_people (int): Total number of people to simulate
+            seed (int, optional): Root seed
+            n_workers (int, optional): Number of worker processes
+
+        Returns:
+            dict: Empirical statistics, analytic PPV/NPV and z-scores of the
+                empirical estimates against them
+        """
+        empirical = self.run(n_people, seed=seed, n_workers=n_workers).get_statistics()
+        analytic = self.analyzer.analyze_scenario_grid()
+        analytic_ppv = float(analytic['ppv'])
+        analytic_npv = float(analytic['npv'])
+
+        return {
+            'empirical': empirical,
+            'analytic_ppv': analytic_ppv,
+            'analytic_npv': analytic_npv,
+            'ppv_z_score': (empirical['ppv'] - analytic_ppv) / empirical['ppv_std_error'],
+            'npv_z_score': (empirical['npv'] - analytic_npv) / empirical['npv_std_error']
+        }
@@ -0,0 +1,224 @@
+"""
+Sequential Tuberculosis Testing in Log-Odds Space
+
+This module extends Problem 1 from a single positive result to patient
+histories made of several tests (repeat PCR, culture, X-ray, ...), each with
+its own sensitivity and specificity.
+
+Assuming the results are conditionally independent given the disease status,
+Bayes' theorem chains additively in log-odds space:
+
+    log O(B|A1,...,Am) = log O(B) + sum_j log LR_j
+
+where LR_j is the positive or negative likelihood ratio of test j. Working
+with log-odds keeps the update numerically stable at tiny prevalences, and
+processing records in fixed-size chunks keeps memory constant no matter how
+many patients are streamed through.
+"""
+
+from itertools import islice
+
+import numpy as np
+from scipy.special import expit, logit
+
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer
+
+# Encoding of a single entry in a patient test history
+NEGATIVE = 0
+POSITIVE = 1
+NOT_PERFORMED = -1
+
+
+def log_likelihood_ratios(sensitivity, specificity):
+    """
+    Calculate the log likelihood ratios of positive and negative results.
+
+    Args:
+        sensitivity (array_like): True positive rate of each test
+        specificity (array_like): True negative rate of each test
+
+    Returns:
+        tuple: (log LR+, log LR-) arrays, one entry per test
+    """
+    sensitivity = np.asarray(sensitivity, dtype=float)
+    specificity = np.asarray(specificity, dtype=float)
+
+    with np.errstate(divide='ignore'):
+        # log1p keeps precision for accuracies close to 1
+        log_lr_positive = np.log(sensitivity) - np.log1p(-specificity)
+        log_lr_negative = np.log1p(-sensitivity) - np.log(specificity)
+
+    return log_lr_positive, log_lr_negative
+
+
+def iter_history_chunks(records, n_tests, chunk_size=100_000):
+    """
+    Group an iterator of patient test histories into fixed-size arrays.
+
+    Each record is a sequence of length n_tests whose entries are 1
+    (positive), 0 (negative) or None/-1 (test not performed).
+
+    Args:
+        records (iterable): Iterator over patient test histories
+        n_tests (int): Number of test slots per history
+        chunk_size (int): Maximum number of records per chunk
+
+    Yields:
+        numpy.ndarray: int8 array of shape (n_records, n_tests)
+    """
+    records = iter(records)
+    while True:
+        batch = list(islice(records, chunk_size))
+        if not batch:
+            return
+
+        chunk = np.full((len(batch), n_tests), NOT_PERFORMED, dtype=np.int8)
+        for i, history in enumerate(batch):
+            for j, result in enumerate(history):
+                if result is not None:
+                    chunk[i, j] = result
+        yield chunk
+
+
+class SequentialTestUpdater:
+    """Chains Bayes updates over sequences of diagnostic test results."""
+
+    def __init__(self, sensitivities, specificities, prior=None):
+        """
+        Initialize with the accuracy of every test in the sequence.
+
+        Args:
+            sensitivities (array_like): Sensitivity of each test slot
+            specificities (array_like): Specificity of each test slot
+            prior (float, optional): Prior probability of disease; defaults
+                to the prevalence used by TuberculosisTestAnalyzer
+        """
+        self.sensitivities = np.atleast_1d(np.asarray(sensitivities, dtype=float))
+        self.specificities = np.atleast_1d(np.asarray(specificities, dtype=float))
+        if self.sensitivities.shape != self.specificities.shape:
+            raise ValueError("sensitivities and specificities must have the same length")
+
+        if prior is None:
+            prior = TuberculosisTestAnalyzer().calculate_prior_probability()
+        self.prior = prior
+        self.prior_log_odds = logit(prior)
+
+        log_lr_positive, log_lr_negative = log_likelihood_ratios(
+            self.sensitivities, self.specificities
+        )
+        # Accuracies of exactly 1 give infinite log LRs, and 0 * inf would turn
+        # every record into NaN, so infinite entries are zeroed for the matrix
+        # products and their sign is accumulated separately.
+        self._sign_positive = np.where(np.isinf(log_lr_positive), np.sign(log_lr_positive), 0.0)
+        self._sign_negative = np.where(np.isinf(log_lr_negative), np.sign(log_lr_negative), 0.0)
+        self.log_lr_positive = np.where(np.isinf(log_lr_positive), 0.0, log_lr_positive)
+        self.log_lr_negative = np.where(np.isinf(log_lr_negative), 0.0, log_lr_negative)
+        self.n_tests = len(self.sensitivities)
+
+        # Running totals across every chunk seen so far
+        self.n_records = 0
+        self.n_contradictory = 0
+        self.sum_posterior = 0.0
+
+    def update_log_odds(self, results, prior=None):
+        """
+        Calculate posterior log-odds for a chunk of patient histories.
+
+        Args:
+            results (array_like): Array of shape (n_records, n_tests) with
+                entries 1 (positive), 0 (negative) or -1 (not performed)
+            prior (array_like, optional): Per-record prior probabilities
+                overriding the updater's prior
+
+        Returns:
+            numpy.ndarray: Posterior log-odds, one per record; +inf or -inf
+                when a perfectly specific or sensitive test settles the
+                diagnosis, and NaN when two such tests contradict each other
+        """
+        results = np.asarray(results)
+        if results.ndim != 2 or results.shape[1] != self.n_tests:
+            raise ValueError(f"results must have shape (n_records, {self.n_tests})")
+
+        prior_log_odds = self.prior_log_odds if prior is None else logit(prior)
+
+        # Two matrix-vector products accumulate every test in the history
+        positive = results == POSITIVE
+        negative = results == NEGATIVE
+        log_odds = positive @ self.log_lr_positive + negative @ self.log_lr_negative
+        log_odds = log_odds + prior_log_odds
+
+        # Results that rule disease in (+inf) or out (-inf) with certainty
+        ruled_in = ((positive @ (self._sign_positive > 0)) +
+                    (negative @ (self._sign_negative > 0))) > 0
+        ruled_out = ((positive @ (self._sign_positive < 0)) +
+                     (negative @ (self._sign_negative < 0))) > 0
+        log_odds[ruled_in] = np.inf
+        log_odds[ruled_out] = -np.inf
+        log_odds[ruled_in & ruled_out] = np.nan
+
+        return log_odds
+
+    def update(self, results, prior=None):
+        """
+        Calculate posterior probabilities for a chunk of patient histories.
+
+        Args:
+            results (array_like): Array of shape (n_records, n_tests)
+            prior (array_like, optional): Per-record prior probabilities
+
+        Returns:
+            numpy.ndarray: Posterior probability of disease per record
+        """
+        posterior = expit(self.update_log_odds(results, prior))
+
+        # Contradictory records are NaN and must not poison the running mean
+        self.n_records += len(posterior)
+        self.n_contradictory += int(np.count_nonzero(np.isnan(posterior)))
+        self.sum_posterior += float(np.nansum(posterior))
+
+        return posterior
+
+    def stream(self, chunks):
+        """
+        Lazily update a stream of chunked patient histories.
+
+        Only one chunk is held in memory at a time, so arbitrarily long
+        streams can be processed.
+
+        Args:
+            chunks (iterable): Iterator of (n_records, n_tests) arrays
+
+        Yields:
+            numpy.ndarray: Posterior probabilities for each chunk
+        """
+        for chunk in chunks:
+            yield self.update(chunk)
+
+    def stream_records(self, records, chunk_size=100_000):
+        """
+        Lazily update an iterator of individual patient histories.
+
+        Args:
+            records (iterable): Iterator over per-patient result sequences
+            chunk_size (int): Number of records grouped per update
+
+        Yields:
+            numpy.ndarray: Posterior probabilities for each chunk
+        """
+        return self.stream(iter_history_chunks(records, self.n_tests, chunk_size))
+
+    def get_statistics(self):
+        """
+        Get running statistics over every record processed so far.
+
+        Returns:
+            dict: Record count, number of contradictory records and the mean
+                posterior probability over the other records
+        """
+        n_scored = self.n_records - self.n_contradictory
+        mean_posterior = self.sum_posterior / n_scored if n_scored else np.nan
+        return {
+            'n_records': self.n_records,
+            'n_contradictory': self.n_contradictory,
+            'mean_posterior': mean_posterior
+        }
@@ -0,0 +1,172 @@
+"""
+Stratified Tuberculosis Screening Analysis
+
+Screened populations are stratified by region, age band, risk group and so
+on, and every stratum has its own prior probability of disease. This module
+scores a columnar patient table (a dict of equal-length arrays or a numpy
+structured array) against per-stratum posterior tables.
+
+Strata are identified without Python dictionaries: each key column is
+factorized with np.unique, the codes are combined with np.ravel_multi_index
+and compacted into dense group ids. Per-stratum counts come from
+np.bincount, the PPV/NPV tables are computed once per stratum, and every
+patient is scored by an index gather into those tables.
+"""
+
+import numpy as np
+
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer, analyze_scenario_grid
+from tuberculosis_sequential import NEGATIVE, NOT_PERFORMED, POSITIVE
+
+
+class StratifiedAnalyzer:
+    """Per-stratum Bayes tables for a columnar patient table."""
+
+    def __init__(self, table, strata_columns, analyzer=None):
+        """
+        Initialize by grouping the patient table into strata.
+
+        Args:
+            table (dict or numpy.ndarray): Columnar patient table
+            strata_columns (list): Names of the columns defining a stratum
+            analyzer (TuberculosisTestAnalyzer, optional): Source of the test
+                sensitivity/specificity and of the default prevalence
+        """
+        self.table = table
+        self.strata_columns = list(strata_columns)
+        self.analyzer = analyzer if analyzer is not None else TuberculosisTestAnalyzer()
+
+        self._uniques = []
+        codes = []
+        for name in self.strata_columns:
+            uniques, inverse = np.unique(np.asarray(table[name]), return_inverse=True)
+            self._uniques.append(uniques)
+            codes.append(inverse.ravel())
+        self._dims = tuple(len(u) for u in self._uniques)
+
+        flat = np.ravel_multi_index(codes, self._dims)
+        self._keys, self.group_ids = np.unique(flat, return_inverse=True)
+        self.group_ids = self.group_ids.ravel()
+
+        self.n_strata = len(self._keys)
+        self.stratum_sizes = np.bincount(self.group_ids, minlength=self.n_strata)
+        self.prevalence = np.full(self.n_strata, float(self.analyzer.p_disease))
+        self._tables = None
+
+    @property
+    def strata(self):
+        """dict: Key column values of every stratum, aligned with group ids."""
+        codes = np.unravel_index(self._keys, self._dims)
+        return {name: uniques[code] for name, uniques, code
+                in zip(self.strata_columns, self._uniques, codes)}
+
+    def _lookup_strata(self, table):
+        """
+        Map the key columns of another table onto stratum ids.
+
+        Args:
+            table (dict or numpy.ndarray): Table with the strata columns
+
+        Returns:
+            tuple: (stratum ids, boolean mask of rows matching a stratum)
+        """
+        n_rows = len(np.asarray(table[self.strata_columns[0]]))
+        found = np.ones(n_rows, dtype=bool)
+        codes = []
+        for name, uniques in zip(self.strata_columns, self._uniques):
+            values = np.asarray(table[name])
+            idx = np.minimum(np.searchsorted(uniques, values), len(uniques) - 1)
+            found &= uniques[idx] == values
+            codes.append(idx)
+
+        flat = np.ravel_multi_index(codes, self._dims)
+        ids = np.minimum(np.searchsorted(self._keys, flat), self.n_strata - 1)
+        found &= self._keys[ids] == flat
+        return ids, found
+
+    def set_prevalence(self, prevalence):
+        """
+        Assign the prior probability of disease for each stratum.
+
+        Args:
+            prevalence (array_like or dict): Either one value per stratum in
+                group-id order, or a columnar table holding the strata
+                columns plus a 'p_disease' column; strata missing from the
+                table keep their current prevalence
+        """
+        is_table = (isinstance(prevalence, dict) or
+                    getattr(getattr(prevalence, 'dtype', None), 'names', None))
+        if is_table:
+            ids, found = self._lookup_strata(prevalence)
+            self.prevalence[ids[found]] = np.asarray(prevalence['p_disease'], dtype=float)[found]
+        else:
+            prevalence = np.asarray(prevalence, dtype=float)
+            if prevalence.shape != (self.n_strata,):
+                raise ValueError(f"expected {self.n_strata} prevalence values")
+            self.prevalence = prevalence.copy()
+        self._tables = None
+
+    def estimate_prevalence(self, disease_column, prior_alpha=1.0, prior_beta=1.0):
+        """
+        Estimate each stratum's prevalence from confirmed disease status.
+
+        Args:
+            disease_column (str): Column with the true disease status (0/1)
+            prior_alpha (float): Beta prior pseudo-count of cases
+            prior_beta (float): Beta prior pseudo-count of non-cases
+
+        Returns:
+            numpy.ndarray: Posterior-mean prevalence per stratum
+        """
+        cases = np.bincount(self.group_ids,
+                            weights=np.asarray(self.table[disease_column], dtype=float),
+                            minlength=self.n_strata)
+        self.prevalence = ((cases + prior_alpha) /
+                           (self.stratum_sizes + prior_alpha + prior_beta))
+        self._tables = None
+        return self.prevalence
+
+    def get_stratum_tables(self):
+        """
+        Get the per-stratum posterior tables, computing them on first use.
+
+        Returns:
+            dict: Strata key columns plus size, prevalence, PPV, NPV and the
+                posterior after a negative result for every stratum
+        """
+        if self._tables is None:
+            results = analyze_scenario_grid(self.prevalence,
+                                            self.analyzer.p_positive_given_disease,
+                                            self.analyzer.p_negative_given_no_disease)
+            self._tables = {
+                'n_patients': self.stratum_sizes,
+                'prevalence': self.prevalence,
+                'ppv': results['ppv'],
+                'npv': results['npv'],
+                'posterior_negative': 1 - results['npv']
+            }
+        return {**self.strata, **self._tables}
+
+    def score(self, result_column):
+        """
+        Look up the posterior probability of disease for every patient.
+
+        Args:
+            result_column (str or array_like): Column name or array of test
+                results (1 positive, 0 negative, -1 not performed)
+
+        Returns:
+            numpy.ndarray: Posterior probability per patient; untested
+                patients keep their stratum prevalence
+        """
+        results = (np.asarray(self.table[result_column]) if isinstance(result_column, str)
+                   else np.asarray(result_column))
+        if not np.all(np.isin(results, (NEGATIVE, POSITIVE, NOT_PERFORMED))):
+            raise ValueError("test results must be 1, 0 or -1")
+        tables = self.get_stratum_tables()
+
+        # Columns hold the negative-result posterior, the PPV and the prior
+        lookup = np.column_stack((tables['posterior_negative'], tables['ppv'],
+                                  tables['prevalence']))
+        column = np.where(results == NOT_PERFORMED, 2, results).astype(np.intp)
+        return lookup[self.group_ids, column]
@@ -0,0 +1,169 @@
+"""
+Uncertainty Propagation for Tuberculosis Test Accuracy
+
+Problem 1 uses point values for sensitivity (0.80) and specificity (0.90).
+In practice both come from validation studies with finite counts, so they are
+better described by Beta posteriors:
+
+    sensitivity ~ Beta(a + TP, b + FN)
+    specificity ~ Beta(a + TN, b + FP)
+
+This module pushes those distributions through Bayes' theorem to obtain the
+full distribution of the posterior disease probability and the odds ratio.
+Samples are generated with scrambled Sobol sequences, which cover the unit
+cube far more evenly than independent draws. Several independently scrambled
+replicates are run so that the spread between them gives an honest estimate
+of the convergence error, and the sample size is doubled until a requested
+precision is reached.
+"""
+
+import numpy as np
+from scipy.special import betaincinv
+from scipy.stats import qmc
+
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer, analyze_scenario_grid
+
+
+class AccuracyUncertaintyAnalyzer:
+    """Propagates Beta uncertainty in test accuracy to the posterior."""
+
+    def __init__(self, true_positives, false_negatives, true_negatives,
+                 false_positives, p_disease=None, prevalence_counts=None,
+                 prior_alpha=1.0, prior_beta=1.0):
+        """
+        Initialize from validation-study counts.
+
+        Args:
+            true_positives (int): Diseased subjects who tested positive
+            false_negatives (int): Diseased subjects who tested negative
+            true_negatives (int): Healthy subjects who tested negative
+            false_positives (int): Healthy subjects who tested positive
+            p_disease (float, optional): Fixed prevalence; defaults to the
+                Problem 1 prevalence
+            prevalence_counts (tuple, optional): (cases, non-cases) from a
+                prevalence survey; when given, prevalence is also uncertain
+            prior_alpha (float): First Beta prior parameter (1 = uniform)
+            prior_beta (float): Second Beta prior parameter (1 = uniform)
+        """
+        self.sensitivity_params = (prior_alpha + true_positives,
+                                   prior_beta + false_negatives)
+        self.specificity_params = (prior_alpha + true_negatives,
+                                   prior_beta + false_positives)
+
+        if prevalence_counts is not None:
+            cases, non_cases = prevalence_counts
+            self.prevalence_params = (prior_alpha + cases, prior_beta + non_cases)
+            self.p_disease = None
+        else:
+            self.prevalence_params = None
+            if p_disease is None:
+                p_disease = TuberculosisTestAnalyzer().calculate_prior_probability()
+            self.p_disease = p_disease
+
+    @property
+    def dimension(self):
+        """int: Number of uncertain inputs (2 or 3)."""
+        return 2 if self.prevalence_params is None else 3
+
+    def sample(self, n_samples, seed=None):
+        """
+        Draw one scrambled Sobol replicate of the posterior distribution.
+
+        Args:
+            n_samples (int): Number of points, rounded up to a power of two
+            seed (int or numpy.random.Generator, optional): Scrambling seed
+
+        Returns:
+            dict: Arrays of sampled sensitivity, specificity, prevalence,
+                posterior probability and odds ratio
+        """
+        m = max(int(np.ceil(np.log2(n_samples))), 0)
+        points = qmc.Sobol(d=self.dimension, scramble=True, seed=seed).random_base2(m)
+
+        # Inverse-CDF transform maps the uniform points onto the Beta posteriors
+        sensitivity = betaincinv(*self.sensitivity_params, points[:, 0])
+        specificity = betaincinv(*self.specificity_params, points[:, 1])
+        if self.prevalence_params is None:
+            prevalence = np.full_like(sensitivity, self.p_disease)
+        else:
+            prevalence = betaincinv(*self.prevalence_params, points[:, 2])
+
+        results = analyze_scenario_grid(prevalence, sensitivity, specificity)
+
+        return {
+            'sensitivity': sensitivity,
+            'specificity': specificity,
+            'prevalence': prevalence,
+            'posterior_probability': results['posterior_probability'],
+            'odds_ratio': results['odds_ratio']
+        }
+
+    def propagate(self, n_samples=4096, n_replicates=8, credible_level=0.95,
+                  tolerance=None, max_samples=2 ** 20, seed=None):
+        """
+        Estimate the distribution of the posterior and the odds ratio.
+
+        Args:
+            n_samples (int): Initial points per replicate (power of two)
+            n_replicates (int): Independently scrambled replicates used to
+                estimate the convergence error
+            credible_level (float): Probability mass of the credible interval
+            tolerance (float, optional): Target standard error of the
+                posterior credible-interval endpoints; the sample size is
+                doubled until it is met or max_samples is reached
+            max_samples (int): Upper bound on points per replicate
+            seed (int, optional): Root seed for the replicate scramblings
+
+        Returns:
+            dict: Summary for the posterior probability and the odds ratio,
+                pooled samples, sample size and achieved convergence error
+        """
+        if n_replicates < 2:
+            raise ValueError("n_replicates must be at least 2 to estimate the error")
+
+        tail = (1 - credible_level) / 2
+        quantile_levels = [tail, 0.5, 1 - tail]
+        keys = ('posterior_probability', 'odds_ratio')
+        seeds = np.random.SeedSequence(seed).spawn(n_replicates)
+
+        while True:
+            replicates = [self.sample(n_samples, seed=np.random.default_rng(s))
+                          for s in seeds]
+
+            # Per-replicate statistics: rows are [mean, lower, median, upper]
+            estimates = {
+                key: np.array([
+                    np.concatenate(([np.mean(r[key])],
+                                    np.quantile(r[key], quantile_levels)))
+                    for r in replicates
+                ])
+                for key in keys
+            }
+            errors = {key: np.std(estimates[key], axis=0, ddof=1) / np.sqrt(n_replicates)
+                      for key in keys}
+
+            interval_error = max(errors['posterior_probability'][[1, 3]])
+            converged = tolerance is None or interval_error <= tolerance
+            if converged or 2 * n_samples > max_samples:
+                break
+            n_samples *= 2
+
+        summary = {}
+        for key in keys:
+            mean, lower, median, upper = np.mean(estimates[key], axis=0)
+            summary[key] = {
+                'mean': mean,
+                'median': median,
+                'credible_interval': (lower, upper),
+                'samples': np.concatenate([r[key] for r in replicates]),
+                'convergence_error': {
+                    'mean': errors[key][0],
+                    'credible_interval': (errors[key][1], errors[key][3])
+                }
+            }
+
+        summary['n_samples'] = len(replicates[0]['posterior_probability'])
+        summary['n_replicates'] = n_replicates
+        summary['credible_level'] = credible_level
+        summary['converged'] = converged
+        return summary
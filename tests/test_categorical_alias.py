@@ -0,0 +1,56 @@
+"""
+Tests for Alias-Method Categorical Sampling
+
+This module tests the Walker/Vose alias table and its use by
+CategoricalRandomVariable.
+"""
+
+import os
+import pickle
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from categorical_alias import AliasTable
+from problem2_discrete_random_variables import CategoricalRandomVariable
+
+
+class TestAliasTable:
+    """Test cases for the alias table."""
+    
+    def test_table_encodes_pmf_exactly(self):
+        """Test that the table reproduces the input probabilities."""
+        rng = np.random.default_rng(0)
+        probabilities = rng.dirichlet(np.ones(1000) * 0.3)
+        
+        table = AliasTable(probabilities)
+        
+        np.testing.assert_allclose(table.probabilities(), probabilities, atol=1e-12)
+    
+    def test_sample_frequencies(self):
+        """Test empirical frequencies of a large batch."""
+        table = AliasTable([0.3, 0.1, 0.2, 0.4, 0.0], values=[10, 20, 30, 40, 50])
+        samples = table.sample(1_000_000, rng=1, chunk_size=300_000)
+        
+        frequencies = np.array([np.mean(samples == v) for v in (10, 20, 30, 40, 50)])
+        np.testing.assert_allclose(frequencies, [0.3, 0.1, 0.2, 0.4, 0.0], atol=3e-3)
+    
+    def test_picklable_and_reproducible(self):
+        """Test that a pickled table draws the same samples for the same seed."""
+        table = AliasTable([0.5, 0.25, 0.25])
+        restored = pickle.loads(pickle.dumps(table))
+        
+        np.testing.assert_array_equal(table.sample((10, 3), rng=7),
+                                      restored.sample((10, 3), rng=7))
+    
+    def test_categorical_variable_uses_alias_table(self):
+        """Test the sampling entry point on CategoricalRandomVariable."""
+        rv = CategoricalRandomVariable([0.3, 0.1, 0.2, 0.4])
+        samples = rv.sample(200_000, rng=2)
+        
+        assert rv.alias_table is rv.alias_table
+        assert np.mean(samples) == pytest.approx(1.7, abs=0.01)
@@ -0,0 +1,76 @@
+"""
+Tests for Batched Categorical Random Variables
+
+This module tests the vectorized statistics and samplers of CategoricalBatch
+against per-row CategoricalRandomVariable results.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from categorical_batch import CategoricalBatch
+
+
+@pytest.fixture
+def batch():
+    """Create a batch of random PMFs including zero-probability categories."""
+    rng = np.random.default_rng(0)
+    probabilities = rng.dirichlet(np.ones(6), size=40)
+    probabilities[::5, 2] = 0.0
+    probabilities /= probabilities.sum(axis=1, keepdims=True)
+    return CategoricalBatch(probabilities)
+
+
+class TestCategoricalBatch:
+    """Test cases for the batched categorical family."""
+    
+    def test_statistics_match_single_variables(self, batch):
+        """Test expectation, variance and entropy against single rows."""
+        expectation = batch.calculate_expectation()
+        variance = batch.calculate_variance()
+        entropy = batch.calculate_entropy()
+        
+        for i in (0, 7, 39):
+            moments = batch[i].moments
+            assert expectation[i] == pytest.approx(moments['mean'])
+            assert variance[i] == pytest.approx(moments['variance'])
+            assert entropy[i] == pytest.approx(moments['entropy'])
+    
+    def test_rows_keep_support_values(self):
+        """Test that indexed rows carry the shared support labels."""
+        values = np.array([30, 10, 20])
+        labelled = CategoricalBatch([[0.5, 0.2, 0.3], [0.1, 0.6, 0.3]], values)
+        row = labelled[1]
+        
+        np.testing.assert_array_equal(row.values, [10, 20, 30])
+        np.testing.assert_allclose(row.probabilities, [0.6, 0.3, 0.1])
+        assert row.calculate_expectation() == pytest.approx(
+            labelled.calculate_expectation()[1])
+    
+    def test_kl_divergence(self, batch):
+        """Test the pairwise KL matrix against a direct sum."""
+        kl = batch.kl_divergence()
+        p, q = batch.probabilities[3], batch.probabilities[8]
+        
+        assert kl.shape == (40, 40)
+        np.testing.assert_allclose(np.diag(kl), 0.0, atol=1e-12)
+        assert kl[3, 8] == pytest.approx(np.sum(p * np.log(p / q)))
+        # Row 0 has a zero where row 3 does not
+        assert np.isinf(kl[3, 0])
+        np.testing.assert_allclose(batch.kl_divergence(batch, pairwise=False), 0.0, atol=1e-12)
+    
+    @pytest.mark.parametrize("method", ["inverse_cdf", "gumbel"])
+    def test_sampling_frequencies(self, batch, method):
+        """Test that every row is sampled from its own distribution."""
+        samples = batch.sample(20_000, rng=1, method=method)
+        frequencies = np.stack([np.mean(samples == k, axis=1) for k in range(6)], axis=1)
+        
+        assert samples.shape == (40, 20_000)
+        np.testing.assert_allclose(frequencies, batch.probabilities, atol=0.015)
+        assert np.all(samples[::5] != 2)
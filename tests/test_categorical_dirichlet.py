@@ -0,0 +1,84 @@
+"""
+Tests for Dirichlet-Categorical Conjugate Updates
+
+This module tests the streamed count updates and posterior summaries of
+DirichletCategorical.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy import stats
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from categorical_dirichlet import DirichletCategorical
+from problem2_discrete_random_variables import CategoricalRandomVariable
+
+
+class TestDirichletCategorical:
+    """Test cases for the Dirichlet-categorical updater."""
+    
+    def test_multi_stream_update_matches_loop(self):
+        """Test that one bincount update equals per-observation counting."""
+        rng = np.random.default_rng(0)
+        samples = rng.integers(0, 4, size=10_000) * 10
+        streams = rng.integers(0, 300, size=10_000)
+        
+        updater = DirichletCategorical(np.ones(4), values=[0, 10, 20, 30], n_streams=300)
+        updater.update(samples[:4000], streams[:4000])
+        updater.update(samples[4000:], streams[4000:])
+        
+        expected = np.zeros((300, 4), dtype=np.int64)
+        for s, x in zip(streams, samples):
+            expected[s, x // 10] += 1
+        np.testing.assert_array_equal(updater.counts, expected)
+        
+        with pytest.raises(ValueError):
+            updater.update([5], [0])
+    
+    def test_single_stream_counts_with_several_streams(self):
+        """Test that (K,) counts go to one stream instead of every stream."""
+        updater = DirichletCategorical(np.ones(3), n_streams=3)
+        updater.update_counts([5, 0, 0], stream=1)
+        updater.update_counts(np.ones((3, 3), dtype=int))
+        
+        np.testing.assert_array_equal(updater.counts, [[1, 1, 1], [6, 1, 1], [1, 1, 1]])
+        with pytest.raises(ValueError):
+            updater.update_counts([5, 0, 0])
+        with pytest.raises(ValueError):
+            updater.update_counts(np.ones((2, 3), dtype=int))
+    
+    def test_posterior_mean_and_predictive(self):
+        """Test posterior means and the Dirichlet-multinomial predictive."""
+        rv = CategoricalRandomVariable([0.3, 0.1, 0.2, 0.4])
+        updater = DirichletCategorical.from_variable(rv, concentration=4.0)
+        updater.update_counts([3, 0, 1, 6])
+        
+        alpha = np.array([1.2, 0.4, 0.8, 1.6]) + [3, 0, 1, 6]
+        np.testing.assert_allclose(updater.posterior_mean()[0], alpha / alpha.sum())
+        assert updater.predictive_variable().calculate_expectation() == pytest.approx(
+            alpha @ np.arange(4) / alpha.sum())
+        
+        future = np.array([2, 1, 0, 4])
+        expected = stats.dirichlet_multinomial.logpmf(future, alpha, future.sum())
+        assert updater.predictive_log_pmf(future)[0] == pytest.approx(expected)
+    
+    def test_credible_intervals_from_draws_match_beta(self):
+        """Test sampled credible intervals against the exact Beta marginals."""
+        updater = DirichletCategorical(np.ones(3), n_streams=2)
+        updater.update_counts([[30, 50, 20], [5, 5, 90]])
+        
+        exact_lower, exact_upper = updater.credible_intervals()
+        lower, upper = updater.credible_intervals(n_draws=100_000, rng=1)
+        
+        assert exact_lower.shape == (2, 3)
+        np.testing.assert_allclose(lower, exact_lower, atol=0.01)
+        np.testing.assert_allclose(upper, exact_upper, atol=0.01)
+        
+        interval = updater.expectation_interval(rng=2)
+        assert np.all(interval['lower'] < interval['mean'])
+        assert np.all(interval['mean'] < interval['upper'])
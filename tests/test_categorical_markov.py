@@ -0,0 +1,95 @@
+"""
+Tests for Markov Chains over Categorical States
+
+This module tests the stationary-distribution solvers, n-step distributions
+and vectorized trajectory simulation of MarkovChain.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from categorical_markov import MarkovChain
+
+
+@pytest.fixture
+def weather_chain():
+    """Three-state chain with a known stationary distribution."""
+    transition = np.array([[0.5, 0.5, 0.0],
+                           [0.25, 0.5, 0.25],
+                           [0.0, 0.5, 0.5]])
+    return MarkovChain(sparse.csr_matrix(transition), values=[10, 20, 30])
+
+
+class TestMarkovChain:
+    """Test cases for the sparse Markov chain."""
+    
+    def test_stationary_distribution(self, weather_chain):
+        """Test power iteration and eigs against the closed form."""
+        for method in ('power', 'eigs'):
+            rv = weather_chain.stationary_distribution(method=method)
+            np.testing.assert_allclose(rv.probabilities, [0.25, 0.5, 0.25], atol=1e-9)
+            np.testing.assert_array_equal(rv.values, [10, 20, 30])
+        
+        # Periodic chains converge through the lazy chain
+        flip = MarkovChain([[0.0, 1.0], [1.0, 0.0]])
+        np.testing.assert_allclose(flip.stationary_distribution().probabilities, [0.5, 0.5])
+    
+    def test_n_step_distribution(self, weather_chain):
+        """Test repeated squaring against a dense matrix power."""
+        dense = weather_chain.transition.toarray()
+        initial = np.array([[1.0, 0.0, 0.0], [0.2, 0.3, 0.5]])
+        expected = initial @ np.linalg.matrix_power(dense, 13)
+        
+        for method in ('squaring', 'steps'):
+            np.testing.assert_allclose(
+                weather_chain.distribution_after(13, initial, method=method), expected)
+    
+    def test_simulation_matches_transitions(self):
+        """Test that simulated transitions follow the transition matrix."""
+        rng = np.random.default_rng(0)
+        transition = sparse.random(50, 50, density=0.1, random_state=1, format='csr')
+        transition = transition + sparse.identity(50)
+        transition = sparse.diags(1 / np.asarray(transition.sum(axis=1)).ravel()) @ transition
+        chain = MarkovChain(transition)
+        
+        paths = chain.simulate(2000, 50, initial=rng.integers(0, 50, 2000), rng=rng)
+        counts = np.zeros((50, 50))
+        np.add.at(counts, (paths[:, :-1].ravel(), paths[:, 1:].ravel()), 1)
+        
+        assert paths.shape == (2000, 51)
+        assert np.all(counts[chain.transition.toarray() == 0] == 0)
+        visits = counts.sum(axis=1, keepdims=True)
+        expected = chain.transition.toarray()
+        standard_error = np.sqrt(expected * (1 - expected) / visits)
+        assert np.all(np.abs(counts / visits - expected) <= 5 * standard_error + 1e-12)
+    
+    def test_simulation_of_labelled_chain_from_stationary_start(self):
+        """Test that default starts are drawn as indices, not labels."""
+        transition = np.array([[0.1, 0.9, 0.0],
+                               [0.0, 0.2, 0.8],
+                               [0.7, 0.0, 0.3]])
+        chain = MarkovChain(transition, values=[2, 0, 1])
+        
+        paths = chain.simulate(20_000, 3, rng=0)
+        
+        assert paths.shape == (20_000, 4)
+        # Label 2 is row 0, which never moves to row 2 (label 1)
+        assert not np.any((paths[:, :-1] == 2) & (paths[:, 1:] == 1))
+        pi = chain.stationary_probabilities()
+        for label, p in zip([2, 0, 1], pi):
+            assert np.mean(paths[:, 0] == label) == pytest.approx(p, abs=0.02)
+        
+        labelled = MarkovChain(transition, values=[10, 20, 30]).simulate(5, 3, rng=1)
+        assert np.all(np.isin(labelled, [10, 20, 30]))
+    
+    def test_invalid_transition_matrix(self):
+        """Test that non-stochastic matrices are rejected."""
+        with pytest.raises(ValueError):
+            MarkovChain([[0.5, 0.2], [0.5, 0.5]])
@@ -0,0 +1,66 @@
+"""
+Tests for Streaming Empirical-vs-Theoretical Comparison
+
+This module tests the online histogram, Welford moments and goodness-of-fit
+statistics of StreamingComparator.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy import stats
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from categorical_streaming import StreamingComparator
+from problem2_discrete_random_variables import CategoricalRandomVariable
+
+
+class TestStreamingComparator:
+    """Test cases for the streaming comparator."""
+    
+    def test_chunked_stream_matches_batch_statistics(self):
+        """Test that chunked updates equal statistics of the whole sample."""
+        rv = CategoricalRandomVariable([0.3, 0.1, 0.2, 0.4])
+        samples = rv.sample(100_000, rng=0)
+        
+        comparator = StreamingComparator(rv)
+        report = comparator.consume(np.array_split(samples, 37))
+        
+        observed = np.bincount(samples, minlength=4)
+        chi_square, p_value = stats.chisquare(observed, 100_000 * rv.probabilities)
+        g_statistic, _ = stats.power_divergence(observed, 100_000 * rv.probabilities,
+                                                lambda_='log-likelihood')
+        
+        assert report['empirical_mean'] == pytest.approx(np.mean(samples))
+        assert report['empirical_variance'] == pytest.approx(np.var(samples))
+        assert report['chi_square'] == pytest.approx(chi_square)
+        assert report['chi_square_p_value'] == pytest.approx(p_value)
+        assert report['g_statistic'] == pytest.approx(g_statistic)
+        assert report['total_variation'] < 0.01
+    
+    def test_detects_wrong_model(self):
+        """Test that samples from another distribution are rejected."""
+        rv = CategoricalRandomVariable([0.3, 0.1, 0.2, 0.4])
+        other = CategoricalRandomVariable([0.25, 0.25, 0.25, 0.25])
+        
+        report = StreamingComparator(rv).consume([other.sample(50_000, rng=1)])
+        
+        assert report['chi_square_p_value'] < 1e-6
+        assert report['total_variation'] == pytest.approx(0.2, abs=0.01)
+        assert report['kl_divergence'] > 0
+    
+    def test_sparse_support_and_outside_values(self):
+        """Test that off-support samples make the fit impossible."""
+        rv = CategoricalRandomVariable([0.5, 0.5], values=[10, 10**9])
+        comparator = StreamingComparator(rv)
+        comparator.update([10, 10**9, 10**9, 10])
+        assert comparator.report()['chi_square'] == 0.0
+        
+        comparator.update([11])
+        report = comparator.report()
+        assert np.isinf(report['chi_square'])
+        assert report['total_variation'] == pytest.approx(0.2)
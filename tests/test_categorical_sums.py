@@ -0,0 +1,79 @@
+"""
+Tests for Sums of i.i.d. Categorical Random Variables
+
+This module tests the FFT convolution power against direct convolution and
+the closed-form moments.
+"""
+
+import os
+import sys
+import warnings
+
+import numpy as np
+import pytest
+from scipy import stats
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from categorical_sums import convolution_power, sum_distribution
+from problem2_discrete_random_variables import CategoricalRandomVariable
+
+
+class TestConvolutionPower:
+    """Test cases for the n-fold convolution power."""
+    
+    @pytest.mark.parametrize("method", ["fft", "log"])
+    def test_matches_repeated_convolution(self, method):
+        """Test small powers against naive repeated np.convolve."""
+        pmf = np.array([0.3, 0.1, 0.2, 0.4])
+        expected = np.ones(1)
+        for _ in range(13):
+            expected = np.convolve(expected, pmf)
+        
+        offset, result = convolution_power(pmf, 13, tail_tolerance=0.0, method=method)
+        
+        assert offset == 0
+        np.testing.assert_allclose(result, expected, atol=1e-15)
+    
+    def test_bernoulli_power_is_binomial(self):
+        """Test exact log-domain tails against the binomial distribution."""
+        offset, result = convolution_power([0.9, 0.1], 500, tail_tolerance=0.0, method='auto')
+        k = offset + np.arange(len(result))
+        
+        np.testing.assert_allclose(result, stats.binom.pmf(k, 500, 0.1), rtol=1e-9)
+        assert 0 < result[300] < 1e-100
+    
+    def test_large_n_moments_and_trimming(self):
+        """Test n = 10^4 against the closed-form moments."""
+        rv = CategoricalRandomVariable([0.3, 0.1, 0.2, 0.4])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = sum_distribution(rv, 10_000, tail_tolerance=1e-18)
+        
+        assert result['expectation'] == pytest.approx(17_000)
+        assert result['variance'] == pytest.approx(16_100, rel=1e-8)
+        # Negligible tails are trimmed far inside the full 0..30000 support
+        assert len(result['values']) < 5_000
+        assert result['probabilities'].sum() == pytest.approx(1.0)
+    
+    def test_shifted_sparse_support(self):
+        """Test sums of a variable whose support does not start at zero."""
+        rv = CategoricalRandomVariable.from_dict({2: 0.5, 5: 0.5})
+        result = sum_distribution(rv, 3, tail_tolerance=0.0)
+        
+        nonzero = result['probabilities'] > 0
+        np.testing.assert_array_equal(result['values'][nonzero], [6, 9, 12, 15])
+        np.testing.assert_allclose(result['probabilities'][nonzero], [1 / 8, 3 / 8, 3 / 8, 1 / 8])
+    
+    def test_wide_sparse_support(self):
+        """Test that wide supports use their gcd lattice or are refused up front."""
+        rv = CategoricalRandomVariable.from_dict({7: 0.5, 7 + 10**9: 0.5})
+        result = sum_distribution(rv, 3, tail_tolerance=0.0)
+        
+        np.testing.assert_array_equal(result['values'], 21 + 10**9 * np.arange(4))
+        np.testing.assert_allclose(result['probabilities'], [1 / 8, 3 / 8, 3 / 8, 1 / 8])
+        
+        unreduced = CategoricalRandomVariable.from_dict({0: 0.5, 1: 0.25, 10**9: 0.25})
+        with pytest.raises(ValueError):
+            sum_distribution(unreduced, 2)
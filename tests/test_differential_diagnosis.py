@@ -0,0 +1,57 @@
+"""
+Tests for Multi-Condition Differential Diagnosis
+
+This module tests the batched matrix Bayes posterior over several conditions.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from differential_diagnosis import DifferentialDiagnosis
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer
+
+
+class TestDifferentialDiagnosis:
+    """Test cases for the batched differential diagnosis."""
+    
+    def test_reduces_to_problem1(self):
+        """Test that the two-condition model reproduces Problem 1."""
+        model = DifferentialDiagnosis.from_analyzer()
+        posterior = model.posterior([[1], [0], [-1]])
+        
+        expected = TuberculosisTestAnalyzer().calculate_posterior_probability()
+        assert posterior[0, 0] == pytest.approx(expected)
+        assert posterior[2, 0] == pytest.approx(0.004)
+        np.testing.assert_allclose(posterior.sum(axis=1), 1.0)
+    
+    def test_matches_explicit_bayes_for_batch(self):
+        """Test the matrix form against an explicit per-patient loop."""
+        rng = np.random.default_rng(0)
+        prior = np.array([0.01, 0.04, 0.95])
+        rates = rng.uniform(0.05, 0.95, size=(3, 5))
+        results = rng.integers(-1, 2, size=(50, 5))
+        
+        posterior = DifferentialDiagnosis(prior, rates).posterior(results)
+        
+        for n in (0, 17, 49):
+            observed = results[n] >= 0
+            like = np.prod(np.where(results[n] == 1, rates, 1 - rates)[:, observed], axis=1)
+            np.testing.assert_allclose(posterior[n], like * prior / np.sum(like * prior))
+    
+    def test_impossible_results_and_triage(self):
+        """Test rates of 0 and 1 and the chunked triage ranking."""
+        model = DifferentialDiagnosis([0.5, 0.5], [[1.0, 0.5], [0.2, 0.0]],
+                                      condition_names=['a', 'b'])
+        posterior = model.posterior([[0, -1], [1, 1], [-1, 0]])
+        
+        np.testing.assert_allclose(posterior[:2], [[0.0, 1.0], [1.0, 0.0]])
+        assert np.isfinite(posterior).all()
+        
+        triage = model.triage([[0, -1], [1, 1], [-1, 0]], chunk_size=2)
+        assert list(triage['condition']) == ['b', 'a', 'b']
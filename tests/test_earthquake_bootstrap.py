@@ -0,0 +1,75 @@
+"""
+Tests for Earthquake Rate Uncertainty
+
+This module tests the blocked, seeded bootstrap and the Gamma posterior
+intervals of RateUncertaintyAnalyzer.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy import stats
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from earthquake_bootstrap import RateUncertaintyAnalyzer
+from problem3_earthquake_prediction import EarthquakeAnalyzer
+
+
+@pytest.fixture
+def analyzer():
+    """Analyzer for the decade counts of the homework problem."""
+    return EarthquakeAnalyzer([0, 1, 2, 0, 3, 2, 1, 2, 1, 2, 1, 0])
+
+
+class TestRateUncertaintyAnalyzer:
+    """Test cases for bootstrap and posterior intervals."""
+    
+    def test_bootstrap_is_reproducible_across_workers(self, analyzer):
+        """Test that blocks give the same replicates in and out of process."""
+        engine = RateUncertaintyAnalyzer(analyzer, block_size=2500, chunk_size=1200)
+        
+        serial = engine.bootstrap(10_000, seed=7)
+        parallel = engine.bootstrap(10_000, seed=7, n_workers=2)
+        
+        np.testing.assert_array_equal(serial, parallel)
+        assert serial.mean() == pytest.approx(1.25, abs=0.01)
+        assert serial.var() == pytest.approx(1.25 / 12, rel=0.05)
+        
+        resampled = engine.bootstrap(10_000, seed=7, method='nonparametric')
+        assert np.all(np.isin(resampled * 12, np.arange(37)))
+    
+    def test_intervals(self, analyzer):
+        """Test interval shapes, ordering and the Gamma posterior."""
+        engine = RateUncertaintyAnalyzer(analyzer)
+        result = engine.intervals(thresholds=[0, 1, 2, 5], n_bootstrap=20_000, seed=1)
+        
+        assert result['exceedance'][1] == pytest.approx(
+            analyzer.predict_next_decade_probability(1))
+        for source in ('bootstrap', 'posterior'):
+            interval = result[source]['exceedance_interval']
+            assert interval.shape == (4, 2)
+            np.testing.assert_array_equal(interval[0], [1.0, 1.0])
+            assert np.all(interval[1:, 0] < result['exceedance'][1:])
+            assert np.all(result['exceedance'][1:] < interval[1:, 1])
+        
+        posterior = result['posterior']
+        assert (posterior['shape'], posterior['rate']) == (15.5, 12)
+        assert posterior['lambda_interval'][0] == pytest.approx(
+            stats.gamma.ppf(0.025, 15.5, scale=1 / 12))
+    
+    def test_predictive_matches_poisson_gamma_mixture(self, analyzer):
+        """Test the negative binomial predictive against simulation."""
+        engine = RateUncertaintyAnalyzer(analyzer, prior_shape=1.0, prior_rate=1.0)
+        result = engine.intervals(thresholds=[1, 2, 3], horizon=20.0, n_bootstrap=100)
+        
+        rng = np.random.default_rng(0)
+        lambdas = rng.gamma(16.0, 1 / 13, size=1_000_000)
+        counts = rng.poisson(2 * lambdas)
+        simulated = [np.mean(counts >= k) for k in (1, 2, 3)]
+        
+        np.testing.assert_allclose(result['posterior']['predictive_exceedance'],
+                                   simulated, atol=0.003)
@@ -0,0 +1,108 @@
+"""
+Tests for Columnar Earthquake Catalog Ingestion
+
+This module tests the catalog readers, magnitude and time selection, window
+binning and the hand-off to EarthquakeAnalyzer.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from earthquake_catalog import EarthquakeCatalog, to_decimal_year
+
+
+@pytest.fixture
+def catalog():
+    """Synthetic catalog of 100,000 events between 1900 and 2020."""
+    rng = np.random.default_rng(0)
+    n = 100_000
+    return EarthquakeCatalog(
+        time=np.sort(rng.uniform(1900, 2020, n)),
+        magnitude=rng.exponential(1 / np.log(10), n) + 2.0,
+        latitude=rng.uniform(32, 36, n),
+        longitude=rng.uniform(-121, -114, n),
+        depth=rng.uniform(0, 20, n)
+    )
+
+
+class TestEarthquakeCatalog:
+    """Test cases for the earthquake catalog."""
+    
+    def test_decimal_years(self):
+        """Test the timestamp conversion."""
+        years = to_decimal_year(['1994-01-01', '1994-07-02T12:00', '2000-12-31'])
+        np.testing.assert_allclose(years, [1994.0, 1994.5, 2000 + 365 / 366])
+    
+    def test_bin_counts_match_histogram(self, catalog):
+        """Test fixed and custom windows against np.histogram."""
+        for window, width in (('decade', 10), ('year', 1), (2.5, 2.5)):
+            edges, counts = catalog.bin_counts(window, start=1900, end=2020,
+                                               min_magnitude=4.0)
+            expected, _ = np.histogram(catalog.time[catalog.magnitude >= 4.0],
+                                       bins=np.arange(1900, 2020 + width, width))
+            np.testing.assert_array_equal(counts, expected)
+            assert len(edges) == len(counts) + 1
+        
+        edges, counts = catalog.bin_counts([1900, 1950, 2000, 2020])
+        assert counts.sum() == len(catalog)
+        
+        # Default windows cover every event
+        assert catalog.bin_counts('year')[1].sum() == len(catalog)
+    
+    def test_readers_round_trip(self, catalog, tmp_path):
+        """Test that .npy, .npz and CSV files give the same catalog."""
+        small = catalog.select(min_magnitude=4.0, start=1950)
+        assert np.all(small.magnitude >= 4.0) and np.all(small.time >= 1950)
+        
+        structured = np.zeros(len(small), dtype=[('time', 'f8'), ('magnitude', 'f4'),
+                                                 ('depth', 'f4')])
+        structured['time'] = small.time
+        structured['magnitude'] = small.magnitude
+        structured['depth'] = small.depth
+        np.save(tmp_path / 'catalog.npy', structured)
+        np.savez(tmp_path / 'catalog.npz', time=small.time, magnitude=small.magnitude)
+        
+        csv_path = tmp_path / 'catalog.csv'
+        with open(csv_path, 'w') as f:
+            f.write('mag,time,depth\n')
+            for t, m, d in zip(small.time, small.magnitude, small.depth):
+                f.write(f'{float(m)!r},{float(t)!r},{float(d)!r}\n')
+        
+        loaded = [EarthquakeCatalog.load(str(tmp_path / 'catalog.npy')),
+                  EarthquakeCatalog.load(str(tmp_path / 'catalog.npz')),
+                  EarthquakeCatalog.load(str(csv_path), chunk_size=100,
+                                         column_names={'magnitude': 'mag'})]
+        for result in loaded:
+            np.testing.assert_array_equal(result.time, small.time)
+            np.testing.assert_array_equal(result.magnitude, small.magnitude)
+        # The memory-mapped columns are views, not copies
+        assert not loaded[0].time.flags.owndata
+    
+    def test_to_analyzer(self, catalog):
+        """Test that binned counts feed the Poisson analysis."""
+        analyzer = catalog.to_analyzer('decade', start=1900, end=2020, min_magnitude=5.0)
+        
+        assert len(analyzer.earthquake_data) == 12
+        np.testing.assert_array_equal(analyzer.decades, np.arange(1900, 2020, 10))
+        stats_dict = analyzer.calculate_statistics()
+        assert stats_dict['total_earthquakes'] == np.sum(catalog.magnitude >= 5.0)
+        assert analyzer.fit_poisson_model()['lambda_estimate'] == pytest.approx(
+            np.sum(catalog.magnitude >= 5.0) / 12)
+    
+    def test_end_and_window_widths_are_honoured(self, catalog):
+        """Test that misaligned ends and unequal windows are rejected."""
+        edges, counts = catalog.bin_counts('decade', start=1900, end=1990)
+        assert edges[-1] == 1990
+        assert counts.sum() == np.sum(catalog.time < 1990)
+        
+        with pytest.raises(ValueError):
+            catalog.bin_counts('decade', start=1900, end=1995)
+        with pytest.raises(ValueError):
+            catalog.to_analyzer([1900, 1950, 1960, 2020])
+        assert len(catalog.to_analyzer([1900, 1950, 2000]).earthquake_data) == 2
@@ -0,0 +1,91 @@
+"""
+Tests for Change-Point Detection of Earthquake Rates
+
+This module tests binary segmentation, PELT and the piecewise-constant
+Poisson model built on them.
+"""
+
+import itertools
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy import stats
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+import earthquake_changepoints
+from earthquake_changepoints import PiecewisePoissonModel, binary_segmentation, pelt
+from problem3_earthquake_prediction import EarthquakeAnalyzer
+
+
+def penalized_cost(counts, change_points, penalty):
+    """Reference objective: Poisson negative log-likelihood plus penalty."""
+    cost = 0.0
+    for segment in np.split(counts, change_points):
+        rate = segment.mean()
+        cost -= np.sum(stats.poisson.logpmf(segment, rate)) if rate > 0 else 0.0
+    return cost + penalty * len(change_points)
+
+
+class TestChangePoints:
+    """Test cases for the change-point searches."""
+    
+    def test_pelt_is_exact(self):
+        """Test PELT against exhaustive search over all segmentations."""
+        rng = np.random.default_rng(0)
+        counts = rng.poisson(np.repeat([1.0, 6.0, 2.0], 4))
+        penalty = 2.0
+        
+        best = min((list(c) for r in range(len(counts))
+                    for c in itertools.combinations(range(1, len(counts)), r)),
+                   key=lambda c: penalized_cost(counts, c, penalty))
+        
+        result = pelt(counts, penalty)
+        assert penalized_cost(counts, result, penalty) == pytest.approx(
+            penalized_cost(counts, best, penalty))
+    
+    def test_recovers_rate_changes(self):
+        """Test both searches on a long monthly series with two regime shifts."""
+        rng = np.random.default_rng(1)
+        counts = rng.poisson(np.repeat([0.5, 2.0, 1.0], [4000, 3000, 5000]))
+        
+        for method in ('binseg', 'pelt'):
+            model = PiecewisePoissonModel(counts, window_years=1 / 12, method=method)
+            assert len(model.change_points) == 2
+            np.testing.assert_allclose(model.change_points, [4000, 7000], atol=50)
+            np.testing.assert_allclose(model.segment_rates, [0.5, 2.0, 1.0], rtol=0.1)
+    
+    def test_constant_rate_has_no_change_points(self):
+        """Test that a homogeneous series is left in one segment."""
+        counts = np.random.default_rng(2).poisson(1.5, size=20_000)
+        assert len(binary_segmentation(counts, np.log(len(counts)))) == 0
+    
+    def test_pelt_warns_on_long_series(self, monkeypatch):
+        """Test that PELT warns beyond its size limit but still segments exactly."""
+        counts = np.random.default_rng(3).poisson(1.5, size=2000)
+        penalty = np.log(len(counts))
+        expected = pelt(counts, penalty)
+        
+        monkeypatch.setattr(earthquake_changepoints, 'PELT_MAX_BINS', 1000)
+        with pytest.warns(UserWarning, match='binseg'):
+            result = pelt(counts, penalty)
+        assert len(result) == 0
+        np.testing.assert_array_equal(result, expected)
+    
+    def test_forecast_from_latest_regime(self):
+        """Test segment reports and the latest-regime forecast."""
+        counts = np.concatenate([np.zeros(30, dtype=int), np.full(20, 3)])
+        model = PiecewisePoissonModel(counts, periods=np.arange(1970, 2020),
+                                      window_years=1.0, method='pelt')
+        
+        segments = model.segments()
+        assert [s['start'] for s in segments] == [1970, 2000]
+        assert segments[-1]['rate_per_year'] == 3.0
+        assert model.forecast(1, 10) == pytest.approx(stats.poisson.sf(0, 30.0))
+        np.testing.assert_array_equal(model.rates(), counts)
+        
+        analyzer = EarthquakeAnalyzer([0, 1, 2, 0, 3, 2, 1, 2, 1, 2, 1, 0])
+        assert len(PiecewisePoissonModel.from_analyzer(analyzer).change_points) == 0
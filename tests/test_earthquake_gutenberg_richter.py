@@ -0,0 +1,88 @@
+"""
+Tests for Gutenberg-Richter Magnitude-Frequency Fitting
+
+This module tests the Aki-Utsu b-value estimates, completeness magnitude
+selection, regional fits and bootstrap intervals of GutenbergRichterAnalyzer.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from earthquake_gutenberg_richter import LOG10_E, GutenbergRichterAnalyzer
+
+
+def synthetic_magnitudes(n, b_value=1.0, mc=2.0, rng=0):
+    """Complete Gutenberg-Richter catalog binned at 0.1 above mc."""
+    rng = np.random.default_rng(rng)
+    continuous = rng.exponential(LOG10_E / b_value, n) + mc - 0.05
+    return np.round(continuous / 0.1) * 0.1
+
+
+class TestGutenbergRichter:
+    """Test cases for the Gutenberg-Richter analyzer."""
+    
+    def test_candidate_fits_match_direct_estimates(self):
+        """Test every candidate's b-value against the Aki-Utsu formula."""
+        magnitudes = synthetic_magnitudes(20_000)
+        analyzer = GutenbergRichterAnalyzer(magnitudes)
+        fits = analyzer.candidate_fits()
+        
+        for mc, n, b in zip(fits['mc'], fits['n_events'], fits['b_value']):
+            above = magnitudes[magnitudes >= mc - 0.05]
+            assert n == len(above)
+            assert b == pytest.approx(LOG10_E / (above.mean() - (mc - 0.05)))
+    
+    def test_recovers_b_value_and_mc(self):
+        """Test that a complete catalog gives back its b-value and Mc."""
+        analyzer = GutenbergRichterAnalyzer(synthetic_magnitudes(100_000, b_value=1.2))
+        
+        for method in ('maxc', 'gft'):
+            result = analyzer.fit(method=method)
+            assert result['b_value'] == pytest.approx(1.2, abs=4 * result['b_std_error'])
+        assert analyzer.fit(method='maxc')['mc'] == pytest.approx(2.2)
+        assert analyzer.fit(method='gft')['mc'] == pytest.approx(2.0)
+        assert analyzer.fit(mc=2.5)['n_events'] == np.sum(analyzer.magnitudes >= 2.45)
+    
+    def test_fit_regions_matches_separate_fits(self):
+        """Test that regional fits equal fitting each sub-catalog alone."""
+        rng = np.random.default_rng(1)
+        magnitudes = np.concatenate([synthetic_magnitudes(5000, b, rng=i)
+                                     for i, b in enumerate([0.8, 1.0, 1.3])])
+        labels = np.repeat(['north', 'central', 'south'], 5000)
+        shuffle = rng.permutation(len(labels))
+        magnitudes, labels = magnitudes[shuffle], labels[shuffle]
+        
+        analyzer = GutenbergRichterAnalyzer(magnitudes)
+        result = analyzer.fit_regions(labels)
+        
+        for i, region in enumerate(result['region']):
+            alone = GutenbergRichterAnalyzer(magnitudes[labels == region]).fit(
+                mc=result['mc'][i])
+            assert result['b_value'][i] == pytest.approx(alone['b_value'])
+        
+        assert list(result['region']) == ['central', 'north', 'south']
+        np.testing.assert_allclose(result['b_value'], [1.0, 0.8, 1.3], atol=0.1)
+    
+    def test_bootstrap_intervals(self):
+        """Test that bootstrap intervals cover the point estimate."""
+        analyzer = GutenbergRichterAnalyzer(synthetic_magnitudes(3000))
+        result = analyzer.bootstrap(n_bootstrap=300, chunk_size=64 * 3000, rng=2)
+        
+        assert result['b_replicates'].shape == (300,)
+        lower, upper = result['b_interval']
+        assert lower < result['fit']['b_value'] < upper
+        assert upper - lower == pytest.approx(
+            2 * 1.96 * result['fit']['b_std_error'], rel=0.5)
+        
+        fixed = analyzer.bootstrap(n_bootstrap=50, mc=2.0, rng=3)
+        assert np.all(fixed['mc_replicates'] == 2.0)
+        
+        # Budgets below one resample still fit one resample per block
+        tiny = analyzer.bootstrap(n_bootstrap=3, chunk_size=10, rng=2)
+        assert tiny['b_replicates'].shape == (3,)
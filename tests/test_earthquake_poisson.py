@@ -0,0 +1,77 @@
+"""
+Tests for the Fitted Poisson Rate Model
+
+This module tests PoissonRateModel and its fit-once caching on
+EarthquakeAnalyzer.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy import stats
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from earthquake_poisson import PoissonRateModel
+from problem3_earthquake_prediction import EarthquakeAnalyzer
+
+
+EQ_DATA = [0, 1, 2, 0, 3, 2, 1, 2, 1, 2, 1, 0]
+
+
+class TestPoissonRateModel:
+    """Test cases for the fitted Poisson model."""
+    
+    def test_exceedance_grid(self):
+        """Test a (threshold, horizon) grid against scipy.stats.poisson."""
+        model = PoissonRateModel(EQ_DATA, window_years=10)
+        thresholds = np.arange(-1, 8)[:, None]
+        horizons = np.array([1.0, 5.0, 10.0, 30.0])[None, :]
+        
+        result = model.exceedance(thresholds, horizons)
+        expected = stats.poisson.sf(thresholds - 1, 0.125 * horizons)
+        
+        assert result.shape == (9, 4)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+        assert model.exceedance(1) == pytest.approx(1 - np.exp(-1.25))
+    
+    def test_analyzer_caches_model_per_data_version(self):
+        """Test that the model is fitted once and refitted after changes."""
+        analyzer = EarthquakeAnalyzer(EQ_DATA)
+        model = analyzer.model
+        
+        analyzer.predict_next_decade_probability(threshold=2)
+        analyzer.fit_poisson_model()
+        assert analyzer.model is model
+        
+        analyzer.earthquake_data = [2] * 12
+        assert analyzer.model is not model
+        assert analyzer.fit_poisson_model()['lambda_estimate'] == 2.0
+        np.testing.assert_allclose(analyzer.predict_next_decade_probability([1, 2]),
+                                   stats.poisson.sf([0, 1], 2.0))
+    
+    def test_yearly_windows_forecast_a_decade(self):
+        """Test that decade forecasts scale the rate of shorter windows."""
+        analyzer = EarthquakeAnalyzer(np.ones(50), periods=np.arange(1970, 2020))
+        
+        assert analyzer.window_years == 1.0
+        assert analyzer.predict_next_decade_probability(10) == pytest.approx(
+            stats.poisson.sf(9, 10.0))
+    
+    def test_setting_counts_keeps_yearly_windows(self):
+        """Test that re-assigned counts keep their windows instead of decades."""
+        analyzer = EarthquakeAnalyzer(np.ones(50), periods=np.arange(1970, 2020))
+        before = analyzer.predict_next_decade_probability(5)
+        
+        analyzer.earthquake_data = analyzer.earthquake_data
+        assert analyzer.window_years == 1.0
+        np.testing.assert_array_equal(analyzer.decades, np.arange(1970, 2020))
+        assert analyzer.predict_next_decade_probability(5) == pytest.approx(before)
+        
+        with pytest.raises(ValueError):
+            analyzer.earthquake_data = np.ones(40)
+        analyzer.set_data(np.ones(40), periods=np.arange(1980, 2020))
+        assert analyzer.window_years == 1.0
@@ -0,0 +1,40 @@
+"""
+Tests for the Seeded Block Fan-Out
+
+This module tests block splitting and the reproducibility of seeded blocks.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from parallel_blocks import block_sizes, run_seeded_blocks
+
+
+def draw_uniforms(seed_sequence, size, scale):
+    """Block function drawing scaled uniforms from the block's generator."""
+    return scale * np.random.default_rng(seed_sequence).random(size)
+
+
+class TestSeededBlocks:
+    """Test cases for the seeded block helpers."""
+    
+    def test_block_sizes(self):
+        """Test full blocks plus one remainder, and no blocks for no items."""
+        assert block_sizes(25, 10) == [10, 10, 5]
+        assert block_sizes(20, 10) == [10, 10]
+        assert block_sizes(0, 10) == []
+    
+    def test_blocks_follow_spawned_seeds(self):
+        """Test that every block uses its own child of the root seed, in order."""
+        blocks = run_seeded_blocks(draw_uniforms, 25, 10, seed=3, args=(2.0,))
+        children = np.random.SeedSequence(3).spawn(3)
+        
+        assert [len(b) for b in blocks] == [10, 10, 5]
+        for block, child, size in zip(blocks, children, (10, 10, 5)):
+            np.testing.assert_array_equal(block, draw_uniforms(child, size, 2.0))
+        assert run_seeded_blocks(draw_uniforms, 0, 10, seed=3, args=(2.0,)) == []
@@ -0,0 +1,53 @@
+"""
+Tests for the Problem 1 Tuberculosis Test Analyzer
+
+This module tests the Bayesian calculations of the tuberculosis analyzer,
+including the vectorized scenario-grid mode.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from problem1_tuberculosis_test import (
+    TuberculosisTestAnalyzer,
+    analyze_scenario_grid,
+)
+
+
+class TestScenarioGrid:
+    """Test cases for the vectorized scenario-grid engine."""
+    
+    def test_matches_scalar_analysis(self):
+        """Test that the grid mode reproduces the scalar results."""
+        analyzer = TuberculosisTestAnalyzer()
+        scalar = analyzer.analyze_test_usefulness()
+        grid = analyzer.analyze_scenario_grid()
+        
+        assert grid['posterior_probability'] == pytest.approx(scalar['posterior_probability'])
+        assert grid['likelihood_ratio'] == pytest.approx(scalar['likelihood_ratio'])
+        assert grid['odds_ratio'] == pytest.approx(scalar['odds_ratio'])
+    
+    def test_broadcasts_to_full_grid(self):
+        """Test that inputs broadcast into every combination."""
+        prevalence = np.linspace(0.001, 0.5, 7)[:, None, None]
+        sensitivity = np.linspace(0.5, 0.99, 5)[None, :, None]
+        specificity = np.linspace(0.5, 0.99, 3)[None, None, :]
+        
+        grid = analyze_scenario_grid(prevalence, sensitivity, specificity)
+        
+        assert grid['ppv'].shape == (7, 5, 3)
+        
+        prev, sens, spec = 0.5, sensitivity[0, 2, 0], specificity[0, 0, 1]
+        expected_npv = spec * (1 - prev) / (spec * (1 - prev) + (1 - sens) * prev)
+        assert grid['npv'][-1, 2, 1] == pytest.approx(expected_npv)
+    
+    def test_rejects_invalid_probabilities(self):
+        """Test that out-of-range probabilities raise ValueError."""
+        with pytest.raises(ValueError):
+            analyze_scenario_grid([0.1, 1.2], 0.8, 0.9)
@@ -0,0 +1,199 @@
+"""
+Tests for the Problem 2 Categorical Random Variable
+
+This module tests the cached moment bundle, CDF and quantile lookups and the
+PMF plotting of CategoricalRandomVariable, and the batched multinomial
+log-likelihood.
+"""
+
+import os
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from scipy import stats
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from problem2_discrete_random_variables import (
+    CategoricalRandomVariable,
+    multinomial_log_likelihood,
+    pmf_envelope,
+)
+
+
+class TestMomentBundle:
+    """Test cases for the single-pass cached moments."""
+    
+    def test_moments_match_scipy(self):
+        """Test every moment against scipy.stats.rv_discrete."""
+        rng = np.random.default_rng(0)
+        probabilities = rng.dirichlet(np.ones(50))
+        rv = CategoricalRandomVariable(probabilities)
+        mean, var, skew, kurt = rv.rv.stats(moments='mvsk')
+        
+        moments = rv.moments
+        assert moments['mean'] == pytest.approx(mean)
+        assert moments['variance'] == pytest.approx(var)
+        assert moments['skewness'] == pytest.approx(skew)
+        assert moments['kurtosis'] == pytest.approx(kurt)
+        assert moments['entropy'] == pytest.approx(rv.rv.entropy())
+    
+    def test_problem_values_and_statistics(self):
+        """Test the Problem 2 answers through get_statistics."""
+        rv = CategoricalRandomVariable([0.3, 0.1, 0.2, 0.4])
+        stats_dict = rv.get_statistics()
+        
+        assert stats_dict['expectation'] == pytest.approx(1.7)
+        assert stats_dict['variance'] == pytest.approx(1.61)
+        assert stats_dict['standard_deviation'] == pytest.approx(np.sqrt(1.61))
+    
+    def test_cache_invalidated_on_new_pmf(self):
+        """Test that assigning a new PMF refreshes the cached moments."""
+        rv = CategoricalRandomVariable([0.3, 0.1, 0.2, 0.4])
+        assert rv.moments is rv.moments
+        
+        rv.probabilities = [0.5, 0.5]
+        
+        assert rv.calculate_expectation() == pytest.approx(0.5)
+        assert rv.rv.mean() == pytest.approx(0.5)
+        assert len(rv.values) == 2
+    
+    def test_invalid_pmf_rejected(self):
+        """Test that negative or unnormalized probabilities raise ValueError."""
+        for probabilities in ([0.5, 0.6], [-0.2, 1.2]):
+            with pytest.raises(ValueError):
+                CategoricalRandomVariable(probabilities)
+        
+        rv = CategoricalRandomVariable([0.3, 0.1, 0.2, 0.4])
+        with pytest.raises(ValueError):
+            rv.probabilities = [0.5, 0.6]
+        with pytest.raises(ValueError):
+            rv.set_pmf([-0.2, 1.2], values=[5, 7])
+    
+    def test_cdf_and_quantile(self):
+        """Test CDF and quantile lookups against scipy."""
+        rv = CategoricalRandomVariable([0.3, 0.1, 0.2, 0.4])
+        x = np.array([-1, 0, 1.5, 3, 7])
+        q = np.array([0.0, 0.3, 0.31, 0.6, 0.99, 1.0])
+        
+        np.testing.assert_allclose(rv.cdf(x), stats.rv_discrete(
+            values=(np.arange(4), [0.3, 0.1, 0.2, 0.4])).cdf(x))
+        np.testing.assert_array_equal(rv.quantile(q), [0, 0, 1, 2, 3, 3])
+
+
+class TestSparseSupport:
+    """Test cases for sparse and arbitrary supports."""
+    
+    @pytest.fixture
+    def sparse_rv(self):
+        """Create a variable with a few values spread over 0..10^9."""
+        rng = np.random.default_rng(0)
+        values = rng.choice(10**9, size=2000, replace=False)
+        probabilities = rng.dirichlet(np.ones(2000))
+        return CategoricalRandomVariable(probabilities, values)
+    
+    def test_support_is_sorted_and_compact(self, sparse_rv):
+        """Test that only the non-zero pairs are stored, sorted by value."""
+        assert len(sparse_rv.values) == 2000
+        assert np.all(np.diff(sparse_rv.values) > 0)
+        assert sparse_rv.cdf(10**9) == pytest.approx(1.0)
+    
+    def test_moments_and_lookups(self, sparse_rv):
+        """Test moments, PMF lookup and quantiles on the sparse support."""
+        x = sparse_rv.values.astype(float)
+        p = sparse_rv.probabilities
+        mean = p @ x
+        
+        assert sparse_rv.calculate_expectation() == pytest.approx(mean)
+        assert sparse_rv.calculate_variance() == pytest.approx(p @ (x - mean) ** 2)
+        assert sparse_rv.pmf(sparse_rv.values[5]) == p[5]
+        assert sparse_rv.pmf(-1) == 0.0
+        assert sparse_rv.quantile(sparse_rv.cdf(sparse_rv.values[10])) == sparse_rv.values[10]
+    
+    def test_sampling_and_from_dict(self, sparse_rv):
+        """Test sampling from the sparse support and dict construction."""
+        samples = sparse_rv.sample(10_000, rng=1)
+        assert np.all(np.isin(samples, sparse_rv.values))
+        
+        rv = CategoricalRandomVariable.from_dict({10**9: 0.25, 7: 0.5, 12: 0.25})
+        np.testing.assert_array_equal(rv.values, [7, 12, 10**9])
+        assert rv.calculate_expectation() == pytest.approx(0.25 * 10**9 + 3.5 + 3)
+
+
+class TestPlotPMF:
+    """Test cases for level-of-detail PMF plotting."""
+    
+    def test_envelope_keeps_bin_maxima(self):
+        """Test that every bin holds the largest probability inside it."""
+        rng = np.random.default_rng(0)
+        values = np.sort(rng.choice(10**6, size=5000, replace=False))
+        probabilities = rng.random(5000)
+        
+        edges, heights = pmf_envelope(values, probabilities, 300)
+        bins = np.minimum(np.digitize(values, edges) - 1, 299)
+        expected = np.zeros(300)
+        for b, p in zip(bins, probabilities):
+            expected[b] = max(expected[b], p)
+        
+        assert len(edges) == 301
+        np.testing.assert_array_equal(heights, expected)
+    
+    def test_small_support_labels_every_bar(self):
+        """Test that small supports keep one labelled bar per value."""
+        rv = CategoricalRandomVariable([0.3, 0.1, 0.2, 0.4])
+        fig = rv.plot_pmf(show=False)
+        ax = fig.axes[0]
+        
+        assert len(ax.patches) == 4
+        assert [text.get_text() for text in ax.texts] == ['0.30', '0.10', '0.20', '0.40']
+    
+    def test_large_support_is_non_blocking_and_bounded(self):
+        """Test that large supports use one artist and top-k labels only."""
+        probabilities = np.random.default_rng(1).random(100_000)
+        rv = CategoricalRandomVariable(probabilities / probabilities.sum())
+        n_open = len(plt.get_fignums())
+        
+        fig = rv.plot_pmf(show=False, top_k=5)
+        ax = fig.axes[0]
+        
+        assert len(plt.get_fignums()) == n_open
+        assert len(ax.patches) == 1
+        assert len(ax.texts) == 5
+        assert max(text.xy[1] for text in ax.texts) == rv.probabilities.max()
+        
+        for top_k in (0, -3):
+            assert len(rv.plot_pmf(show=False, top_k=top_k).axes[0].texts) == 0
+
+
+class TestMultinomialLogLikelihood:
+    """Test cases for the batched multinomial log-likelihood."""
+    
+    def test_matches_scipy_multinomial(self):
+        """Test every (counts, model) pair against scipy.stats.multinomial."""
+        rng = np.random.default_rng(0)
+        counts = rng.integers(0, 20, size=(7, 5))
+        probabilities = rng.dirichlet(np.ones(5), size=4)
+        
+        result = multinomial_log_likelihood(counts, probabilities, chunk_size=3)
+        
+        assert result.shape == (7, 4)
+        for i, c in enumerate(counts):
+            for j, p in enumerate(probabilities):
+                expected = stats.multinomial.logpmf(c, c.sum(), p)
+                assert result[i, j] == pytest.approx(expected)
+    
+    def test_zero_probabilities(self):
+        """Test that zero-probability categories matter only when observed."""
+        counts = [[3, 0, 2], [3, 1, 2]]
+        probabilities = [0.5, 0.0, 0.5]
+        
+        result = multinomial_log_likelihood(counts, probabilities)
+        
+        assert result[0, 0] == pytest.approx(
+            stats.binom.logpmf(3, 5, 0.5))
+        assert result[1, 0] == -np.inf
@@ -0,0 +1,66 @@
+"""
+Tests for Pooled Tuberculosis Group Testing
+
+This module tests the Dorfman and hierarchical pooling formulas against
+closed forms and simulation.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer
+from tuberculosis_group_testing import GroupTestingPlanner
+
+
+class TestGroupTestingPlanner:
+    """Test cases for the group-testing planner."""
+    
+    def test_perfect_test_matches_classic_dorfman(self):
+        """Test the textbook 1/k + 1 - (1-p)^k formula for a perfect test."""
+        planner = GroupTestingPlanner(TuberculosisTestAnalyzer(0.01, 1.0, 1.0))
+        k = np.arange(2, 30)
+        
+        result = planner.dorfman(k)
+        
+        np.testing.assert_allclose(result['expected_tests_per_person'],
+                                   1 / k + 1 - 0.99 ** k)
+        assert planner.optimal_pool_size()['pool_size'] == 11
+    
+    def test_imperfect_dorfman_classification(self):
+        """Test pooled sensitivity and specificity against direct reasoning."""
+        planner = GroupTestingPlanner()
+        result = planner.dorfman(10)
+        
+        p_pool_positive_healthy = 0.8 * (1 - 0.996 ** 9) + 0.1 * 0.996 ** 9
+        assert result['sensitivity'] == pytest.approx(0.64)
+        assert result['specificity'] == pytest.approx(1 - 0.1 * p_pool_positive_healthy)
+    
+    def test_vectorized_grid_and_single_pool(self):
+        """Test grids over prevalence and pool size including individual testing."""
+        planner = GroupTestingPlanner()
+        prevalence = np.array([0.001, 0.004, 0.05])
+        grid = planner.dorfman(np.arange(1, 21)[:, None], prevalence[None, :])
+        
+        assert grid['expected_tests_per_person'].shape == (20, 3)
+        np.testing.assert_allclose(grid['expected_tests_per_person'][0], 1.0)
+        assert planner.optimal_pool_size(prevalence)['pool_size'].shape == (3,)
+    
+    def test_hierarchical_scheme_and_simulation_check(self):
+        """Test a three-stage scheme and the Dorfman simulation check."""
+        planner = GroupTestingPlanner(TuberculosisTestAnalyzer(0.02, 0.9, 0.95))
+        
+        hierarchical = planner.hierarchical((16, 4, 1))
+        assert 1 / 16 < hierarchical['expected_tests_per_person'] < 1
+        assert hierarchical['sensitivity'] == pytest.approx(0.9 ** 3)
+        
+        analytic = planner.dorfman(8)
+        simulated = planner.simulate_dorfman(8, 800_000, seed=5)
+        assert simulated['expected_tests_per_person'] == pytest.approx(
+            analytic['expected_tests_per_person'], rel=0.02)
+        assert simulated['specificity'] == pytest.approx(analytic['specificity'], abs=2e-3)
@@ -0,0 +1,89 @@
+"""
+Tests for Streaming Lab-Result Ingestion
+
+This module tests the chunked readers and the conjugate Beta updates of
+sensitivity, specificity and prevalence.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer
+from tuberculosis_lab_stream import LabResultStream, iter_csv_chunks, iter_npy_chunks
+
+
+@pytest.fixture
+def lab_outcomes():
+    """Simulate confirmed lab outcomes for a 0.8/0.9 test at 20% prevalence."""
+    rng = np.random.default_rng(0)
+    truth = rng.random(20_000) < 0.2
+    result = np.where(truth, rng.random(20_000) < 0.8, rng.random(20_000) >= 0.9)
+    return np.column_stack((result, truth)).astype(np.int8)
+
+
+class TestLabResultStream:
+    """Test cases for the streaming Beta-posterior ingestion."""
+    
+    def test_counts_and_live_analyzer(self, lab_outcomes):
+        """Test that counts feed posterior means into the live analyzer."""
+        analyzer = TuberculosisTestAnalyzer()
+        stream = LabResultStream(analyzer=analyzer, update_prevalence=True)
+        stream.update(lab_outcomes)
+        
+        result, truth = lab_outcomes[:, 0] == 1, lab_outcomes[:, 1] == 1
+        tp = np.sum(result & truth)
+        assert stream.true_positive == tp
+        assert analyzer.p_positive_given_disease == pytest.approx((tp + 1) / (truth.sum() + 2))
+        assert analyzer.p_positive_given_no_disease == pytest.approx(
+            1 - analyzer.p_negative_given_no_disease)
+        assert analyzer.p_disease == pytest.approx(0.2, abs=0.01)
+    
+    def test_snapshots_are_evenly_spaced(self, lab_outcomes):
+        """Test that snapshots land every snapshot_every records."""
+        stream = LabResultStream(update_prevalence=False)
+        chunks = (lab_outcomes[i:i + 3000] for i in range(0, len(lab_outcomes), 3000))
+        snapshots = list(stream.consume(chunks, snapshot_every=5000))
+        
+        assert [s['n_records'] for s in snapshots] == [5000, 10000, 15000, 20000]
+        final = snapshots[-1]
+        lower, upper = final['sensitivity']['credible_interval']
+        assert lower < 0.8 < upper
+        assert stream.analyzer.p_disease == 0.004
+    
+    def test_empty_chunks_and_invalid_snapshot_spacing(self):
+        """Test that empty chunks leave the analyzer alone and spacing is validated."""
+        stream = LabResultStream(update_prevalence=True)
+        stream.update(np.empty((0, 2), dtype=np.int8))
+        
+        assert stream.n_records == 0
+        assert stream.analyzer.p_disease == 0.004
+        assert stream.analyzer.p_positive_given_disease == 0.8
+        assert LabResultStream().update_prevalence is False
+        with pytest.raises(ValueError):
+            next(stream.consume(iter([np.ones((3, 2), dtype=np.int8)]), snapshot_every=0))
+    
+    def test_csv_and_npy_readers_agree(self, lab_outcomes, tmp_path):
+        """Test that both file readers produce the same counts."""
+        csv_path = tmp_path / "labs.csv"
+        npy_path = tmp_path / "labs.npy"
+        with open(csv_path, 'w') as f:
+            f.write("patient_id,test_result,gold_standard\n")
+            for i, (result, truth) in enumerate(lab_outcomes):
+                f.write(f"{i},{result},{truth}\n")
+        np.save(npy_path, lab_outcomes)
+        
+        from_csv = LabResultStream()
+        for chunk in iter_csv_chunks(str(csv_path), chunk_size=4096):
+            from_csv.update(chunk)
+        from_npy = LabResultStream()
+        for chunk in iter_npy_chunks(str(npy_path), chunk_size=4096):
+            from_npy.update(chunk)
+        
+        assert from_csv.snapshot()['counts'] == from_npy.snapshot()['counts']
+        assert from_csv.n_records == len(lab_outcomes)
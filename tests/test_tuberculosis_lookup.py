@@ -0,0 +1,97 @@
+"""
+Tests for the Tuberculosis Posterior Lookup Surface
+
+This module tests the precomputed log-odds PPV/NPV surface, its interpolation accuracy
+and its disk cache.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from problem1_tuberculosis_test import analyze_scenario_grid
+from tuberculosis_lookup import PosteriorLookupSurface
+
+
+class TestPosteriorLookupSurface:
+    """Test cases for the interpolated lookup surface."""
+    
+    def test_exact_on_grid_nodes(self, tmp_path):
+        """Test that queries at grid nodes return the tabulated values."""
+        surface = PosteriorLookupSurface(cache_dir=str(tmp_path))
+        prevalence = surface.grids[0][40]
+        sensitivity = surface.grids[1][10]
+        specificity = surface.grids[2][30]
+        result = surface.query(prevalence, sensitivity, specificity)
+        expected = analyze_scenario_grid(prevalence, sensitivity, specificity)
+        
+        assert result['ppv'] == pytest.approx(expected['ppv'], rel=1e-9)
+        assert result['npv'] == pytest.approx(expected['npv'], rel=1e-9)
+    
+    def test_interpolation_accuracy_off_grid(self, tmp_path):
+        """Test vectorized interpolation against exact Bayes between nodes."""
+        surface = PosteriorLookupSurface(cache_dir=str(tmp_path))
+        rng = np.random.default_rng(0)
+        prevalence = rng.uniform(0.001, 0.3, 500)
+        sensitivity = rng.uniform(0.6, 0.99, 500)
+        specificity = rng.uniform(0.6, 0.99, 500)
+        
+        result = surface.query(prevalence, sensitivity, specificity)
+        expected = analyze_scenario_grid(prevalence, sensitivity, specificity)
+        
+        np.testing.assert_allclose(result['ppv'], expected['ppv'], atol=5e-3)
+        np.testing.assert_allclose(result['npv'], expected['npv'], atol=5e-3)
+    
+    def test_accuracy_at_high_specificity(self, tmp_path):
+        """Test that PPV stays accurate where it rises steeply near specificity 1."""
+        surface = PosteriorLookupSurface(cache_dir=str(tmp_path))
+        prevalence = np.array([0.004, 0.004, 0.01, 0.001])
+        sensitivity = np.array([0.8, 0.95, 0.7, 0.99])
+        specificity = np.array([0.998, 0.999, 0.9999, 0.995])
+        
+        result = surface.query(prevalence, sensitivity, specificity)
+        expected = analyze_scenario_grid(prevalence, sensitivity, specificity)
+        
+        np.testing.assert_allclose(result['ppv'], expected['ppv'], rtol=1e-3)
+        np.testing.assert_allclose(result['npv'], expected['npv'], rtol=1e-3)
+        assert result['ppv'][0] == pytest.approx(0.616, abs=1e-3)
+        assert result['ppv'][1] == pytest.approx(0.792, abs=1e-3)
+    
+    def test_exact_outside_grid(self, tmp_path):
+        """Test that points outside the grid are computed exactly, not clamped."""
+        grids = (np.geomspace(1e-3, 0.5, 9), np.linspace(0.5, 0.99, 5),
+                 np.linspace(0.5, 0.99, 5))
+        surface = PosteriorLookupSurface(*grids, cache_dir=None)
+        prevalence = np.array([5e-5, 0.01, 0.01, 0.01])
+        sensitivity = np.array([0.8, 0.3, 0.8, 1.0])
+        specificity = np.array([0.9, 0.9, 1.0, 0.995])
+        
+        result = surface.query(prevalence, sensitivity, specificity)
+        expected = analyze_scenario_grid(prevalence, sensitivity, specificity)
+        
+        np.testing.assert_allclose(result['ppv'], expected['ppv'], rtol=1e-12)
+        np.testing.assert_allclose(result['npv'], expected['npv'], rtol=1e-12)
+        assert result['ppv'][0] == pytest.approx(4e-4, rel=1e-3)
+    
+    def test_rejects_grids_touching_zero_or_one(self):
+        """Test that grids must lie strictly inside (0, 1) for their log-odds."""
+        with pytest.raises(ValueError):
+            PosteriorLookupSurface(specificity_grid=np.linspace(0.5, 1.0, 5), cache_dir=None)
+    
+    def test_lazy_build_and_disk_cache(self, tmp_path):
+        """Test that the table is built on first query and reloaded from .npy."""
+        grids = (np.geomspace(1e-3, 0.5, 9), np.linspace(0.5, 0.99, 5),
+                 np.linspace(0.5, 0.99, 5))
+        surface = PosteriorLookupSurface(*grids, cache_dir=str(tmp_path))
+        
+        assert not os.path.exists(surface.cache_path)
+        surface.query(0.01, 0.8, 0.9)
+        assert os.path.exists(surface.cache_path)
+        
+        reloaded = PosteriorLookupSurface(*grids, cache_dir=str(tmp_path))
+        np.testing.assert_array_equal(reloaded.table, surface.table)
@@ -0,0 +1,79 @@
+"""
+Tests for ROC Analysis of Continuous Diagnostic Scores
+
+This module tests the cumulative-sum ROC engine against brute-force
+per-threshold calculations.
+"""
+
+import os
+import sys
+import warnings
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from tuberculosis_roc import ROCAnalyzer, roc_curve
+
+
+@pytest.fixture
+def scored_samples():
+    """Create tied, rounded scores for a diseased and a healthy group."""
+    rng = np.random.default_rng(1)
+    labels = np.repeat([True, False], [300, 700])
+    scores = np.round(np.where(labels, rng.normal(1.5, 1, 1000), rng.normal(0, 1, 1000)), 1)
+    return scores, labels
+
+
+class TestROCAnalyzer:
+    """Test cases for the threshold-sweep ROC engine."""
+    
+    def test_curve_matches_brute_force(self, scored_samples):
+        """Test cumulative-sum rates against explicit thresholding."""
+        scores, labels = scored_samples
+        curve = roc_curve(scores, labels)
+        
+        assert len(curve['thresholds']) == len(np.unique(scores))
+        for i in (0, 10, len(curve['thresholds']) - 1):
+            predicted = scores >= curve['thresholds'][i]
+            assert curve['tpr'][i] == pytest.approx(np.mean(predicted[labels]))
+            assert curve['fpr'][i] == pytest.approx(np.mean(predicted[~labels]))
+    
+    def test_auc_equals_rank_statistic(self, scored_samples):
+        """Test that AUC equals the Mann-Whitney probability with ties as 1/2."""
+        scores, labels = scored_samples
+        diseased, healthy = scores[labels], scores[~labels]
+        expected = (np.mean(diseased[:, None] > healthy[None, :]) +
+                    0.5 * np.mean(diseased[:, None] == healthy[None, :]))
+        
+        assert ROCAnalyzer(scores, labels).calculate_auc() == pytest.approx(expected)
+    
+    def test_optimal_threshold_feeds_problem1_analysis(self, scored_samples):
+        """Test that the chosen operating point drives analyze_test_usefulness."""
+        scores, labels = scored_samples
+        roc = ROCAnalyzer(scores, labels, prevalence=0.004)
+        best = roc.find_optimal_threshold('youden')
+        
+        results = roc.analyze_threshold(best['threshold'])
+        posterior = roc.calculate_posterior()['posterior_probability'][best['index']]
+        
+        assert results['test_accuracy']['sensitivity'] == pytest.approx(best['sensitivity'])
+        assert results['posterior_probability'] == pytest.approx(posterior)
+        assert results['prior_probability'] == 0.004
+    
+    def test_perfect_specificity_threshold(self):
+        """Test that a threshold above every healthy score gives posterior 1."""
+        scores = np.array([0.9, 0.8, 0.4, 0.3, 0.2])
+        labels = np.array([1, 1, 0, 1, 0])
+        roc = ROCAnalyzer(scores, labels, prevalence=0.004)
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            results = roc.analyze_threshold(0.8)
+        
+        assert results['test_accuracy']['specificity'] == 1.0
+        assert results['posterior_probability'] == 1.0
+        assert results['likelihood_ratio'] == np.inf
+        assert roc.analyze_threshold(0.3)['posterior_probability'] < 1.0
@@ -0,0 +1,54 @@
+"""
+Tests for the Tuberculosis Screening Simulator
+
+This module tests the on-line confusion matrix and the seeded Monte Carlo
+simulation of population screening.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from tuberculosis_screening_sim import ConfusionMatrix, ScreeningSimulator
+
+
+class TestConfusionMatrix:
+    """Test cases for the on-line confusion matrix."""
+    
+    def test_update_counts_each_cell(self):
+        """Test that updates land in the correct cells."""
+        counts = ConfusionMatrix()
+        counts.update(np.array([True, True, False, False, False]),
+                      np.array([True, False, True, False, False]))
+        
+        stats = counts.get_statistics()['counts']
+        assert stats == {'true_positive': 1, 'false_positive': 1,
+                         'false_negative': 1, 'true_negative': 2}
+
+
+class TestScreeningSimulator:
+    """Test cases for the Monte Carlo screening simulator."""
+    
+    def test_reproducible_across_worker_counts(self):
+        """Test that the result depends on the seed, not on the workers."""
+        simulator = ScreeningSimulator(block_size=50_000, chunk_size=20_000)
+        
+        serial = simulator.run(200_000, seed=42, n_workers=1)
+        parallel = simulator.run(200_000, seed=42, n_workers=2)
+        
+        assert serial.get_statistics()['counts'] == parallel.get_statistics()['counts']
+        assert serial.total == 200_000
+    
+    def test_agrees_with_analytic_posterior(self):
+        """Test that the empirical PPV and NPV match Bayes' theorem."""
+        simulator = ScreeningSimulator(block_size=1_000_000)
+        comparison = simulator.compare_with_analytic(2_000_000, seed=7)
+        
+        assert comparison['analytic_ppv'] == pytest.approx(0.0311, abs=1e-4)
+        assert abs(comparison['ppv_z_score']) < 5
+        assert abs(comparison['npv_z_score']) < 5
@@ -0,0 +1,90 @@
+"""
+Tests for Sequential Tuberculosis Testing
+
+This module tests the log-odds chaining of multiple test results.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer
+from tuberculosis_sequential import SequentialTestUpdater, iter_history_chunks
+
+
+class TestSequentialTestUpdater:
+    """Test cases for the sequential log-odds updater."""
+    
+    def test_single_positive_matches_bayes(self):
+        """Test that one positive result reproduces Problem 1."""
+        updater = SequentialTestUpdater([0.80], [0.90])
+        posterior = updater.update([[1]])
+        
+        expected = TuberculosisTestAnalyzer().calculate_posterior_probability()
+        assert posterior[0] == pytest.approx(expected)
+    
+    def test_chained_updates_match_direct_bayes(self):
+        """Test that chained updates equal the direct product of likelihoods."""
+        sens = np.array([0.95, 0.80, 0.70])
+        spec = np.array([0.99, 0.90, 0.60])
+        prior = 0.004
+        updater = SequentialTestUpdater(sens, spec, prior=prior)
+        
+        posterior = updater.update([[1, 0, -1]])[0]
+        
+        like_disease = sens[0] * (1 - sens[1])
+        like_healthy = (1 - spec[0]) * spec[1]
+        expected = (like_disease * prior /
+                    (like_disease * prior + like_healthy * (1 - prior)))
+        assert posterior == pytest.approx(expected)
+    
+    def test_stable_at_tiny_prevalence(self):
+        """Test that tiny priors do not underflow to zero or NaN."""
+        updater = SequentialTestUpdater([0.9] * 4, [0.95] * 4, prior=1e-12)
+        log_odds = updater.update_log_odds(np.zeros((1, 4), dtype=np.int8))
+        
+        assert np.isfinite(log_odds).all()
+        assert log_odds[0] < np.log(1e-12)
+    
+    def test_perfect_accuracy_does_not_give_nan(self):
+        """Test that accuracies of exactly 1 settle or skip records instead of NaN."""
+        updater = SequentialTestUpdater([0.8, 0.9], [0.9, 1.0], prior=0.004)
+        posterior = updater.update([[1, -1], [0, -1], [0, 1], [1, 0]])
+        
+        expected = SequentialTestUpdater([0.8], [0.9], prior=0.004).update([[1], [0]])
+        np.testing.assert_allclose(posterior[:2], expected)
+        assert posterior[2] == 1.0
+        assert not np.isnan(posterior).any()
+        
+        # A perfectly sensitive test's negative contradicts a perfectly specific positive
+        contradictory = SequentialTestUpdater([1.0, 0.9], [0.9, 1.0], prior=0.004)
+        log_odds = contradictory.update_log_odds([[0, 1], [0, 0]])
+        assert np.isnan(log_odds[0])
+        assert log_odds[1] == -np.inf
+        
+        # A contradictory record is counted but left out of the running mean
+        contradictory.update([[0, 1], [1, -1]])
+        statistics = contradictory.get_statistics()
+        assert statistics['n_records'] == 2
+        assert statistics['n_contradictory'] == 1
+        assert statistics['mean_posterior'] == pytest.approx(
+            SequentialTestUpdater([1.0], [0.9], prior=0.004).update([[1]])[0])
+    
+    def test_stream_records_matches_chunked_arrays(self):
+        """Test that record streaming matches array updates and counts records."""
+        rng = np.random.default_rng(0)
+        histories = rng.integers(-1, 2, size=(1050, 3)).astype(np.int8)
+        records = ([None if r == -1 else int(r) for r in row] for row in histories)
+        
+        updater = SequentialTestUpdater([0.9, 0.8, 0.7], [0.9, 0.95, 0.6])
+        streamed = np.concatenate(list(updater.stream_records(records, chunk_size=100)))
+        direct = SequentialTestUpdater([0.9, 0.8, 0.7], [0.9, 0.95, 0.6]).update(histories)
+        
+        np.testing.assert_allclose(streamed, direct)
+        assert updater.get_statistics()['n_records'] == 1050
+        assert [len(c) for c in iter_history_chunks(iter([[1], [0]]), 1, 1)] == [1, 1]
@@ -0,0 +1,86 @@
+"""
+Tests for Stratified Tuberculosis Screening Analysis
+
+This module tests stratum grouping, prevalence assignment and per-patient
+posterior lookups.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from problem1_tuberculosis_test import TuberculosisTestAnalyzer
+from tuberculosis_strata import StratifiedAnalyzer
+
+
+@pytest.fixture
+def patient_table():
+    """Create a small columnar patient table."""
+    return {
+        'region': np.array(['north', 'south', 'north', 'south', 'north', 'east']),
+        'risk': np.array([0, 1, 0, 1, 1, 0]),
+        'disease': np.array([1, 0, 0, 1, 0, 0]),
+        'test_result': np.array([1, 0, 1, 1, 0, 0])
+    }
+
+
+class TestStratifiedAnalyzer:
+    """Test cases for the stratified analyzer."""
+    
+    def test_groups_rows_into_strata(self, patient_table):
+        """Test that identical key combinations share a group id."""
+        analyzer = StratifiedAnalyzer(patient_table, ['region', 'risk'])
+        
+        assert analyzer.n_strata == 4
+        assert analyzer.group_ids[0] == analyzer.group_ids[2]
+        assert analyzer.group_ids[1] == analyzer.group_ids[3]
+        assert analyzer.stratum_sizes.sum() == 6
+        
+        strata = analyzer.strata
+        gid = analyzer.group_ids[4]
+        assert (strata['region'][gid], strata['risk'][gid]) == ('north', 1)
+    
+    def test_scores_match_per_stratum_bayes(self, patient_table):
+        """Test that gathered posteriors match a scalar analyzer per stratum."""
+        analyzer = StratifiedAnalyzer(patient_table, ['region', 'risk'])
+        analyzer.set_prevalence({
+            'region': np.array(['north', 'south', 'west']),
+            'risk': np.array([0, 1, 0]),
+            'p_disease': np.array([0.01, 0.2, 0.5])
+        })
+        posterior = analyzer.score('test_result')
+        
+        north = TuberculosisTestAnalyzer(p_disease=0.01)
+        assert posterior[0] == pytest.approx(north.calculate_posterior_probability())
+        
+        south_npv = analyzer.get_stratum_tables()['npv'][analyzer.group_ids[1]]
+        assert posterior[1] == pytest.approx(1 - south_npv)
+        # East was absent from the prevalence table and keeps the default
+        assert analyzer.prevalence[analyzer.group_ids[5]] == 0.004
+    
+    def test_untested_patients_keep_stratum_prior(self, patient_table):
+        """Test that NOT_PERFORMED entries score as the prior, not a negative."""
+        analyzer = StratifiedAnalyzer(patient_table, ['region', 'risk'])
+        analyzer.set_prevalence({
+            'region': np.array(['north']), 'risk': np.array([0]), 'p_disease': np.array([0.05])
+        })
+        posterior = analyzer.score(np.array([-1, 0, 1, -1, 0, 0]))
+        
+        assert posterior[0] == 0.05
+        assert posterior[3] == analyzer.prevalence[analyzer.group_ids[3]]
+        assert posterior[1] < analyzer.prevalence[analyzer.group_ids[1]]
+        with pytest.raises(ValueError):
+            analyzer.score(np.array([1, 0, 2, 1, 0, 0]))
+    
+    def test_estimate_prevalence_with_bincount(self, patient_table):
+        """Test Beta posterior-mean prevalence estimates per stratum."""
+        analyzer = StratifiedAnalyzer(patient_table, ['region', 'risk'])
+        prevalence = analyzer.estimate_prevalence('disease')
+        
+        assert prevalence[analyzer.group_ids[0]] == pytest.approx((1 + 1) / (2 + 2))
+        assert prevalence[analyzer.group_ids[5]] == pytest.approx(1 / 3)
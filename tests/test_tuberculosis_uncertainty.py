@@ -0,0 +1,53 @@
+"""
+Tests for Tuberculosis Test Accuracy Uncertainty Propagation
+
+This module tests the quasi-Monte Carlo propagation of Beta-distributed
+sensitivity and specificity.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/homework1 to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'homework1'))
+
+from tuberculosis_uncertainty import AccuracyUncertaintyAnalyzer
+
+
+class TestAccuracyUncertaintyAnalyzer:
+    """Test cases for the Sobol uncertainty propagation."""
+    
+    def test_large_studies_recover_point_estimate(self):
+        """Test that huge validation studies collapse onto Problem 1."""
+        analyzer = AccuracyUncertaintyAnalyzer(800_000, 200_000, 900_000, 100_000)
+        result = analyzer.propagate(n_samples=1024, seed=0)
+        
+        lower, upper = result['posterior_probability']['credible_interval']
+        assert lower < 0.0311 < upper
+        assert result['posterior_probability']['mean'] == pytest.approx(0.0311, abs=1e-3)
+    
+    def test_mean_matches_monte_carlo(self):
+        """Test the QMC mean against a large plain Monte Carlo estimate."""
+        analyzer = AccuracyUncertaintyAnalyzer(40, 10, 90, 10)
+        result = analyzer.propagate(n_samples=4096, seed=1)
+        
+        rng = np.random.default_rng(2)
+        sens = rng.beta(41, 11, 1_000_000)
+        spec = rng.beta(91, 11, 1_000_000)
+        posterior = sens * 0.004 / (sens * 0.004 + (1 - spec) * 0.996)
+        
+        assert result['posterior_probability']['mean'] == pytest.approx(np.mean(posterior), rel=5e-3)
+    
+    def test_tolerance_drives_sample_size(self):
+        """Test that a tolerance is met by doubling the sample size."""
+        analyzer = AccuracyUncertaintyAnalyzer(40, 10, 90, 10, prevalence_counts=(4, 996))
+        result = analyzer.propagate(n_samples=256, tolerance=2e-4, seed=3)
+        
+        errors = result['posterior_probability']['convergence_error']['credible_interval']
+        assert result['converged']
+        assert max(errors) <= 2e-4
+        assert result['n_samples'] > 256
+        assert len(result['odds_ratio']['samples']) == 8 * result['n_samples']